@@ -85,7 +85,7 @@ def list_all_services(detailed: bool = False) -> dict[str, Any]:
                 "error": str(e),
                 "service_count": 0,
                 "protocols": [],
-                "services": [],
+                "services": {} if detailed else [],
             }
 
     return catalog
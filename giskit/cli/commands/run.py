@@ -2,12 +2,14 @@
 
 import asyncio
 import re
+from contextlib import AsyncExitStack
 from pathlib import Path
 
 import click
 from rich.console import Console
 
 from giskit.core.recipe import Recipe
+from giskit.providers.base import Provider, get_provider
 
 console = Console()
 
@@ -51,75 +53,80 @@ async def _execute_recipe(recipe: Recipe, console: Console, verbose: bool):
 
     # Download each dataset - store as separate layers
     layers = {}
-
-    for i, dataset in enumerate(recipe.datasets, 1):
-        console.print(f"\n[bold]Dataset {i}/{len(recipe.datasets)}:[/bold] {dataset.provider}")
-
-        if dataset.service:
-            console.print(f"  Service: {dataset.service}")
-        if dataset.layers:
-            console.print(f"  Layers: {', '.join(dataset.layers)}")
-
-        try:
-            # Get provider
-            from giskit.providers.base import get_provider
-
-            provider = get_provider(dataset.provider)
-
-            # Convert bbox to Location for compatibility
-            from giskit.core.recipe import Location, LocationType
-
-            bbox_location = Location(
-                type=LocationType.BBOX, value=list(bbox), crs="EPSG:4326", radius=None
-            )
-
-            # Download dataset
-            with console.status(f"[bold green]Downloading from {dataset.provider}..."):
-                gdf = await provider.download_dataset(
-                    dataset=dataset,
-                    location=bbox_location,
-                    output_path=recipe.output.path,
-                    output_crs=recipe.output.crs,
+    # Providers are reused across datasets so their HTTP connections are too;
+    # the exit stack closes them once all datasets are downloaded (or on error)
+    providers: dict[str, Provider] = {}
+
+    async with AsyncExitStack() as stack:
+        for i, dataset in enumerate(recipe.datasets, 1):
+            console.print(f"\n[bold]Dataset {i}/{len(recipe.datasets)}:[/bold] {dataset.provider}")
+
+            if dataset.service:
+                console.print(f"  Service: {dataset.service}")
+            if dataset.layers:
+                console.print(f"  Layers: {', '.join(dataset.layers)}")
+
+            try:
+                # Get provider
+                provider = providers.get(dataset.provider)
+                if provider is None:
+                    provider = await stack.enter_async_context(get_provider(dataset.provider))
+                    providers[dataset.provider] = provider
+
+                # Convert bbox to Location for compatibility
+                from giskit.core.recipe import Location, LocationType
+
+                bbox_location = Location(
+                    type=LocationType.BBOX, value=list(bbox), crs="EPSG:4326", radius=None
                 )
 
-            if not gdf.empty:
-                console.print(f"  [green]✓[/green] Downloaded {len(gdf)} features")
-
-                # Store with layer name: service_layer or just service
-                service = dataset.service or dataset.provider
-
-                # Check if gdf has collection/layer information (from multi-layer downloads)
-                if "_collection" in gdf.columns:
-                    # Split by collection/layer
-                    for collection_name in gdf["_collection"].unique():
-                        layer_gdf = gdf[gdf["_collection"] == collection_name].copy()
-                        # Normalize collection name to snake_case
-                        normalized_name = _normalize_layer_name(collection_name)
-                        full_layer_name = f"{service}_{normalized_name}"
-                        layers[full_layer_name] = layer_gdf
-                elif "_layer" in gdf.columns:
-                    # Alternative layer column name
-                    for layer_name in gdf["_layer"].unique():
-                        layer_gdf = gdf[gdf["_layer"] == layer_name].copy()
-                        # Normalize layer name to snake_case
-                        normalized_name = _normalize_layer_name(layer_name)
-                        full_layer_name = f"{service}_{normalized_name}"
-                        layers[full_layer_name] = layer_gdf
-                else:
-                    # Single layer - use service name or first layer from request
-                    if dataset.layers and len(dataset.layers) == 1:
-                        layer_name = f"{service}_{dataset.layers[0]}"
+                # Download dataset
+                with console.status(f"[bold green]Downloading from {dataset.provider}..."):
+                    gdf = await provider.download_dataset(
+                        dataset=dataset,
+                        location=bbox_location,
+                        output_path=recipe.output.path,
+                        output_crs=recipe.output.crs,
+                    )
+
+                if not gdf.empty:
+                    console.print(f"  [green]✓[/green] Downloaded {len(gdf)} features")
+
+                    # Store with layer name: service_layer or just service
+                    service = dataset.service or dataset.provider
+
+                    # Check if gdf has collection/layer information (from multi-layer downloads)
+                    if "_collection" in gdf.columns:
+                        # Split by collection/layer
+                        for collection_name in gdf["_collection"].unique():
+                            layer_gdf = gdf[gdf["_collection"] == collection_name].copy()
+                            # Normalize collection name to snake_case
+                            normalized_name = _normalize_layer_name(collection_name)
+                            full_layer_name = f"{service}_{normalized_name}"
+                            layers[full_layer_name] = layer_gdf
+                    elif "_layer" in gdf.columns:
+                        # Alternative layer column name
+                        for layer_name in gdf["_layer"].unique():
+                            layer_gdf = gdf[gdf["_layer"] == layer_name].copy()
+                            # Normalize layer name to snake_case
+                            normalized_name = _normalize_layer_name(layer_name)
+                            full_layer_name = f"{service}_{normalized_name}"
+                            layers[full_layer_name] = layer_gdf
                     else:
-                        layer_name = service
-                    layers[layer_name] = gdf
-            else:
-                console.print("  [yellow]No features found[/yellow]")
+                        # Single layer - use service name or first layer from request
+                        if dataset.layers and len(dataset.layers) == 1:
+                            layer_name = f"{service}_{dataset.layers[0]}"
+                        else:
+                            layer_name = service
+                        layers[layer_name] = gdf
+                else:
+                    console.print("  [yellow]No features found[/yellow]")
 
-        except Exception as e:
-            console.print(f"  [red]✗[/red] Failed: {e}")
-            if verbose:
-                console.print_exception()
-            # Continue with other datasets
+            except Exception as e:
+                console.print(f"  [red]✗[/red] Failed: {e}")
+                if verbose:
+                    console.print_exception()
+                # Continue with other datasets
 
     # Add metadata layer if we have a bbox
     if layers and recipe.output.format.value == "gpkg":
@@ -3,6 +3,7 @@
 Configuration loaders for services and quirks.
 """
 
+from giskit.config._yaml import load_yaml
 from giskit.config.discovery import (
     discover_providers,
     get_provider_config,
@@ -22,6 +23,7 @@ from giskit.config.loader import (
 __all__ = [
     "load_services",
     "load_quirks",
+    "load_yaml",
     "save_services",
     "save_quirks",
     "ServiceDefinition",
@@ -0,0 +1,42 @@
+"""Cached YAML config file loading.
+
+Provider and service configs are parsed by discovery, the service/quirk
+loaders and every provider instance. Parsed documents are cached per file
+(keyed by path and modification time, so edits are picked up) and callers
+get their own deep copy to mutate freely.
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it (several times faster)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file (memoized on path and modification time)."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_yaml(path: Path | str) -> Any:
+    """Load a YAML config file.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed document (a fresh copy the caller may modify)
+
+    Raises:
+        OSError: If the file can't be read
+        yaml.YAMLError: If the file isn't valid YAML
+    """
+    path = Path(path)
+    data = _load_yaml_cached(str(path.resolve()), path.stat().st_mtime_ns)
+    return copy.deepcopy(data)
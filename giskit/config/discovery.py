@@ -8,7 +8,7 @@ Discovers providers from two formats:
 from pathlib import Path
 from typing import Any
 
-import yaml
+from giskit.config._yaml import load_yaml
 
 
 def discover_providers(config_dir: Path | None = None) -> dict[str, dict[str, Any]]:
@@ -56,8 +56,7 @@ def discover_providers(config_dir: Path | None = None) -> dict[str, dict[str, An
         provider_name = config_file.stem  # e.g., "pdok" from "pdok.yml"
 
         try:
-            with open(config_file) as f:
-                config_data = yaml.safe_load(f)
+            config_data = load_yaml(config_file)
 
             if not config_data or "provider" not in config_data or "services" not in config_data:
                 continue  # Not a valid provider config
@@ -94,8 +93,7 @@ def discover_providers(config_dir: Path | None = None) -> dict[str, dict[str, An
         metadata_file = provider_path / "provider.yml"
         metadata = {}
         if metadata_file.exists():
-            with open(metadata_file) as f:
-                metadata = yaml.safe_load(f) or {}
+            metadata = load_yaml(metadata_file) or {}
 
         # Check for protocol config files
         protocol_files = {
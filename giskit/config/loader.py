@@ -23,12 +23,16 @@ Usage:
     quirks = load_quirks()
 """
 
+from dataclasses import MISSING, fields, is_dataclass
+from dataclasses import Field as DataclassField
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
+from giskit.config._yaml import load_yaml
+
 # Config file locations
 DEFAULT_CONFIG_DIR = Path(__file__).parent.parent / "config"
 USER_CONFIG_DIR = Path.home() / ".giskit" / "config"
@@ -122,6 +126,7 @@ class QuirkDefinition(BaseModel):
     max_features_limit: Optional[int] = Field(None)
     pagination_broken: bool = Field(False)
     max_concurrent_cells: int = Field(5, description="Max concurrent grid cell downloads")
+    max_concurrent_pages: int = Field(5, description="Max concurrent page downloads")
 
     # Timeout quirks
     custom_timeout: Optional[float] = Field(None)
@@ -134,6 +139,12 @@ class QuirkDefinition(BaseModel):
     omit_bbox_crs_param: bool = Field(
         False, description="Do not include bbox-crs parameter in requests"
     )
+    supports_datetime_param: bool = Field(
+        True, description="Send temporal filters as the OGC 'datetime' parameter"
+    )
+    supports_properties_param: bool = Field(
+        False, description="Server honours the OGC 'properties' parameter"
+    )
 
     # Response quirks
     empty_collections_return_404: bool = Field(False)
@@ -164,10 +175,13 @@ class QuirkDefinition(BaseModel):
             max_features_limit=self.max_features_limit,
             pagination_broken=self.pagination_broken,
             max_concurrent_cells=self.max_concurrent_cells,
+            max_concurrent_pages=self.max_concurrent_pages,
             custom_timeout=self.custom_timeout,
             force_crs_in_query=self.force_crs_in_query,
             bbox_crs=self.bbox_crs,
             omit_bbox_crs_param=self.omit_bbox_crs_param,
+            supports_datetime_param=self.supports_datetime_param,
+            supports_properties_param=self.supports_properties_param,
             empty_collections_return_404=self.empty_collections_return_404,
             format_is_cityjson=self.format_is_cityjson,
             cityjson_version=self.cityjson_version,
@@ -240,8 +254,7 @@ def load_services(
     # Try to load from file
     if file_path.exists():
         try:
-            with open(file_path) as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(file_path)
 
             # Validate and parse
             config = ServicesConfig(**data)
@@ -300,8 +313,7 @@ def load_quirks(
 
         if file_path.exists():
             try:
-                with open(file_path) as f:
-                    data = yaml.safe_load(f)
+                data = load_yaml(file_path)
 
                 # Handle services differently (nested structure)
                 if quirk_type == "services":
@@ -403,6 +415,13 @@ def save_services(
     return output_path
 
 
+def _field_default(f: DataclassField) -> Any:
+    """Return the default value of a dataclass field (MISSING if required)."""
+    if f.default_factory is not MISSING:
+        return f.default_factory()
+    return f.default
+
+
 def save_quirks(
     quirks_dict: dict[str, dict[str, Any]],
     quirk_type: str,
@@ -440,9 +459,14 @@ def save_quirks(
             # Create unique ID for this quirk
             quirk_id = f"{category_id}-{protocol_id}"
 
-            # Convert to dict if it has model_dump method (Pydantic model)
-            if hasattr(quirk_obj, "model_dump"):
-                quirk_data = quirk_obj.model_dump(exclude_none=True, exclude_defaults=True)
+            # Convert dataclass instances (ProtocolQuirks) to a dict of non-default values
+            if is_dataclass(quirk_obj):
+                quirk_data = {
+                    f.name: getattr(quirk_obj, f.name)
+                    for f in fields(quirk_obj)
+                    if getattr(quirk_obj, f.name) is not None
+                    and getattr(quirk_obj, f.name) != _field_default(f)
+                }
             elif isinstance(quirk_obj, dict):
                 quirk_data = quirk_obj.copy()
             else:
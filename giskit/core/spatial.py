@@ -1,10 +1,16 @@
 """Spatial utilities for coordinate transformations and geometric operations."""
 
-from typing import TYPE_CHECKING, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+import geopandas as gpd
+import numpy as np
 import pyproj
+import shapely
+from geopandas.array import GeometryArray
 from pyproj import Transformer
-from shapely.geometry import Point, Polygon, box
+from shapely.geometry import Point, Polygon
 from shapely.ops import transform
 
 if TYPE_CHECKING:
@@ -17,6 +23,50 @@ class SpatialError(Exception):
     pass
 
 
+@lru_cache(maxsize=64)
+def get_transformer(from_crs: str, to_crs: str, always_xy: bool = True) -> Transformer:
+    """Get a (cached) transformer between two CRS.
+
+    Creating a pyproj Transformer is far more expensive than using one, so
+    instances are cached by their (hashable) CRS strings.
+
+    Args:
+        from_crs: Source CRS (e.g., "EPSG:4326")
+        to_crs: Target CRS (e.g., "EPSG:28992")
+        always_xy: Use lon/lat (x/y) axis order regardless of CRS definition
+
+    Returns:
+        pyproj Transformer
+    """
+    return Transformer.from_crs(from_crs, to_crs, always_xy=always_xy)
+
+
+@lru_cache(maxsize=64)
+def _parse_crs(crs: str) -> pyproj.CRS:
+    """Parse a CRS string (cached; CRS construction queries the PROJ database)."""
+    return pyproj.CRS.from_user_input(crs)
+
+
+def same_crs(a: str | pyproj.CRS, b: str | pyproj.CRS) -> bool:
+    """Check whether two CRS definitions are equivalent.
+
+    Different spellings of one CRS (e.g. "EPSG:4326" and "epsg:4326") compare
+    equal, so callers can skip no-op reprojections.
+
+    Args:
+        a: CRS string or pyproj CRS
+        b: CRS string or pyproj CRS
+
+    Returns:
+        True if both describe the same CRS
+    """
+    if isinstance(a, str) and isinstance(b, str) and a == b:
+        return True
+    crs_a = a if isinstance(a, pyproj.CRS) else _parse_crs(a)
+    crs_b = b if isinstance(b, pyproj.CRS) else _parse_crs(b)
+    return crs_a.equals(crs_b)
+
+
 def buffer_point_to_bbox(
     lon: float, lat: float, radius_m: float, crs: str = "EPSG:4326"
 ) -> Tuple[float, float, float, float]:
@@ -49,14 +99,14 @@ def buffer_point_to_bbox(
             )
 
             # Transform to projected CRS
-            transformer_to_proj = Transformer.from_crs("EPSG:4326", proj_string, always_xy=True)
+            transformer_to_proj = get_transformer("EPSG:4326", proj_string)
             point_proj = transform(transformer_to_proj.transform, point)
 
             # Buffer in meters
             buffered_proj = point_proj.buffer(radius_m)
 
             # Transform back to WGS84
-            transformer_to_wgs84 = Transformer.from_crs(proj_string, "EPSG:4326", always_xy=True)
+            transformer_to_wgs84 = get_transformer(proj_string, "EPSG:4326")
             buffered = transform(transformer_to_wgs84.transform, buffered_proj)
         else:
             # For other CRS, assume units are meters (or accept inaccuracy)
@@ -121,15 +171,13 @@ def transform_bbox(
         if from_crs == to_crs:
             return bbox
 
-        # Create box geometry
+        # Transform the four corners in one call
         minx, miny, maxx, maxy = bbox
-        geom = box(minx, miny, maxx, maxy)
+        xs, ys = get_transformer(from_crs, to_crs).transform(
+            [minx, maxx, maxx, minx], [miny, miny, maxy, maxy]
+        )
 
-        # Transform
-        transformer = Transformer.from_crs(from_crs, to_crs, always_xy=True)
-        transformed_geom = transform(transformer.transform, geom)
-
-        return transformed_geom.bounds
+        return (min(xs), min(ys), max(xs), max(ys))
 
     except Exception as e:
         raise SpatialError(f"Failed to transform bbox from {from_crs} to {to_crs}: {e}") from e
@@ -154,8 +202,7 @@ def transform_point(lon: float, lat: float, from_crs: str, to_crs: str) -> Tuple
         if from_crs == to_crs:
             return (lon, lat)
 
-        transformer = Transformer.from_crs(from_crs, to_crs, always_xy=True)
-        x, y = transformer.transform(lon, lat)
+        x, y = get_transformer(from_crs, to_crs).transform(lon, lat)
 
         return (x, y)
 
@@ -203,6 +250,52 @@ def get_crs_info(crs: str) -> dict:
         raise SpatialError(f"Invalid CRS '{crs}': {e}") from e
 
 
+def reproject_geodataframe(
+    gdf: gpd.GeoDataFrame,
+    to_crs: str,
+    chunk_size: int = 50_000,
+    max_workers: Optional[int] = None,
+) -> gpd.GeoDataFrame:
+    """Reproject a GeoDataFrame, splitting large frames across threads.
+
+    Small frames go through ``to_crs``. Larger ones are split into chunks
+    whose coordinates are transformed in a thread pool (GEOS and PROJ
+    release the GIL) with a cached transformer.
+
+    Args:
+        gdf: GeoDataFrame with a CRS set
+        to_crs: Target CRS (e.g., "EPSG:28992")
+        chunk_size: Geometries per chunk; frames up to this size use to_crs
+        max_workers: Thread pool size (None = executor default)
+
+    Returns:
+        Reprojected GeoDataFrame (gdf itself if already in to_crs)
+    """
+    if gdf.crs is not None and same_crs(gdf.crs, to_crs):
+        return gdf
+
+    if gdf.crs is None or len(gdf) <= chunk_size:
+        return gdf.to_crs(to_crs)
+
+    transformer = get_transformer(gdf.crs.to_string(), to_crs)
+    include_z = bool(gdf.has_z.any())
+
+    def project(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(*coords.T))
+
+    def project_chunk(chunk: np.ndarray) -> np.ndarray:
+        return shapely.transform(chunk, project, include_z=include_z)
+
+    geometries = np.asarray(gdf.geometry.array)
+    chunks = [geometries[i : i + chunk_size] for i in range(0, len(geometries), chunk_size)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        projected = np.concatenate(list(pool.map(project_chunk, chunks)))
+
+    result = gdf.copy()
+    result[gdf.geometry.name] = GeometryArray(projected, crs=to_crs)
+    return result
+
+
 def subdivide_bbox(
     bbox: Tuple[float, float, float, float], cell_size: float, crs: str = "EPSG:28992"
 ) -> List[Tuple[float, float, float, float]]:
@@ -251,17 +344,41 @@ def subdivide_bbox(
     return cells
 
 
-async def location_to_bbox(
+def morton_key(col: int, row: int) -> int:
+    """Interleave the bits of a grid cell's column and row (Z-order curve).
+
+    Sorting cells by this key visits them in small square blocks instead of
+    full rows, so spatially adjacent cells are processed close together.
+
+    Args:
+        col: Zero-based column index
+        row: Zero-based row index
+
+    Returns:
+        Morton code of the cell
+
+    Example:
+        >>> sorted([(0, 0), (1, 0), (0, 1), (1, 1), (2, 0)], key=lambda c: morton_key(*c))
+        [(0, 0), (1, 0), (0, 1), (1, 1), (2, 0)]
+    """
+    key = 0
+    bit = 0
+    while col or row:
+        key |= (col & 1) << (2 * bit) | (row & 1) << (2 * bit + 1)
+        col >>= 1
+        row >>= 1
+        bit += 1
+    return key
+
+
+def location_to_bbox_sync(
     location: "Location",  # type: ignore  # Forward reference
     target_crs: str = "EPSG:4326",
 ) -> Tuple[float, float, float, float]:
-    """Convert any Location type to bounding box in specified CRS.
+    """Convert a bbox, point or polygon Location to bounding box in specified CRS.
 
-    This is a unified helper that handles all location types:
-    - address → geocode → buffer → bbox
-    - point → buffer → bbox
-    - bbox → transform if needed
-    - polygon → bbox → transform if needed
+    Synchronous variant of location_to_bbox for locations that need no
+    geocoding (pure coordinate math, no network access).
 
     Args:
         location: Location specification (from giskit.core.recipe)
@@ -271,26 +388,11 @@ async def location_to_bbox(
         Tuple of (minx, miny, maxx, maxy) in target_crs
 
     Raises:
-        SpatialError: If location conversion fails
-
-    Examples:
-        >>> from giskit.core.recipe import Location, LocationType
-        >>>
-        >>> # Address with radius
-        >>> loc = Location(type=LocationType.ADDRESS, value="Dam 1, Amsterdam", radius=500)
-        >>> bbox = await location_to_bbox(loc, "EPSG:28992")
-        >>>
-        >>> # Point with radius
-        >>> loc = Location(type=LocationType.POINT, value=[52.3676, 4.9041], radius=1000)
-        >>> bbox = await location_to_bbox(loc)
-        >>>
-        >>> # Bbox (just transform if needed)
-        >>> loc = Location(type=LocationType.BBOX, value=[4.88, 52.36, 4.92, 52.38])
-        >>> bbox = await location_to_bbox(loc, "EPSG:28992")
+        SpatialError: If location conversion fails or the location is an
+            address (use location_to_bbox)
     """
     try:
         # Import here to avoid circular dependencies
-        from giskit.core.geocoding import geocode
         from giskit.core.recipe import LocationType
 
         if location.type == LocationType.BBOX:
@@ -318,20 +420,6 @@ async def location_to_bbox(
                 return transform_bbox(bbox_wgs84, "EPSG:4326", target_crs)
             return bbox_wgs84
 
-        elif location.type == LocationType.ADDRESS:
-            # Address - geocode first, then buffer
-            address = location.value  # type: ignore
-            lon, lat = await geocode(address)
-
-            # Buffer to create bbox (in WGS84)
-            assert location.radius is not None, "Radius required for address location"
-            bbox_wgs84 = buffer_point_to_bbox(lon, lat, location.radius)
-
-            # Transform to target CRS if needed
-            if target_crs != "EPSG:4326":
-                return transform_bbox(bbox_wgs84, "EPSG:4326", target_crs)
-            return bbox_wgs84
-
         elif location.type == LocationType.POLYGON:
             # Polygon - calculate bbox from coordinates
             coords = location.value  # type: ignore
@@ -342,6 +430,9 @@ async def location_to_bbox(
                 return transform_bbox(bbox, location.crs, target_crs)
             return bbox
 
+        elif location.type == LocationType.ADDRESS:
+            raise SpatialError("Address locations need geocoding, use location_to_bbox")
+
         else:
             raise SpatialError(f"Unknown location type: {location.type}")
 
@@ -349,3 +440,70 @@ async def location_to_bbox(
         if isinstance(e, SpatialError):
             raise
         raise SpatialError(f"Failed to convert location to bbox: {e}") from e
+
+
+async def location_to_bbox(
+    location: "Location",  # type: ignore  # Forward reference
+    target_crs: str = "EPSG:4326",
+) -> Tuple[float, float, float, float]:
+    """Convert any Location type to bounding box in specified CRS.
+
+    This is a unified helper that handles all location types:
+    - address → geocode → buffer → bbox
+    - point → buffer → bbox
+    - bbox → transform if needed
+    - polygon → bbox → transform if needed
+
+    Only addresses need awaiting (geocoding); other types are handled by
+    location_to_bbox_sync.
+
+    Args:
+        location: Location specification (from giskit.core.recipe)
+        target_crs: Target CRS for the bbox (default: WGS84)
+
+    Returns:
+        Tuple of (minx, miny, maxx, maxy) in target_crs
+
+    Raises:
+        SpatialError: If location conversion fails
+
+    Examples:
+        >>> from giskit.core.recipe import Location, LocationType
+        >>>
+        >>> # Address with radius
+        >>> loc = Location(type=LocationType.ADDRESS, value="Dam 1, Amsterdam", radius=500)
+        >>> bbox = await location_to_bbox(loc, "EPSG:28992")
+        >>>
+        >>> # Point with radius
+        >>> loc = Location(type=LocationType.POINT, value=[52.3676, 4.9041], radius=1000)
+        >>> bbox = await location_to_bbox(loc)
+        >>>
+        >>> # Bbox (just transform if needed)
+        >>> loc = Location(type=LocationType.BBOX, value=[4.88, 52.36, 4.92, 52.38])
+        >>> bbox = await location_to_bbox(loc, "EPSG:28992")
+    """
+    # Import here to avoid circular dependencies
+    from giskit.core.geocoding import geocode
+    from giskit.core.recipe import LocationType
+
+    if location.type != LocationType.ADDRESS:
+        return location_to_bbox_sync(location, target_crs)
+
+    try:
+        # Address - geocode first, then buffer
+        address = location.value  # type: ignore
+        lon, lat = await geocode(address)
+
+        # Buffer to create bbox (in WGS84)
+        assert location.radius is not None, "Radius required for address location"
+        bbox_wgs84 = buffer_point_to_bbox(lon, lat, location.radius)
+
+        # Transform to target CRS if needed
+        if target_crs != "EPSG:4326":
+            return transform_bbox(bbox_wgs84, "EPSG:4326", target_crs)
+        return bbox_wgs84
+
+    except Exception as e:
+        if isinstance(e, SpatialError):
+            raise
+        raise SpatialError(f"Failed to convert location to bbox: {e}") from e
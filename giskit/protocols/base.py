@@ -9,13 +9,129 @@ A Protocol represents a specific data transfer/query protocol:
 - Custom REST APIs
 """
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
 
 import geopandas as gpd
 import httpx
 from shapely.geometry import box
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Connection pool sized for concurrent grid cells, page fetches and tiles;
+# idle connections survive the gaps between bursts of requests
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30.0)
+
+
+class ClientPool:
+    """HTTP clients shared by protocol instances.
+
+    Protocols using the same pool that talk to the same host with the same
+    client settings on the same event loop share one client (and so one
+    connection pool). Each client counts the protocols holding it and is
+    closed when the last one releases it. A provider owns one pool for all
+    its protocols; a standalone protocol gets a pool of its own.
+    """
+
+    __slots__ = ("_clients",)
+
+    def __init__(self) -> None:
+        """Initialize empty client pool."""
+        # Client and number of current holders per key
+        self._clients: dict[tuple[Any, ...], tuple[httpx.AsyncClient, int]] = {}
+
+    def __len__(self) -> int:
+        """Number of open clients in the pool."""
+        return len(self._clients)
+
+    def acquire(
+        self, key: tuple[Any, ...], factory: Callable[[], httpx.AsyncClient]
+    ) -> httpx.AsyncClient:
+        """Get the client for key, creating it if needed, and count a holder.
+
+        Args:
+            key: Hashable key of event loop, host and client settings
+            factory: Creates the client when none is open for key
+
+        Returns:
+            Shared async HTTP client
+        """
+        # Forget clients of event loops that have been closed; they can't be
+        # used (or closed) any more
+        for stale in [k for k in self._clients if k[0].is_closed()]:
+            del self._clients[stale]
+
+        client, holders = self._clients.get(key, (None, 0))
+        if client is None or client.is_closed:
+            client, holders = factory(), 0
+        self._clients[key] = (client, holders + 1)
+        return client
+
+    async def release(self, key: tuple[Any, ...], client: httpx.AsyncClient) -> None:
+        """Release one holder of a client, closing it when it was the last.
+
+        Args:
+            key: Key the client was acquired under
+            client: Client returned by acquire
+        """
+        entry = self._clients.get(key)
+        if entry is not None and entry[0] is client and entry[1] > 1:
+            self._clients[key] = (client, entry[1] - 1)
+            return
+
+        # Last holder - close the client
+        if entry is not None and entry[0] is client:
+            del self._clients[key]
+        await client.aclose()
+
+    def discard(self, key: tuple[Any, ...], client: httpx.AsyncClient) -> None:
+        """Release one holder of a client bound to another event loop.
+
+        The client can't be closed from the running loop; it is forgotten
+        once its last holder is gone.
+
+        Args:
+            key: Key the client was acquired under
+            client: Client returned by acquire
+        """
+        entry = self._clients.get(key)
+        if entry is None or entry[0] is not client:
+            return
+        if entry[1] > 1:
+            self._clients[key] = (client, entry[1] - 1)
+        else:
+            del self._clients[key]
+
+
+def loads_json(content: bytes | str) -> Any:
+    """Decode a JSON response body.
+
+    Uses orjson when installed (several times faster on coordinate-heavy
+    GeoJSON), otherwise the standard library.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded JSON (dicts/lists, identical for both decoders)
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class Protocol(ABC):
     """Abstract base class for all data protocols.
@@ -35,6 +151,8 @@ class Protocol(ABC):
         self.timeout = timeout
         self.config = kwargs
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_key_held: tuple[Any, ...] = ()
+        self._client_pool = ClientPool()
 
     @abstractmethod
     async def get_capabilities(self) -> dict[str, Any]:
@@ -124,22 +242,94 @@ class Protocol(ABC):
         """
         return box(*bbox)
 
+    def _client_limits(self) -> httpx.Limits:
+        """Connection pool limits for this protocol's client.
+
+        Override to size the pool for protocol-specific concurrency. Only
+        protocols with equal limits share a client, so prefer HTTP_LIMITS
+        whenever it is large enough. Protocol-specific headers are passed
+        per request rather than set on the client, for the same reason.
+
+        Returns:
+            Connection pool limits
+        """
+        return HTTP_LIMITS
+
+    def _client_key(self, loop: asyncio.AbstractEventLoop) -> tuple[Any, ...]:
+        """Key under which this protocol's HTTP client can be shared.
+
+        Args:
+            loop: Running event loop (connections can't cross event loops)
+
+        Returns:
+            Hashable key of host and client settings
+        """
+        limits = self._client_limits()
+        return (
+            loop,
+            urlsplit(self.base_url).netloc,
+            self.timeout,
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+        )
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client.
 
+        Protocol instances sharing a client pool (see use_client_pool) that
+        talk to the same host with the same settings share one client, and so
+        one connection pool. Uses HTTP/2 when the optional h2
+        package is installed, so concurrent requests are multiplexed over one
+        connection.
+
+        A client opened on an earlier event loop (e.g. by a previous
+        asyncio.run() call) is replaced, as its connections can't be used.
+
         Returns:
             Async HTTP client instance
         """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_key_held[0] is not loop:
+            self._client_pool.discard(self._client_key_held, self._client)
+            self._client = None
+
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            key = self._client_key(loop)
+            self._client = self._client_pool.acquire(
+                key,
+                lambda: httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=self._client_limits(),
+                    http2=HTTP2_AVAILABLE,
+                ),
+            )
+            self._client_key_held = key
         return self._client
 
+    def use_client_pool(self, pool: ClientPool) -> None:
+        """Share HTTP clients through pool (e.g. the owning provider's).
+
+        Only takes effect before this protocol has opened its client.
+
+        Args:
+            pool: Client pool to acquire clients from
+        """
+        if self._client is None:
+            self._client_pool = pool
+
     async def __aenter__(self) -> "Protocol":
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - cleanup HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Async context manager exit - release the (shared) HTTP client."""
+        if self._client is None:
+            return
+
+        client, self._client = self._client, None
+        if self._client_key_held[0] is not asyncio.get_running_loop():
+            # Opened on an earlier event loop - nothing left to close here
+            self._client_pool.discard(self._client_key_held, client)
+            return
+        await self._client_pool.release(self._client_key_held, client)
@@ -45,13 +45,18 @@ Example feature structure:
 }
 """
 
-from typing import Optional
+from itertools import chain
+from typing import Any, Optional
 
 import geopandas as gpd
-from shapely.geometry import MultiPolygon, Polygon
+import numpy as np
+import pandas as pd
+import shapely
 
 
-def cityjson_to_geodataframe(cityjson_data: dict, lod: str = "0") -> gpd.GeoDataFrame:
+def cityjson_to_geodataframe(
+    cityjson_data: dict, lod: str = "0", crs: str = "EPSG:28992"
+) -> gpd.GeoDataFrame:
     """Convert CityJSON features from 3DBAG API to GeoDataFrame.
 
     CRITICAL: CityJSON 2.0 uses per-page transforms for vertex compression.
@@ -61,6 +66,7 @@ def cityjson_to_geodataframe(cityjson_data: dict, lod: str = "0") -> gpd.GeoData
     Args:
         cityjson_data: CityJSON data (GeoJSON-like with CityObjects and metadata.transform)
         lod: Level of Detail to extract (0 = footprint, 2.2 = 3D model)
+        crs: CRS of the vertices (3DBAG serves EPSG:28992)
 
     Returns:
         GeoDataFrame with building footprints or 3D models
@@ -75,12 +81,14 @@ def cityjson_to_geodataframe(cityjson_data: dict, lod: str = "0") -> gpd.GeoData
     if "metadata" in cityjson_data and isinstance(cityjson_data["metadata"], dict):
         page_transform = cityjson_data["metadata"].get("transform")
 
-    rows = []
+    # Dequantize the vertices of the whole page in one go
+    page_vertices = _dequantize_vertices(features, page_transform)
 
-    for feature in features:
-        # Get shared vertices array for this feature
-        vertices = feature.get("vertices", [])
+    rows: list[dict[str, Any]] = []
+    page_rings: list[np.ndarray] = []  # surface rings of all rows on the page
+    ring_owners: list[int] = []  # row index of each ring
 
+    for feature, vertices in zip(features, page_vertices, strict=True):
         # Extract CityObjects (buildings)
         city_objects = feature.get("CityObjects", {})
 
@@ -99,28 +107,30 @@ def cityjson_to_geodataframe(cityjson_data: dict, lod: str = "0") -> gpd.GeoData
         # Get attributes from main building
         attrs = main_building.get("attributes", {})
 
-        # Extract geometry based on LOD
-        geometry = None
+        # Extract geometry rings based on LOD
+        rings: list[np.ndarray] = []
 
         if lod == "0":
             # LOD 0: 2D footprint from Building object
-            geometry = _extract_lod0_geometry(main_building, vertices, page_transform)
+            rings = _extract_lod0_rings(main_building, vertices)
         else:
             # LOD 1.2/1.3/2.2: 3D model from BuildingPart children
             # Find BuildingPart with requested LOD
             for _obj_id, obj in city_objects.items():
                 if obj.get("type") == "BuildingPart":
-                    geometry = _extract_lod_geometry(obj, vertices, lod, page_transform)
-                    if geometry:
+                    rings = _extract_lod_rings(obj, vertices, lod)
+                    if rings:
                         break  # Found requested LOD
 
         # Skip if no geometry found
-        if geometry is None:
+        if not rings:
             continue
 
+        page_rings.extend(rings)
+        ring_owners.extend([len(rows)] * len(rings))
+
         # Extract key attributes
         row = {
-            "geometry": geometry,
             "identificatie": attrs.get("identificatie", main_building_id or "unknown"),
             "bouwjaar": attrs.get("oorspronkelijkbouwjaar"),
             "status": attrs.get("status"),
@@ -144,23 +154,90 @@ def cityjson_to_geodataframe(cityjson_data: dict, lod: str = "0") -> gpd.GeoData
     if not rows:
         return gpd.GeoDataFrame()
 
-    # Create GeoDataFrame
-    gdf = gpd.GeoDataFrame(rows, crs="EPSG:28992")
+    # Build all polygons of the page in one vectorized call: a footprint per
+    # row for LOD 0, a MultiPolygon of surfaces per row for 3D LODs
+    ring_lengths = [len(ring) for ring in page_rings]
+    polygons = shapely.polygons(
+        shapely.linearrings(
+            np.concatenate(page_rings), indices=np.repeat(np.arange(len(page_rings)), ring_lengths)
+        )
+    )
+    if lod != "0":
+        polygons = shapely.multipolygons(polygons, indices=ring_owners)
+
+    # Create GeoDataFrame (geometry column first)
+    frame = pd.DataFrame(rows)
+    frame.insert(0, "geometry", polygons)
+    gdf = gpd.GeoDataFrame(frame, crs=crs)
     return gdf
 
 
-def _extract_lod0_geometry(
-    city_object: dict, vertices: list, transform: Optional[dict] = None
-) -> Optional[Polygon]:
-    """Extract LOD 0 (2D footprint) geometry from CityObject.
+def _dequantize_vertices(features: list[dict], transform: Optional[dict]) -> list[np.ndarray]:
+    """Turn the integer vertices of every feature on a page into real coordinates.
+
+    All vertices of the page are stacked into one (N, 3) array and scaled with
+    a single broadcasted multiply-add, then split back per feature.
+
+    Args:
+        features: CityJSON features of one page
+        transform: Page transform (scale/translate), or None for raw coordinates
+
+    Returns:
+        One (n, 3) float array of real coordinates per feature
+    """
+    counts = [len(feature.get("vertices") or ()) for feature in features]
+    flat = [vertex for feature in features for vertex in feature.get("vertices") or ()]
+    if not flat:
+        return [np.empty((0, 3)) for _ in features]
+
+    try:
+        # CityJSON vertices are always [x, y, z]; fromiter avoids nested-list inference
+        coords = np.fromiter(
+            chain.from_iterable(flat), dtype=np.float64, count=3 * len(flat)
+        ).reshape(-1, 3)
+    except ValueError:
+        coords = np.array(flat, dtype=np.float64)
+        if coords.shape[1] < 3:
+            # Missing Z is treated as 0
+            coords = np.pad(coords, ((0, 0), (0, 3 - coords.shape[1])))
+
+    # Apply transform if available (CityJSON 2.0)
+    if transform and "scale" in transform and "translate" in transform:
+        coords = coords * np.asarray(transform["scale"], dtype=np.float64) + np.asarray(
+            transform["translate"], dtype=np.float64
+        )
+
+    return np.split(coords, np.cumsum(counts)[:-1])
+
+
+def _ring_coordinates(ring: list, vertices: np.ndarray) -> Optional[np.ndarray]:
+    """Look up the coordinates of a boundary ring, skipping out-of-range indices.
+
+    Args:
+        ring: Vertex indices of the ring
+        vertices: Real coordinates of the feature's vertices
+
+    Returns:
+        (n, 3) array of ring coordinates, or None if they can't form a polygon
+    """
+    indices = np.asarray(ring, dtype=np.int64)
+    coords: np.ndarray = vertices[indices[indices < len(vertices)]]
+
+    # A ring needs three distinct corners (it is closed automatically)
+    if len(coords) < 3 or (len(coords) == 3 and (coords[0] == coords[-1]).all()):
+        return None
+    return coords
+
+
+def _extract_lod0_rings(city_object: dict, vertices: np.ndarray) -> list[np.ndarray]:
+    """Extract the LOD 0 (2D footprint) ring from CityObject.
 
     Args:
         city_object: CityJSON building object
-        vertices: Shared vertices array (integer indices if transform provided)
-        transform: CityJSON transform (scale/translate) for vertices
+        vertices: Real coordinates of the feature's vertices (see _dequantize_vertices)
 
     Returns:
-        Shapely Polygon or None
+        List with the footprint's outer ring as (n, 2) coordinates, or empty list
     """
     geom_list = city_object.get("geometry", [])
 
@@ -170,48 +247,27 @@ def _extract_lod0_geometry(
             boundaries = geom.get("boundaries", [])
             geom_type = geom.get("type", "")
 
-            if geom_type == "MultiSurface" and boundaries and vertices:
-                # Extract first surface as footprint
-                coords = []
+            if geom_type == "MultiSurface" and boundaries and len(vertices):
+                # Use the first surface as footprint
                 for surface in boundaries:
                     if surface:
-                        outer_ring = surface[0]
-                        ring_coords = []
-                        for vertex_idx in outer_ring:
-                            if vertex_idx < len(vertices):
-                                v = vertices[vertex_idx]
-                                # Apply transform if available (CityJSON 2.0)
-                                if transform and "scale" in transform and "translate" in transform:
-                                    scale = transform["scale"]
-                                    translate = transform["translate"]
-                                    x = v[0] * scale[0] + translate[0]
-                                    y = v[1] * scale[1] + translate[1]
-                                    ring_coords.append((x, y))
-                                else:
-                                    # No transform, use raw vertices
-                                    ring_coords.append((v[0], v[1]))
-                        if ring_coords:
-                            coords.append(ring_coords)
-
-                if coords:
-                    return Polygon(coords[0])
-
-    return None
-
-
-def _extract_lod_geometry(
-    city_object: dict, vertices: list, lod: str, transform: Optional[dict] = None
-) -> Optional[MultiPolygon]:
-    """Extract 3D geometry for a specific LOD from BuildingPart.
+                        ring_coords = _ring_coordinates(surface[0], vertices)
+                        if ring_coords is not None:
+                            return [ring_coords[:, :2]]
+
+    return []
+
+
+def _extract_lod_rings(city_object: dict, vertices: np.ndarray, lod: str) -> list[np.ndarray]:
+    """Extract the 3D surface rings for a specific LOD from BuildingPart.
 
     Args:
         city_object: CityJSON BuildingPart object
-        vertices: Shared vertices array (integer indices if transform provided)
+        vertices: Real coordinates of the feature's vertices (see _dequantize_vertices)
         lod: Level of Detail (e.g. "2.2")
-        transform: CityJSON transform (scale/translate) for vertices
 
     Returns:
-        Shapely MultiPolygon with Z coordinates (3D surfaces) or None
+        Outer ring of each surface as (n, 3) coordinates (empty if LOD not found)
     """
     geom_list = city_object.get("geometry", [])
 
@@ -221,40 +277,18 @@ def _extract_lod_geometry(
             boundaries = geom.get("boundaries", [])
             geom_type = geom.get("type", "")
 
-            if geom_type == "Solid" and boundaries and vertices:
+            if geom_type == "Solid" and boundaries and len(vertices):
                 # Solid has shells -> surfaces -> rings
-                # Extract all surfaces as 3D polygons
+                # Extract all surfaces, skipping rings that can't form a polygon
                 surfaces = []
                 for shell in boundaries:
                     for surface in shell:
                         if surface:
-                            outer_ring = surface[0]
-                            ring_coords = []
-                            for vertex_idx in outer_ring:
-                                if vertex_idx < len(vertices):
-                                    v = vertices[vertex_idx]
-                                    # Apply transform if available (CityJSON 2.0)
-                                    if (
-                                        transform
-                                        and "scale" in transform
-                                        and "translate" in transform
-                                    ):
-                                        scale = transform["scale"]
-                                        translate = transform["translate"]
-                                        x = v[0] * scale[0] + translate[0]
-                                        y = v[1] * scale[1] + translate[1]
-                                        z = (v[2] * scale[2] + translate[2]) if len(v) > 2 else 0
-                                        ring_coords.append((x, y, z))
-                                    else:
-                                        # No transform, use raw vertices
-                                        ring_coords.append((v[0], v[1], v[2] if len(v) > 2 else 0))
-                            if ring_coords:
-                                try:
-                                    surfaces.append(Polygon(ring_coords))
-                                except Exception:
-                                    pass  # Skip invalid polygons
+                            ring_coords = _ring_coordinates(surface[0], vertices)
+                            if ring_coords is not None:
+                                surfaces.append(ring_coords)
 
                 if surfaces:
-                    return MultiPolygon(surfaces)
+                    return surfaces
 
-    return None
+    return []
@@ -4,18 +4,29 @@ Downloads and parses GTFS feeds for public transport data.
 Focuses on stops/stations with geographic coordinates.
 """
 
-import io
+import hashlib
+import json
+import os
+import time
 import zipfile
 from pathlib import Path
 from typing import Any, Optional
 
 import geopandas as gpd
 import httpx
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+from shapely.geometry import box
 
+from giskit.core.spatial import get_transformer, same_crs, transform_bbox
 from giskit.protocols.base import Protocol
 
+# Feed members we parse (see _parse_gtfs_zip)
+GTFS_FILES = ["stops.txt"]
+
+# Identifier/text columns kept as strings (e.g. IDs with leading zeros)
+GTFS_DTYPES = {"stop_id": "string", "stop_code": "string", "stop_name": "string"}
+
 
 class GTFSProtocol(Protocol):
     """GTFS protocol for public transport data.
@@ -25,8 +36,6 @@ class GTFSProtocol(Protocol):
 
     Key files we use:
     - stops.txt: Station/stop locations with lat/lon coordinates
-    - routes.txt: Transit routes (bus, tram, train, etc.)
-    - trips.txt: Individual trips
 
     See: https://gtfs.org/
     """
@@ -44,7 +53,8 @@ class GTFSProtocol(Protocol):
         Args:
             base_url: URL to GTFS zip file
             cache_dir: Directory to cache downloaded GTFS data
-            cache_days: Number of days to cache data (default: 1)
+            cache_days: Number of days before the cached feed is revalidated with
+                the server (default: 1)
             timeout: Download timeout in seconds (default: 300 = 5 min)
             **kwargs: Additional configuration
         """
@@ -52,45 +62,68 @@ class GTFSProtocol(Protocol):
         self.cache_dir = cache_dir or Path.home() / ".cache" / "giskit" / "gtfs"
         self.cache_days = cache_days
         self._gtfs_data: Optional[dict[str, pd.DataFrame]] = None
+        # Stops as points with a spatial index, built once per feed
+        self._stops: Optional[gpd.GeoDataFrame] = None
+        # Extent of all stops (minx, miny, maxx, maxy) in WGS84
+        self._stops_bounds: Optional[tuple[float, float, float, float]] = None
 
-    async def _download_gtfs(self) -> bytes:
-        """Download GTFS zip file.
+    async def _download_gtfs(
+        self, validators: Optional[dict[str, str]] = None
+    ) -> tuple[Optional[bytes], dict[str, str]]:
+        """Download GTFS zip file, conditionally if validators are given.
+
+        Args:
+            validators: ETag / Last-Modified of the cached copy
 
         Returns:
-            Raw zip file bytes
+            Tuple of (raw zip file bytes or None if unchanged (304), new validators)
         """
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(self.base_url)
+            response = await client.get(self.base_url, headers=headers)
+            if response.status_code == 304:
+                return None, validators or {}
             response.raise_for_status()
-            return response.content
 
-    def _parse_gtfs_zip(self, zip_bytes: bytes) -> dict[str, pd.DataFrame]:
+            new_validators = {}
+            if "etag" in response.headers:
+                new_validators["etag"] = response.headers["etag"]
+            if "last-modified" in response.headers:
+                new_validators["last_modified"] = response.headers["last-modified"]
+            return response.content, new_validators
+
+    def _parse_gtfs_zip(self, zip_file: Path) -> dict[str, pd.DataFrame]:
         """Parse GTFS zip file into dataframes.
 
+        Only the members we use are decompressed; large files such as
+        stop_times.txt and shapes.txt are never inflated.
+
         Args:
-            zip_bytes: Raw zip file data
+            zip_file: Path to the GTFS zip file
 
         Returns:
-            Dictionary mapping filename to DataFrame:
+            Dictionary mapping filename (without .txt) to DataFrame:
             {
                 "stops": DataFrame,
-                "routes": DataFrame,
-                "trips": DataFrame,
-                ...
             }
         """
         data = {}
 
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-            # Parse relevant GTFS files
-            for filename in ["stops.txt", "routes.txt", "trips.txt"]:
-                if filename in zf.namelist():
+        with zipfile.ZipFile(zip_file) as zf:
+            members = set(zf.namelist())
+            for filename in GTFS_FILES:
+                if filename in members:
+                    # Stream the member straight into the parser (BOM-aware)
                     with zf.open(filename) as f:
-                        # Read as text with BOM handling
-                        content = f.read().decode("utf-8-sig")
-                        df = pd.read_csv(io.StringIO(content))
-                        # Store without .txt extension
-                        data[filename.replace(".txt", "")] = df
+                        df = pd.read_csv(f, encoding="utf-8-sig", dtype=GTFS_DTYPES)
+                    # Store without .txt extension
+                    data[filename.replace(".txt", "")] = df
 
         return data
 
@@ -103,31 +136,42 @@ class GTFSProtocol(Protocol):
         if self._gtfs_data is not None:
             return self._gtfs_data
 
-        # Check cache
-        cache_file = self.cache_dir / f"{hash(self.base_url)}.zip"
+        # Check cache (keyed by a stable digest; hash() of a str changes per process)
+        url_key = hashlib.sha256(self.base_url.encode()).hexdigest()[:16]
+        cache_file = self.cache_dir / f"{url_key}.zip"
+        meta_file = self.cache_dir / f"{url_key}.meta.json"
 
+        validators: dict[str, str] = {}
         if cache_file.exists():
-            # Check if cache is fresh
-            import time
-
             age_days = (time.time() - cache_file.stat().st_mtime) / (24 * 3600)
 
             if age_days < self.cache_days:
-                # Use cached data
-                with open(cache_file, "rb") as f:
-                    zip_bytes = f.read()
-                self._gtfs_data = self._parse_gtfs_zip(zip_bytes)
+                # Recently (re)validated - use cached data without asking the server
+                self._gtfs_data = self._parse_gtfs_zip(cache_file)
                 return self._gtfs_data
 
-        # Download fresh data
-        zip_bytes = await self._download_gtfs()
-
-        # Save to cache
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file.write_bytes(zip_bytes)
+            try:
+                validators = json.loads(meta_file.read_text())
+            except (OSError, ValueError):
+                validators = {}
+
+        # Fetch fresh data, or confirm the cached copy is still current
+        zip_bytes, validators = await self._download_gtfs(validators)
+
+        if zip_bytes is None:
+            # 304 Not Modified - restart the revalidation interval
+            os.utime(cache_file)
+        else:
+            # Save to cache
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(zip_bytes)
+            if validators:
+                meta_file.write_text(json.dumps(validators))
+            else:
+                meta_file.unlink(missing_ok=True)
 
         # Parse and cache in memory
-        self._gtfs_data = self._parse_gtfs_zip(zip_bytes)
+        self._gtfs_data = self._parse_gtfs_zip(cache_file)
         return self._gtfs_data
 
     async def get_capabilities(self) -> dict[str, Any]:
@@ -187,44 +231,133 @@ class GTFSProtocol(Protocol):
         Returns:
             GeoDataFrame with stops in specified CRS
         """
-        data = await self._load_gtfs_data()
-        stops = data.get("stops", pd.DataFrame())
+        stops = await self._load_stops()
 
         if stops.empty:
             return gpd.GeoDataFrame()
 
-        # Ensure required columns exist
-        if "stop_lon" not in stops.columns or "stop_lat" not in stops.columns:
-            raise ValueError("GTFS stops.txt missing stop_lon or stop_lat columns")
+        # Filter by bbox (in WGS84) through the R-tree; boundary points are
+        # included. Sorting keeps the feed's stop order (and what limit keeps).
+        # A bbox covering every stop needs no filtering.
+        minx, miny, maxx, maxy = self._stops_bounds  # type: ignore[misc]
+        if bbox[0] <= minx and bbox[1] <= miny and bbox[2] >= maxx and bbox[3] >= maxy:
+            idx = np.arange(len(stops))
+        else:
+            idx = np.sort(stops.sindex.query(box(*bbox), predicate="intersects"))
+
+        # Apply limit
+        if limit is not None:
+            idx = idx[:limit]
+
+        return self._reproject_stops(stops.iloc[idx], crs)
+
+    async def get_features_near(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        point_crs: str = "EPSG:28992",
+        crs: str = "EPSG:4326",
+        limit: Optional[int] = None,
+    ) -> gpd.GeoDataFrame:
+        """Download GTFS stops within a radius of a point.
 
-        # Filter by bbox (in WGS84)
-        minx, miny, maxx, maxy = bbox
-        mask = (
-            (stops["stop_lon"] >= minx)
-            & (stops["stop_lon"] <= maxx)
-            & (stops["stop_lat"] >= miny)
-            & (stops["stop_lat"] <= maxy)
+        Unlike a bbox query this returns a true circle: candidates from the
+        R-tree are checked by distance in point_crs.
+
+        Args:
+            x: Point X coordinate in point_crs
+            y: Point Y coordinate in point_crs
+            radius: Search radius in point_crs units (meters for a metric CRS)
+            point_crs: CRS of the point and radius (default: EPSG:28992 / RD)
+            crs: Target CRS for output (default: EPSG:4326)
+            limit: Maximum number of stops to return
+
+        Returns:
+            GeoDataFrame with stops in specified CRS
+        """
+        stops = await self._load_stops()
+
+        if stops.empty:
+            return gpd.GeoDataFrame()
+
+        # Candidates within the circle's bounding box (in WGS84)
+        bbox = transform_bbox(
+            (x - radius, y - radius, x + radius, y + radius), point_crs, "EPSG:4326"
+        )
+        idx = np.sort(stops.sindex.query(box(*bbox), predicate="intersects"))
+
+        # Keep candidates within the radius, measured in point_crs
+        candidates = stops.geometry.iloc[idx]
+        cx, cy = get_transformer("EPSG:4326", point_crs).transform(
+            candidates.x.to_numpy(), candidates.y.to_numpy()
         )
-        filtered = stops[mask].copy()
+        idx = idx[np.hypot(cx - x, cy - y) <= radius]
 
         # Apply limit
         if limit is not None:
-            filtered = filtered.head(limit)
+            idx = idx[:limit]
 
-        # Create geometry from coordinates
-        geometry = [
-            Point(lon, lat)
-            for lon, lat in zip(filtered["stop_lon"], filtered["stop_lat"], strict=False)
-        ]
+        return self._reproject_stops(stops.iloc[idx], crs)
+
+    @staticmethod
+    def _reproject_stops(gdf: gpd.GeoDataFrame, crs: str) -> gpd.GeoDataFrame:
+        """Transform WGS84 stops to the target CRS.
+
+        Stops are all points, so the coordinate arrays are projected in one
+        batched call instead of per geometry.
+
+        Args:
+            gdf: Stops in EPSG:4326
+            crs: Target CRS
+
+        Returns:
+            Stops in crs
+        """
+        if same_crs(crs, "EPSG:4326"):
+            return gdf
+        transformer = get_transformer("EPSG:4326", crs)
+        xs, ys = transformer.transform(gdf.geometry.x.to_numpy(), gdf.geometry.y.to_numpy())
+        return gdf.set_geometry(gpd.points_from_xy(xs, ys, crs=crs))
 
-        # Create GeoDataFrame
-        gdf = gpd.GeoDataFrame(filtered, geometry=geometry, crs="EPSG:4326")
+    async def _load_stops(self) -> gpd.GeoDataFrame:
+        """Load GTFS stops as WGS84 points with a spatial index.
 
-        # Transform to target CRS if needed
-        if crs != "EPSG:4326":
-            gdf = gdf.to_crs(crs)
+        Geometries and the R-tree are built once, so bbox queries don't
+        rescan every stop.
 
-        return gdf
+        Returns:
+            GeoDataFrame of stops (empty if the feed has none)
+
+        Raises:
+            ValueError: If stops.txt lacks stop_lon / stop_lat columns
+        """
+        if self._stops is not None:
+            return self._stops
+
+        data = await self._load_gtfs_data()
+        stops = data.get("stops", pd.DataFrame())
+
+        if stops.empty:
+            self._stops = gpd.GeoDataFrame()
+            return self._stops
+
+        # Ensure required columns exist
+        if "stop_lon" not in stops.columns or "stop_lat" not in stops.columns:
+            raise ValueError("GTFS stops.txt missing stop_lon or stop_lat columns")
+
+        # Generic nodes and boarding areas (location_type 3/4) may lack coordinates
+        stops = stops.dropna(subset=["stop_lon", "stop_lat"])
+        if stops.empty:
+            self._stops = gpd.GeoDataFrame()
+            return self._stops
+
+        geometry = gpd.points_from_xy(stops["stop_lon"], stops["stop_lat"], crs="EPSG:4326")
+        self._stops = gpd.GeoDataFrame(stops, geometry=geometry)
+        # Build the R-tree now rather than on the first query
+        _ = self._stops.sindex
+        self._stops_bounds = tuple(float(v) for v in self._stops.total_bounds)  # type: ignore
+        return self._stops
 
     async def get_coverage(
         self,
@@ -4,15 +4,35 @@ Supports OGC API - Features (formerly WFS 3.0).
 Specification: https://ogcapi.ogc.org/features/
 """
 
-from typing import Any, Optional
-from urllib.parse import urljoin
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, TypeVar
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import geopandas as gpd
 import httpx
-
-from giskit.protocols.base import Protocol
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from giskit.core.spatial import (
+    get_transformer,
+    morton_key,
+    reproject_geodataframe,
+    subdivide_bbox,
+)
+from giskit.protocols.base import Protocol, loads_json
+from giskit.protocols.cityjson import cityjson_to_geodataframe
 from giskit.protocols.quirks import ProtocolQuirks
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
 
 class OGCFeaturesError(Exception):
     """Raised when OGC Features API requests fail."""
@@ -20,9 +40,308 @@ class OGCFeaturesError(Exception):
     pass
 
 
+def _id_fingerprints(ids: "gpd.pd.Series") -> np.ndarray:
+    """Hash feature ids to 64-bit fingerprints.
+
+    Keeps grid-walk deduplication memory at 8 bytes per feature instead of
+    one Python string object per id.
+
+    Args:
+        ids: Series of feature identifiers
+
+    Returns:
+        uint64 array of fingerprints, aligned with ids
+    """
+    return gpd.pd.util.hash_pandas_object(ids, index=False).to_numpy()
+
+
+# Attributes the temporal filter and grid deduplication rely on; they survive
+# a `properties` selection so those steps keep working
+_BOOKKEEPING_PROPERTIES = (
+    "identificatie",
+    "lokaal_id",
+    "eind_registratie",
+    "termination_date",
+    "tijdstip_registratie",
+    "version",
+)
+
+
+def _selected_properties(properties: Any) -> Optional[tuple[str, ...]]:
+    """Normalise a `properties` selection to the attribute names to keep.
+
+    Args:
+        properties: Attribute names as a list or comma-separated string (or None)
+
+    Returns:
+        Requested names followed by the bookkeeping attributes, or None to keep all
+    """
+    if not properties:
+        return None
+    if isinstance(properties, str):
+        properties = properties.split(",")
+    names = [name.strip() for name in properties if name.strip()]
+    return tuple(dict.fromkeys([*names, *_BOOKKEEPING_PROPERTIES]))
+
+
+# HTTP statuses worth retrying: rate limited or upstream temporarily unavailable
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _retry_delay(error: BaseException, attempt: int, base_delay: float) -> Optional[float]:
+    """Decide whether a failed request should be retried, and after how long.
+
+    Args:
+        error: Raised exception (OGCFeaturesError is unwrapped to its httpx cause)
+        attempt: Zero-based attempt number
+        base_delay: Backoff base in seconds
+
+    Returns:
+        Seconds to wait before retrying, or None if the error is not transient
+    """
+    if isinstance(error, OGCFeaturesError) and error.__cause__ is not None:
+        error = error.__cause__
+
+    # Exponential backoff: 2s, 4s, 8s
+    backoff = base_delay * (2**attempt)
+
+    if isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return backoff
+
+    if isinstance(error, httpx.HTTPStatusError):
+        if error.response.status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        # Honour the server's Retry-After (seconds form) when it asks for longer
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return max(backoff, float(retry_after))
+        return backoff
+
+    return None
+
+
+def _next_link(page: dict[str, Any]) -> Optional[str]:
+    """Return the href of a page's `next` link, if any.
+
+    Args:
+        page: Decoded items page
+
+    Returns:
+        URL of the next page, or None on the last page
+    """
+    return next(
+        (link.get("href") for link in page.get("links", ()) if link.get("rel") == "next"),
+        None,
+    )
+
+
+def _discard(future: asyncio.Future) -> None:
+    """Cancel a prefetch that is no longer needed.
+
+    A prefetch that already failed has its exception retrieved, so asyncio
+    doesn't log it as never retrieved.
+
+    Args:
+        future: Pending or finished prefetch
+    """
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()
+
+
+def _parse_geometries(features: list[dict[str, Any]]) -> np.ndarray:
+    """Parse the geometries of a page of GeoJSON features.
+
+    With orjson installed, geometries are re-serialized and parsed in one
+    vectorized shapely call. Without it, re-serializing costs more than it
+    saves, so each geometry is built with shape() as from_features does.
+
+    Args:
+        features: GeoJSON feature dicts
+
+    Returns:
+        Object array of shapely geometries (None for null geometries)
+    """
+    if orjson is None:
+        return np.array(
+            [
+                None if feature.get("geometry") is None else shape(feature["geometry"])
+                for feature in features
+            ],
+            dtype=object,
+        )
+
+    return shapely.from_geojson(
+        np.array(
+            [
+                None if feature.get("geometry") is None else orjson.dumps(feature["geometry"])
+                for feature in features
+            ],
+            dtype=object,
+        )
+    )
+
+
+def _frame_from_parts(
+    geometries: list[np.ndarray], properties: list[dict[str, Any]]
+) -> gpd.GeoDataFrame:
+    """Build one GeoDataFrame from geometries and properties of many pages.
+
+    Args:
+        geometries: Per-page geometry arrays (see _parse_geometries)
+        properties: Feature property dicts, aligned with the geometries
+
+    Returns:
+        GeoDataFrame in EPSG:4326 (geometry column first, as from_features)
+    """
+    frame = gpd.pd.DataFrame.from_records(properties)
+    frame.insert(0, "geometry", np.concatenate(geometries) if geometries else [])
+    return gpd.GeoDataFrame(frame, geometry="geometry", crs="EPSG:4326")
+
+
+def _align_dtypes(frames: list[gpd.GeoDataFrame]) -> None:
+    """Give all-null columns the dtype the column has in the other frames.
+
+    A page where an attribute is null everywhere decodes it as object dtype;
+    concatenating that with pages holding the real (e.g. int64 or datetime)
+    values would turn the whole column into Python objects. Casting the
+    all-null pieces first keeps the column typed and lets concat join
+    matching blocks directly.
+
+    Args:
+        frames: GeoDataFrames to be concatenated (modified in place)
+    """
+    if len(frames) < 2:
+        return
+
+    dtypes: dict[str, set] = {}
+    all_null: list[tuple[int, str]] = []
+    for index, frame in enumerate(frames):
+        for column, is_null in frame.isna().all().items():
+            if column == "geometry":
+                continue
+            if is_null:
+                all_null.append((index, column))
+            else:
+                dtypes.setdefault(column, set()).add(frame.dtypes[column])
+
+    casts: dict[int, dict[str, Any]] = {}
+    for index, column in all_null:
+        column_dtypes = dtypes.get(column)
+        if not column_dtypes or len(column_dtypes) > 1:
+            continue
+        (target,) = column_dtypes
+        if target.kind in "iu":
+            target = np.dtype("float64")  # integers can't hold NaN
+        elif target.kind == "b":
+            continue
+        if frames[index].dtypes[column] != target:
+            casts.setdefault(index, {})[column] = target
+
+    for index, frame_casts in casts.items():
+        frames[index] = frames[index].astype(frame_casts)
+
+
+def _concat_frames(frames: list[gpd.GeoDataFrame]) -> gpd.GeoDataFrame:
+    """Concatenate frames into one GeoDataFrame and release the inputs.
+
+    Column dtypes are aligned first (see _align_dtypes). The list is emptied
+    afterwards so the per-page/per-cell frames can be freed as soon as the
+    combined frame exists.
+
+    Args:
+        frames: GeoDataFrames to combine (emptied in place)
+
+    Returns:
+        Combined GeoDataFrame with a fresh RangeIndex
+    """
+    _align_dtypes(frames)
+    combined = gpd.GeoDataFrame(gpd.pd.concat(frames, ignore_index=True, copy=False))
+    frames.clear()
+    return combined
+
+
+def _temporal_instant(temporal: str) -> Optional[str]:
+    """Translate a temporal strategy to an OGC ``datetime`` instant.
+
+    Args:
+        temporal: 'active', 'latest', 'all', or an ISO date
+
+    Returns:
+        RFC 3339 instant, or None when the strategy has no single instant
+    """
+    if temporal == "active":
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if temporal.count("-") == 2:  # Looks like ISO date (YYYY-MM-DD)
+        try:
+            target = datetime.fromisoformat(temporal.replace("Z", ""))
+        except ValueError:
+            return None
+        return target.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return None
+
+
+# pandas >= 2 infers one datetime format from the first value unless told the
+# column is ISO 8601, which would turn e.g. fractional-second values into NaT
+_ISO8601_KWARGS = {"format": "ISO8601"} if int(gpd.pd.__version__.split(".")[0]) >= 2 else {}
+
+
+def _to_utc(values: "gpd.pd.Series") -> "gpd.pd.Series":
+    """Parse a column of ISO timestamps to UTC datetimes (NaT if missing/invalid)."""
+    return gpd.pd.to_datetime(values, errors="coerce", utc=True, **_ISO8601_KWARGS)
+
+
+def _valid_at(termination: "gpd.pd.Series", at: "gpd.pd.Timestamp") -> np.ndarray:
+    """Mask rows that are not terminated at the given moment.
+
+    A row is valid when its termination date is missing, empty, or later
+    than at. Timestamps are parsed once and compared as datetimes, so
+    timezone offsets are taken into account.
+
+    Args:
+        termination: Series of ISO termination timestamps
+        at: UTC timestamp to test against
+
+    Returns:
+        Boolean array aligned with termination
+    """
+    terminated_at = _to_utc(termination)
+    return (terminated_at.isna() | (terminated_at > at)).to_numpy()
+
+
+def _keep_latest_per_id(gdf: gpd.GeoDataFrame, id_field: str, ts_col: str) -> gpd.GeoDataFrame:
+    """Keep the row with the highest ts_col value per id_field.
+
+    Uses a hash groupby + idxmax instead of sorting the whole frame. IDs
+    without any ts_col value keep their first occurrence.
+
+    Args:
+        gdf: GeoDataFrame with possibly repeated IDs
+        id_field: Feature ID column
+        ts_col: Column to maximise (timestamp or version)
+
+    Returns:
+        GeoDataFrame with one row per ID, in original row order
+    """
+    if gdf[id_field].is_unique:
+        return gdf
+    if not gdf.index.is_unique:
+        gdf = gdf.reset_index(drop=True)
+
+    has_ts = gdf[ts_col].notna()
+    latest = gdf[has_ts].groupby(id_field, sort=False, dropna=False)[ts_col].idxmax()
+    undated = gdf[~has_ts & ~gdf[id_field].isin(latest.index)]
+    keep = latest.to_numpy().tolist() + undated.drop_duplicates(subset=id_field).index.tolist()
+    return gdf[gdf.index.isin(keep)]
+
+
 class OGCFeaturesProtocol(Protocol):
     """OGC API Features protocol implementation with quirk support."""
 
+    # Seconds a fetched collections list is reused before refetching
+    capabilities_ttl: float = 300.0
+
     def __init__(
         self,
         base_url: str,
@@ -51,48 +370,155 @@ class OGCFeaturesProtocol(Protocol):
         self.timeout = self.quirks.get_timeout(timeout)
         self.max_features_per_request = max_features_per_request
 
+        # Query params that never change for this service, computed once
+        self._format_params = self.quirks.apply_to_params({})
+        self._static_params = {**self._bbox_crs_params(), **self._format_params}
+        # Header quirks, sent per request so the client can be shared
+        self._headers = self.quirks.apply_to_headers({})
+
+        # (fetch time, capabilities) - see get_capabilities
+        self._capabilities_cache: Optional[tuple[float, dict[str, Any]]] = None
+        self._collections: list[dict[str, Any]] = []
+
+        # Shared by all collections downloading at once, so concurrent
+        # collections don't each get their own max_concurrent_pages budget.
+        # Kept per event loop, as a semaphore can't be shared across loops.
+        self._page_semaphore: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+    def _bbox_crs_params(self) -> dict[str, str]:
+        """Build the bbox-crs query parameter for this service.
+
+        Returns:
+            {"bbox-crs": uri}, or an empty dict if the API doesn't support it
+        """
+        # Add bbox-crs parameter to explicitly specify CRS of bbox coordinates
+        # OGC API Features spec recommends always including this for clarity
+        # However, some APIs (like BAG3D) don't support this parameter
+        if self.quirks.omit_bbox_crs_param:
+            return {}
+        if self.quirks.bbox_crs and self.quirks.bbox_crs != "EPSG:4326":
+            # Bbox was transformed to RD or other CRS - specify the transformed CRS
+            epsg_code = self.quirks.bbox_crs.split(":")[1]
+            return {"bbox-crs": f"http://www.opengis.net/def/crs/EPSG/0/{epsg_code}"}
+        # Using WGS84 - explicitly specify CRS84 (OGC standard for WGS84 lon/lat)
+        return {"bbox-crs": "http://www.opengis.net/def/crs/OGC/1.3/CRS84"}
+
+    def invalidate_capabilities(self) -> None:
+        """Drop cached capabilities so the next call refetches collections."""
+        self._capabilities_cache = None
+        self._collections = []
+
     async def get_capabilities(self) -> dict[str, Any]:
         """Get service capabilities from collections endpoint.
 
+        Results are cached per instance for `capabilities_ttl` seconds.
+
         Returns:
             Dictionary with service metadata
         """
+        if self._capabilities_cache is not None:
+            fetched_at, cached = self._capabilities_cache
+            if time.monotonic() - fetched_at < self.capabilities_ttl:
+                return cached
+
         client = await self._get_client()
 
         try:
-            # Build request params with quirks applied
-            params = self.quirks.apply_to_params({})
-
-            # Get collections list
-            response = await client.get(urljoin(self.base_url, "collections"), params=params)
+            # Get collections list (request params with quirks applied)
+            response = await client.get(
+                urljoin(self.base_url, "collections"),
+                params=self._format_params,
+                headers=self._headers,
+            )
             response.raise_for_status()
-            data = response.json()
+            data = loads_json(response.content)
 
             collections = data.get("collections", [])
 
+            # Raw collection entries are kept for extent pruning
+            self._collections = collections
+
             # Extract layer names and metadata
-            layers = []
-            for coll in collections:
-                layers.append(
-                    {
-                        "id": coll.get("id"),
-                        "title": coll.get("title"),
-                        "description": coll.get("description"),
-                        "extent": coll.get("extent"),
-                    }
-                )
+            layers = [
+                {
+                    "id": coll.get("id"),
+                    "title": coll.get("title"),
+                    "description": coll.get("description"),
+                    "extent": coll.get("extent"),
+                    "bbox": self._extent_bbox(coll.get("extent") or {}),
+                }
+                for coll in collections
+            ]
 
-            return {
+            capabilities = {
                 "title": data.get("title", "Unknown"),
                 "layers": [layer["id"] for layer in layers],
                 "layer_details": layers,
                 "crs": ["EPSG:4326"],  # OGC Features always supports WGS84
                 "formats": ["application/geo+json"],
             }
+            self._capabilities_cache = (time.monotonic(), capabilities)
+            return capabilities
 
         except httpx.HTTPError as e:
             raise OGCFeaturesError(f"Failed to get capabilities: {e}") from e
 
+    async def get_layer_details(self) -> list[dict[str, Any]]:
+        """Get per-collection metadata (title, description, extent).
+
+        Same list as the "layer_details" entry of get_capabilities().
+
+        Returns:
+            List of dicts with id, title, description, extent and CRS84 bbox
+        """
+        capabilities = await self.get_capabilities()
+        return capabilities["layer_details"]  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _extent_bbox(extent: dict[str, Any]) -> Optional[tuple[float, float, float, float]]:
+        """Extract the overall spatial bbox from a collection extent.
+
+        Args:
+            extent: Collection `extent` object from the collections endpoint
+
+        Returns:
+            (minx, miny, maxx, maxy) in CRS84, or None if not published
+        """
+        spatial = extent.get("spatial") or {}
+        # Only the default CRS84 extent can be compared to a WGS84 bbox
+        if spatial.get("crs", "http://www.opengis.net/def/crs/OGC/1.3/CRS84").endswith("CRS84"):
+            bboxes = spatial.get("bbox") or []
+            # First bbox is the overall extent; 6 values means 3D (minz/maxz)
+            if bboxes and len(bboxes[0]) in (4, 6):
+                first = bboxes[0]
+                if len(first) == 6:
+                    extent_bbox = (first[0], first[1], first[3], first[4])
+                else:
+                    extent_bbox = (first[0], first[1], first[2], first[3])
+                # Antimeridian-crossing extents (minx > maxx) are not pruned
+                if extent_bbox[0] <= extent_bbox[2]:
+                    return extent_bbox
+        return None
+
+    @staticmethod
+    def _bboxes_intersect(
+        a: tuple[float, float, float, float], b: tuple[float, float, float, float]
+    ) -> bool:
+        """Check whether two (minx, miny, maxx, maxy) bboxes overlap."""
+        return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+    @staticmethod
+    def _bbox_contains(
+        outer: tuple[float, float, float, float], inner: tuple[float, float, float, float]
+    ) -> bool:
+        """Check whether bbox outer fully covers bbox inner."""
+        return (
+            outer[0] <= inner[0]
+            and outer[1] <= inner[1]
+            and outer[2] >= inner[2]
+            and outer[3] >= inner[3]
+        )
+
     async def get_features(
         self,
         bbox: tuple[float, float, float, float],
@@ -114,7 +540,10 @@ class OGCFeaturesProtocol(Protocol):
                 - 'active': Only currently valid/active features
                 - 'all': All historical versions
                 - ISO date (e.g. '2024-01-01'): Features valid at that date
-            **kwargs: Additional query parameters
+            **kwargs: Additional query parameters. ``properties`` (list or
+                comma-separated names) limits the attributes returned; it is sent
+                to the server when the supports_properties_param quirk is set and
+                otherwise applied while parsing.
 
         Returns:
             GeoDataFrame with downloaded features
@@ -124,8 +553,21 @@ class OGCFeaturesProtocol(Protocol):
 
         # Get available collections if not specified
         if layers is None:
-            capabilities = await self.get_capabilities()
-            layers = capabilities["layers"]
+            await self.get_capabilities()
+            layers = []
+            skipped: list[str] = []
+            for coll in self._collections:
+                coll_id = coll.get("id")
+                if coll_id is None:
+                    continue  # Can't be requested without an id
+                # Skip collections whose published extent can't overlap the request
+                extent_bbox = self._extent_bbox(coll.get("extent") or {})
+                if extent_bbox and not self._bboxes_intersect(extent_bbox, bbox):
+                    skipped.append(str(coll_id))
+                else:
+                    layers.append(coll_id)
+            if skipped:
+                print(f"  Skipping {len(skipped)} collection(s) outside bbox: {', '.join(skipped)}")
 
         if not layers:
             # Return empty GeoDataFrame
@@ -137,11 +579,11 @@ class OGCFeaturesProtocol(Protocol):
         if self.quirks.bbox_crs:
             bbox_crs = self.quirks.bbox_crs
             if bbox_crs != "EPSG:4326":
-                from pyproj import Transformer
-
-                transformer = Transformer.from_crs("EPSG:4326", bbox_crs, always_xy=True)
-                minx, miny = transformer.transform(bbox[0], bbox[1])
-                maxx, maxy = transformer.transform(bbox[2], bbox[3])
+                # Transform both corners in one call
+                transformer = get_transformer("EPSG:4326", bbox_crs)
+                (minx, maxx), (miny, maxy) = transformer.transform(
+                    [bbox[0], bbox[2]], [bbox[1], bbox[3]]
+                )
                 request_bbox = (minx, miny, maxx, maxy)
                 bbox_crs_str = bbox_crs
 
@@ -167,44 +609,61 @@ class OGCFeaturesProtocol(Protocol):
                 # Use 250m grid cells - small enough to avoid limits, large enough to be efficient
                 grid_cell_size = 250.0  # meters
 
-        # Download each collection
+        # Published CRS84 extents of known collections; a request covering the
+        # whole extent is sent without a bbox filter
+        extents = {
+            coll.get("id"): self._extent_bbox(coll.get("extent") or {})
+            for coll in self._collections
+        }
+
+        async def download(collection_id: str) -> gpd.GeoDataFrame:
+            """Download one collection, grid walking when the area calls for it."""
+            if use_grid_walking and grid_cell_size:
+                return await self._download_collection_with_grid(
+                    client,
+                    collection_id,
+                    request_bbox,
+                    grid_cell_size,
+                    bbox_crs_str,
+                    limit,
+                    temporal,
+                    max_concurrent=self.quirks.max_concurrent_cells,
+                    **kwargs,
+                )
+            extent_bbox = extents.get(collection_id)
+            if extent_bbox and self._bbox_contains(bbox, extent_bbox):
+                return await self._download_collection(
+                    client, collection_id, None, limit, temporal, **kwargs
+                )
+            return await self._download_collection(
+                client, collection_id, request_bbox, limit, temporal, **kwargs
+            )
+
+        # Download all collections concurrently - each is an independent paging session
+        results = await asyncio.gather(
+            *(download(collection_id) for collection_id in layers), return_exceptions=True
+        )
+
         all_gdfs = []
-        for collection_id in layers:
-            try:
-                if use_grid_walking and grid_cell_size:
-                    gdf = await self._download_collection_with_grid(
-                        client,
-                        collection_id,
-                        request_bbox,
-                        grid_cell_size,
-                        bbox_crs_str,
-                        limit,
-                        temporal,
-                        max_concurrent=self.quirks.max_concurrent_cells,
-                        **kwargs,
-                    )
-                else:
-                    gdf = await self._download_collection(
-                        client, collection_id, request_bbox, limit, temporal, **kwargs
-                    )
-                if not gdf.empty:
-                    # Add source collection column
-                    gdf["_collection"] = collection_id
-                    all_gdfs.append(gdf)
-            except Exception as e:
+        for collection_id, result in zip(layers, results, strict=True):
+            if isinstance(result, BaseException):
                 # Log error but continue with other collections
-                print(f"Warning: Failed to download {collection_id}: {e}")
+                print(f"Warning: Failed to download {collection_id}: {result}")
+            elif not result.empty:
+                # Add source collection column
+                result["_collection"] = collection_id
+                all_gdfs.append(result)
 
         if not all_gdfs:
             # Return empty GeoDataFrame
             return gpd.GeoDataFrame()
 
         # Combine all collections
-        combined = gpd.GeoDataFrame(gpd.pd.concat(all_gdfs, ignore_index=True))
+        combined = _concat_frames(all_gdfs)
 
-        # Reproject if needed
+        # Reproject if needed (a no-op when the result is already in crs)
         if crs != "EPSG:4326" and not combined.empty:
-            combined = combined.to_crs(crs)
+            combined = reproject_geodataframe(combined, crs)
 
         return combined
 
@@ -242,18 +701,46 @@ class OGCFeaturesProtocol(Protocol):
         Returns:
             GeoDataFrame with deduplicated features from all cells
         """
-        import asyncio
-
-        from giskit.core.spatial import subdivide_bbox
-
-        # Subdivide bbox into grid cells
+        # Subdivide bbox into grid cells, keyed by (col, row) grid position
         cells = subdivide_bbox(bbox, grid_cell_size, crs=bbox_crs)
+        cell_keys = [
+            (
+                round((cell[0] - bbox[0]) / grid_cell_size),
+                round((cell[1] - bbox[1]) / grid_cell_size),
+            )
+            for cell in cells
+        ]
+
+        # Walk cells along a Z-order curve so neighbours are downloaded close
+        # together in time and their dedup sets can be dropped early
+        order = sorted(range(len(cells)), key=lambda i: morton_key(*cell_keys[i]))
+        cells = [cells[i] for i in order]
+        cell_keys = [cell_keys[i] for i in order]
         print(f"  Splitting area into {len(cells)} grid cells ({grid_cell_size}m each)...")
         print(f"  Downloading with max {max_concurrent} concurrent requests...")
 
+        # Query params are the same for every cell except the bbox
+        base_params = self._build_base_params(None, temporal, **kwargs)
+
         # Download cells in batches to limit concurrency
         all_gdfs = []
-        seen_ids = set()  # For deduplication
+        # Id fingerprints per grid cell (col, row). A feature can only be returned
+        # by cells its extent touches, so each cell is deduplicated against its
+        # already-processed neighbours instead of everything seen so far.
+        cell_hashes: dict[tuple[int, int], set[int]] = {}
+        processed: set[tuple[int, int]] = set()
+        known_cells = set(cell_keys)
+
+        def neighbours(key: tuple[int, int]) -> list[tuple[int, int]]:
+            """Grid cells adjacent to key (including diagonals)."""
+            col, row = key
+            return [
+                (col + dc, row + dr)
+                for dc in (-1, 0, 1)
+                for dr in (-1, 0, 1)
+                if (dc or dr) and (col + dc, row + dr) in known_cells
+            ]
+
         total_features = 0
 
         # Process cells in batches
@@ -280,20 +767,17 @@ class OGCFeaturesProtocol(Protocol):
                             cell_bbox,
                             limit=None,
                             temporal=temporal,
-                            **kwargs,
+                            base_params=base_params,
+                            properties=kwargs.get("properties"),
                         )
                         return (cell_idx, gdf, None)
                     except Exception as e:
                         error_msg = str(e)
-                        # Check if it's a retryable error (timeout, 504, 503, connection errors)
-                        is_retryable = any(
-                            keyword in error_msg.lower()
-                            for keyword in ["timeout", "504", "503", "connection", "temporary"]
-                        )
+                        # Only transient failures (timeouts, connection errors,
+                        # 429/502/503/504) are retried
+                        delay = _retry_delay(e, attempt, base_delay)
 
-                        if attempt < max_retries - 1 and is_retryable:
-                            # Exponential backoff: 2s, 4s, 8s
-                            delay = base_delay * (2**attempt)
+                        if attempt < max_retries - 1 and delay is not None:
                             print(
                                 f"  Cell {cell_idx}: Retry {attempt + 1}/{max_retries} after {delay}s (error: {error_msg})"
                             )
@@ -316,6 +800,9 @@ class OGCFeaturesProtocol(Protocol):
 
             # Process results from this batch
             for cell_idx, gdf, error in results:
+                key = cell_keys[cell_idx - 1]
+                processed.add(key)
+
                 if error:
                     print(f"  Cell {cell_idx}/{len(cells)}: Failed - {error}")
                     continue
@@ -326,10 +813,18 @@ class OGCFeaturesProtocol(Protocol):
 
                 # Deduplicate features based on 'identificatie' or index
                 if "identificatie" in gdf.columns:
-                    # Filter out features we've already seen
-                    new_mask = ~gdf["identificatie"].isin(seen_ids)
-                    gdf = gdf[new_mask]
-                    seen_ids.update(gdf["identificatie"])
+                    # Filter out features already returned by a neighbouring cell
+                    neighbour_sets = [cell_hashes[n] for n in neighbours(key) if n in cell_hashes]
+                    hashes = _id_fingerprints(gdf["identificatie"]).tolist()
+                    if not all(n in processed for n in neighbours(key)):
+                        cell_hashes[key] = set(hashes)
+                    if neighbour_sets:
+                        new_mask = np.fromiter(
+                            (not any(h in seen for seen in neighbour_sets) for h in hashes),
+                            dtype=bool,
+                            count=len(hashes),
+                        )
+                        gdf = gdf[new_mask]
 
                 if not gdf.empty:
                     all_gdfs.append(gdf)
@@ -342,6 +837,10 @@ class OGCFeaturesProtocol(Protocol):
                 else:
                     print(f"  Cell {cell_idx}/{len(cells)}: 0 new features (all duplicates)")
 
+            # A cell's ids are only needed until all of its neighbours are done
+            for done in [k for k in cell_hashes if all(n in processed for n in neighbours(k))]:
+                del cell_hashes[done]
+
             # Check if we've reached the limit
             if limit and total_features >= limit:
                 print(f"  Reached limit of {limit:,} features, stopping...")
@@ -351,7 +850,12 @@ class OGCFeaturesProtocol(Protocol):
             return gpd.GeoDataFrame()
 
         # Combine all cells
-        combined = gpd.GeoDataFrame(gpd.pd.concat(all_gdfs, ignore_index=True))
+        combined = _concat_frames(all_gdfs)
+
+        # Backstop for features larger than a cell (seen by non-adjacent cells).
+        # With temporal='all' repeated ids are legitimate versions, so keep them.
+        if temporal != "all" and "identificatie" in combined.columns:
+            combined = combined.drop_duplicates(subset="identificatie", ignore_index=True)
 
         # Apply limit if needed
         if limit and len(combined) > limit:
@@ -361,13 +865,56 @@ class OGCFeaturesProtocol(Protocol):
 
         return combined
 
+    def _build_base_params(
+        self, limit: Optional[int], temporal: str = "latest", **kwargs: Any
+    ) -> dict[str, Any]:
+        """Build the query parameters shared by every request for a collection.
+
+        Everything except ``bbox``, so grid walking can build them once and
+        only vary the bbox per cell.
+
+        Args:
+            limit: Feature limit (total, not per page)
+            temporal: Temporal filter strategy (pushed down as ``datetime``)
+            **kwargs: Additional query parameters
+
+        Returns:
+            Query parameters with quirks applied
+        """
+        # Use smaller page size for pagination
+        # If API has max_features_limit quirk, respect it
+        default_page_limit = 1000
+        if self.quirks.max_features_limit:
+            page_limit = self.quirks.max_features_limit
+        else:
+            page_limit = min(limit or self.max_features_per_request, default_page_limit)
+
+        properties = _selected_properties(kwargs.pop("properties", None))
+        params = {
+            "limit": page_limit,
+            **kwargs,
+            **self._static_params,
+        }
+        if properties and self.quirks.supports_properties_param:
+            params["properties"] = ",".join(properties)
+
+        # Let the server drop versions that aren't valid at the requested moment.
+        # _apply_temporal_filter still runs client-side for servers ignoring it.
+        if self.quirks.supports_datetime_param and "datetime" not in params:
+            instant = _temporal_instant(temporal)
+            if instant:
+                params["datetime"] = instant
+
+        return params
+
     async def _download_collection(
         self,
         client: httpx.AsyncClient,
         collection_id: str,
-        bbox: tuple[float, float, float, float],
+        bbox: Optional[tuple[float, float, float, float]],
         limit: Optional[int],
         temporal: str = "latest",
+        base_params: Optional[dict[str, Any]] = None,
         **kwargs: Any,
     ) -> gpd.GeoDataFrame:
         """Download a single collection with pagination support.
@@ -375,9 +922,10 @@ class OGCFeaturesProtocol(Protocol):
         Args:
             client: HTTP client
             collection_id: Collection ID (may include LOD prefix like "lod22")
-            bbox: Bounding box
+            bbox: Bounding box (None = whole collection, no bbox filter)
             limit: Feature limit (total, not per page)
             temporal: Temporal filter strategy ('latest', 'active', 'all', or ISO date)
+            base_params: Prebuilt params from _build_base_params (built if None)
             **kwargs: Additional parameters
 
         Returns:
@@ -391,46 +939,27 @@ class OGCFeaturesProtocol(Protocol):
 
         url = urljoin(self.base_url, f"collections/{actual_collection_id}/items")
 
-        # Build query parameters with quirks applied
-        # Use smaller page size for pagination
-        # If API has max_features_limit quirk, respect it
-        default_page_limit = 1000
-        if self.quirks.max_features_limit:
-            page_limit = self.quirks.max_features_limit
+        if base_params is None:
+            base_params = self._build_base_params(limit, temporal, **kwargs)
+        params = dict(base_params)
+        if bbox is not None:
+            params["bbox"] = f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}"
         else:
-            page_limit = min(limit or self.max_features_per_request, default_page_limit)
+            params.pop("bbox-crs", None)
+        page_limit = params["limit"]
+        keep = _selected_properties(kwargs.get("properties"))
 
-        params = {
-            "bbox": ",".join(map(str, bbox)),
-            "limit": page_limit,
-            **kwargs,
-        }
-
-        # Add bbox-crs parameter to explicitly specify CRS of bbox coordinates
-        # OGC API Features spec recommends always including this for clarity
-        # However, some APIs (like BAG3D) don't support this parameter
-        if not self.quirks.omit_bbox_crs_param:
-            if self.quirks.bbox_crs and self.quirks.bbox_crs != "EPSG:4326":
-                # Bbox was transformed to RD or other CRS - specify the transformed CRS
-                params[
-                    "bbox-crs"
-                ] = f"http://www.opengis.net/def/crs/EPSG/0/{self.quirks.bbox_crs.split(':')[1]}"
-            else:
-                # Using WGS84 - explicitly specify CRS84 (OGC standard for WGS84 lon/lat)
-                params["bbox-crs"] = "http://www.opengis.net/def/crs/OGC/1.3/CRS84"
-
-        params = self.quirks.apply_to_params(params)
-
-        all_gdfs = []
+        all_gdfs: list[gpd.GeoDataFrame] = []  # CityJSON pages
+        all_geometries: list[np.ndarray] = []  # GeoJSON pages
+        all_properties: list[dict[str, Any]] = []
         total_features = 0
+        fetched_features = 0  # Raw features received (CityJSON rows may differ)
         next_url = None
         page_num = 1
 
         try:
             # Download first page
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            geojson = response.json()
+            geojson = await self._get_page(client, url, params)
 
             # Check if we know total count for progress indicator
             total_matched = geojson.get("numberMatched")
@@ -451,65 +980,148 @@ class OGCFeaturesProtocol(Protocol):
                         if len(lod_num) == 2:
                             lod = f"{lod_num[0]}.{lod_num[1]}"
 
-            # Process all pages
-            while True:
-                if "features" not in geojson or not geojson["features"]:
-                    break
+            # Pick the page parser once - the format doesn't change between pages.
+            # A parser reduces a decoded page to compact columns right away, so
+            # the page's feature dicts can be released before the next one arrives.
+            if is_cityjson:
+                def parse_page(page: dict[str, Any]) -> tuple[int, Any]:
+                    """Convert one page of CityJSON features to a GeoDataFrame."""
+                    # Pages carry their own vertex transform, so they're converted
+                    # one by one and concatenated at the end
+                    if not page.get("features"):
+                        return 0, gpd.GeoDataFrame()
+                    page_gdf = cityjson_to_geodataframe(page, lod=lod, crs="EPSG:28992")
+                    return len(page["features"]), page_gdf
+
+                def collect_frame(page_gdf: gpd.GeoDataFrame) -> int:
+                    if page_gdf.empty:
+                        return 0
+                    all_gdfs.append(page_gdf)
+                    return len(page_gdf)
+
+                collect: Callable[[Any], int] = collect_frame
 
-                # Parse this page
-                if is_cityjson:
-                    from giskit.protocols.cityjson import cityjson_to_geodataframe
+            else:
 
-                    gdf = cityjson_to_geodataframe(geojson, lod=lod)
-                    if not gdf.empty:
-                        gdf.set_crs("EPSG:28992", inplace=True)
+                def parse_page(page: dict[str, Any]) -> tuple[int, Any]:
+                    """Extract geometries and properties of one GeoJSON page."""
+                    features = page.get("features") or []
+                    if keep:
+                        # Copy only the selected attributes (a no-op filter when
+                        # the server already applied the selection)
+                        properties = [
+                            {name: props[name] for name in keep if name in props}
+                            for props in (feature.get("properties") or {} for feature in features)
+                        ]
+                    else:
+                        properties = [feature.get("properties") or {} for feature in features]
+                    return len(features), (_parse_geometries(features), properties)
+
+                def collect_columns(part: tuple[np.ndarray, list[dict[str, Any]]]) -> int:
+                    # A single GeoDataFrame is built from all pages at the end
+                    geometries, properties = part
+                    all_geometries.append(geometries)
+                    all_properties.extend(properties)
+                    return len(properties)
+
+                collect = collect_columns
+
+            def add_page(parsed: tuple[int, Any], page: int) -> None:
+                """Collect a parsed page, update the counters and show progress."""
+                nonlocal total_features, fetched_features
+                raw_count, part = parsed
+                fetched_features += raw_count
+                count = collect(part)
+                if not count:
+                    return
+                total_features += count
+
+                # Show progress
+                if total_matched:
+                    progress_pct = (total_features / total_matched) * 100
+                    print(
+                        f"  Progress: {total_features:,}/{total_matched:,} ({progress_pct:.0f}%) - page {page}",
+                        flush=True,
+                    )
                 else:
-                    gdf = gpd.GeoDataFrame.from_features(geojson["features"])
-                    gdf.set_crs("EPSG:4326", inplace=True)
+                    print(
+                        f"  Downloaded {total_features:,} features (page {page})",
+                        flush=True,
+                    )
 
-                if not gdf.empty:
-                    all_gdfs.append(gdf)
-                    total_features += len(gdf)
-
-                    # Show progress
-                    if total_matched:
-                        progress_pct = (total_features / total_matched) * 100
-                        print(
-                            f"  Progress: {total_features:,}/{total_matched:,} ({progress_pct:.0f}%) - page {page_num}",
-                            flush=True,
-                        )
-                    else:
-                        print(
-                            f"  Downloaded {total_features:,} features (page {page_num})",
-                            flush=True,
+            # Process all pages. Each page is parsed in a worker thread while the
+            # request for the next one is already in flight.
+            following: Optional[asyncio.Future] = None
+            try:
+                while True:
+                    # Empty page - nothing to parse, and nothing after it
+                    if not geojson.get("features"):
+                        break
+
+                    next_url = _next_link(geojson)
+                    raw_count = len(geojson["features"])
+
+                    # Everything the server matched is in - don't fetch a trailing empty page
+                    if total_matched and fetched_features + raw_count >= total_matched:
+                        next_url = None
+
+                    # When the total is known and the next link pages by offset, all
+                    # remaining pages can be requested up front instead of one by one
+                    page_urls = None
+                    if next_url and page_num == 1 and total_matched:
+                        page_urls = self._offset_page_urls(next_url, total_matched, limit)
+
+                    # Start the next download now, unless this page may already
+                    # complete the limit
+                    if next_url and not (limit and total_features + raw_count >= limit):
+                        following = asyncio.ensure_future(
+                            self._fetch_pages(client, page_urls, parse_page)
+                            if page_urls
+                            else self._get_page(client, next_url)
                         )
 
-                # Check if we've reached the limit
-                if limit and total_features >= limit:
-                    break
+                    # Parse this page, then drop the decoded page
+                    add_page(await asyncio.to_thread(parse_page, geojson), page_num)
+                    del geojson
+
+                    # Check if we've reached the limit
+                    if limit and total_features >= limit:
+                        break
 
-                # Check for next page link
-                next_url = None
-                if "links" in geojson:
-                    for link in geojson["links"]:
-                        if link.get("rel") == "next":
-                            next_url = link.get("href")
-                            break
+                    # Check for next page link
+                    if not next_url:
+                        break  # No more pages
 
-                if not next_url:
-                    break  # No more pages
+                    if following is None:
+                        following = asyncio.ensure_future(
+                            self._fetch_pages(client, page_urls, parse_page)
+                            if page_urls
+                            else self._get_page(client, next_url)
+                        )
 
-                # Fetch next page
-                page_num += 1
-                response = await client.get(next_url)
-                response.raise_for_status()
-                geojson = response.json()
+                    if page_urls:
+                        for page, parsed in enumerate(await following, start=page_num + 1):
+                            add_page(parsed, page)
+                        break
+
+                    # Continue with the next page
+                    page_num += 1
+                    geojson = await following
+                    following = None
+            finally:
+                if following is not None:
+                    _discard(following)
 
             # Combine all pages
-            if not all_gdfs:
+            if not total_features:
                 return gpd.GeoDataFrame()
 
-            combined = gpd.GeoDataFrame(gpd.pd.concat(all_gdfs, ignore_index=True))
+            if is_cityjson:
+                combined = _concat_frames(all_gdfs)
+            else:
+                combined = _frame_from_parts(all_geometries, all_properties)
+                all_geometries.clear()
+                all_properties.clear()
 
             # Apply temporal filtering based on strategy
             combined = self._apply_temporal_filter(combined, temporal)
@@ -523,6 +1135,106 @@ class OGCFeaturesProtocol(Protocol):
         except httpx.HTTPError as e:
             raise OGCFeaturesError(f"Failed to download collection {collection_id}: {e}") from e
 
+    def _offset_page_urls(
+        self, next_url: str, total_matched: int, limit: Optional[int]
+    ) -> Optional[list[str]]:
+        """Build the URLs of all remaining pages from the first `next` link.
+
+        Only works when the server pages with an ``offset`` or ``startindex``
+        query parameter; cursor-based pagination has to be followed link by link.
+
+        Args:
+            next_url: Href of the first page's `next` link
+            total_matched: numberMatched reported by the first page
+            limit: Feature limit (total, not per page)
+
+        Returns:
+            URLs for pages 2..N, or None if pages can't be addressed by offset
+        """
+        if self.quirks.pagination_broken:
+            return None
+
+        parts = urlsplit(next_url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        offset_param = next(
+            (key for key, _ in query if key.lower() in ("offset", "startindex")), None
+        )
+        if offset_param is None:
+            return None
+
+        try:
+            page_size = int(dict(query)[offset_param])
+        except ValueError:
+            return None
+        if page_size <= 0:
+            return None
+
+        end = min(total_matched, limit) if limit else total_matched
+        urls = []
+        for offset in range(page_size, end, page_size):
+            page_query = [
+                (key, str(offset) if key == offset_param else value) for key, value in query
+            ]
+            urls.append(urlunsplit(parts._replace(query=urlencode(page_query))))
+        return urls
+
+    async def _get_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Fetch and decode one page of items.
+
+        The body is decoded in a worker thread and released right after, so a
+        page is never held as raw bytes and as decoded objects at the same time
+        for longer than the decode itself.
+
+        Args:
+            client: HTTP client
+            url: Items URL
+            params: Query parameters (None for pre-built `next` links)
+
+        Returns:
+            Decoded page
+        """
+        response = await client.get(url, params=params, headers=self._headers)
+        response.raise_for_status()
+        return await asyncio.to_thread(loads_json, response.content)
+
+    async def _fetch_pages(
+        self,
+        client: httpx.AsyncClient,
+        page_urls: list[str],
+        parse_page: Callable[[dict[str, Any]], T],
+    ) -> list[T]:
+        """Fetch pages concurrently, bounded by the max_concurrent_pages quirk.
+
+        The bound applies across the whole protocol instance, including
+        other collections fetching pages at the same time. Each page is parsed
+        in a worker thread as soon as it arrives, so only parsed results - not
+        decoded pages - wait for the slowest request.
+
+        Args:
+            client: HTTP client
+            page_urls: Page URLs to fetch
+            parse_page: Reduces a decoded page to what the caller keeps
+
+        Returns:
+            Parsed pages in the same order as page_urls
+        """
+        loop = asyncio.get_running_loop()
+        if self._page_semaphore is None or self._page_semaphore[0] is not loop:
+            self._page_semaphore = (loop, asyncio.Semaphore(self.quirks.max_concurrent_pages))
+        semaphore = self._page_semaphore[1]
+
+        async def fetch_page(page_url: str) -> T:
+            async with semaphore:
+                page = await self._get_page(client, page_url)
+            return await asyncio.to_thread(parse_page, page)
+
+        return await asyncio.gather(*(fetch_page(page_url) for page_url in page_urls))
+
     def _apply_temporal_filter(
         self, gdf: gpd.GeoDataFrame, temporal: str = "latest"
     ) -> gpd.GeoDataFrame:
@@ -556,14 +1268,8 @@ class OGCFeaturesProtocol(Protocol):
             # Filter to only active/valid features (no termination date or future termination)
             if "termination_date" in gdf.columns:
                 # Keep features where termination_date is null or in the future
-                from datetime import datetime
-
-                now = datetime.now().isoformat() + "Z"
-                gdf = gdf[
-                    (gdf["termination_date"].isna())
-                    | (gdf["termination_date"] == "")
-                    | (gdf["termination_date"] > now)
-                ]
+                now = gpd.pd.Timestamp.now(tz="UTC")
+                gdf = gdf[_valid_at(gdf["termination_date"], now)]
             # If no termination_date field, fall back to 'latest' behavior
             temporal = "latest"
 
@@ -582,13 +1288,11 @@ class OGCFeaturesProtocol(Protocol):
 
             # Then, keep newest version per feature ID (for true duplicates with same ID)
             if "tijdstip_registratie" in gdf.columns:
-                # Sort by timestamp descending, keep first (newest) per ID
-                gdf = gdf.sort_values("tijdstip_registratie", ascending=False)
-                gdf = gdf.drop_duplicates(subset=id_field, keep="first")
+                # Keep newest registration per ID
+                gdf = _keep_latest_per_id(gdf, id_field, "tijdstip_registratie")
             elif "version" in gdf.columns:
                 # Fallback to version field
-                gdf = gdf.sort_values("version", ascending=False)
-                gdf = gdf.drop_duplicates(subset=id_field, keep="first")
+                gdf = _keep_latest_per_id(gdf, id_field, "version")
             else:
                 # No timestamp - just keep first occurrence
                 gdf = gdf.drop_duplicates(subset=id_field, keep="first")
@@ -596,28 +1300,22 @@ class OGCFeaturesProtocol(Protocol):
         elif temporal.count("-") == 2:  # Looks like ISO date (YYYY-MM-DD)
             # Filter to features valid at specific date
             try:
-                from datetime import datetime
-
                 target_date = datetime.fromisoformat(temporal.replace("Z", ""))
-                target_iso = target_date.isoformat() + "Z"
+                target = gpd.pd.Timestamp(target_date)
+                target = target.tz_localize("UTC") if target.tzinfo is None else target
 
                 # Keep features where:
                 # - tijdstip_registratie <= target_date
                 # - AND (termination_date is null OR termination_date > target_date)
                 if "tijdstip_registratie" in gdf.columns:
-                    gdf = gdf[gdf["tijdstip_registratie"] <= target_iso]
+                    gdf = gdf[(_to_utc(gdf["tijdstip_registratie"]) <= target).to_numpy()]
 
                 if "termination_date" in gdf.columns:
-                    gdf = gdf[
-                        (gdf["termination_date"].isna())
-                        | (gdf["termination_date"] == "")
-                        | (gdf["termination_date"] > target_iso)
-                    ]
+                    gdf = gdf[_valid_at(gdf["termination_date"], target)]
 
                 # Then keep only the latest version per ID before or at target date
                 if "tijdstip_registratie" in gdf.columns:
-                    gdf = gdf.sort_values("tijdstip_registratie", ascending=False)
-                    gdf = gdf.drop_duplicates(subset=id_field, keep="first")
+                    gdf = _keep_latest_per_id(gdf, id_field, "tijdstip_registratie")
 
             except (ValueError, AttributeError):
                 # Invalid date format - fall back to 'latest'
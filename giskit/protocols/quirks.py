@@ -4,18 +4,22 @@ This module defines common API quirks and how to handle them.
 Quirks are provider-specific deviations from standard protocols.
 """
 
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
-
 from giskit.config import load_quirks
 
 
-class ProtocolQuirks(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ProtocolQuirks:
     """Configuration for protocol-specific quirks.
 
     Quirks are deviations from standard protocol behavior that
-    require special handling for specific providers.
+    require special handling for specific providers. Instances are
+    immutable; use ``dataclasses.replace()`` to derive a variant.
+    Validation of config-file input happens in ``QuirkDefinition``
+    (see ``giskit.config.loader``).
 
     Examples:
         PDOK requires ?f=json parameter:
@@ -30,92 +34,74 @@ class ProtocolQuirks(BaseModel):
     """
 
     # URL Construction Quirks
-    requires_trailing_slash: bool = Field(
-        False, description="Add trailing slash to base URL to prevent urljoin() issues"
-    )
+    # Add trailing slash to base URL to prevent urljoin() issues
+    requires_trailing_slash: bool = False
 
     # Request Parameter Quirks
-    require_format_param: bool = Field(
-        False, description="Require explicit format parameter in requests"
-    )
-    format_param_name: str = Field(
-        "f", description="Name of format parameter (e.g., 'f', 'format', 'outputFormat')"
-    )
-    format_param_value: str = Field(
-        "json",
-        description="Value for format parameter (e.g., 'json', 'geojson', 'application/json')",
-    )
+    # Require explicit format parameter in requests
+    require_format_param: bool = False
+    # Name of format parameter (e.g., 'f', 'format', 'outputFormat')
+    format_param_name: str = "f"
+    # Value for format parameter (e.g., 'json', 'geojson', 'application/json')
+    format_param_value: str = "json"
 
     # Pagination Quirks
-    max_features_limit: Optional[int] = Field(
-        None, description="Maximum features per request (if API ignores limit parameter)"
-    )
-    pagination_broken: bool = Field(False, description="API pagination doesn't work correctly")
-    max_concurrent_cells: int = Field(
-        5, description="Maximum concurrent grid cell downloads (for grid walking)"
-    )
+    # Maximum features per request (if API ignores limit parameter)
+    max_features_limit: Optional[int] = None
+    # API pagination doesn't work correctly
+    pagination_broken: bool = False
+    # Maximum concurrent grid cell downloads (for grid walking)
+    max_concurrent_cells: int = 5
+    # Maximum concurrent page downloads when pagination supports offsets
+    max_concurrent_pages: int = 5
 
     # Timeout Quirks
-    custom_timeout: Optional[float] = Field(
-        None, description="Custom timeout for slow APIs (seconds)"
-    )
+    # Custom timeout for slow APIs (seconds)
+    custom_timeout: Optional[float] = None
 
     # CRS Quirks
-    force_crs_in_query: bool = Field(
-        False, description="Force CRS parameter in query even if not needed"
-    )
-    bbox_crs: Optional[str] = Field(
-        None,
-        description="CRS for bbox parameter (if different from EPSG:4326). E.g., 'EPSG:28992' for BAG3D",
-    )
-    omit_bbox_crs_param: bool = Field(
-        False,
-        description="Do not include bbox-crs parameter in requests (some APIs don't support it)",
-    )
+    # Force CRS parameter in query even if not needed
+    force_crs_in_query: bool = False
+    # CRS for bbox parameter (if different from EPSG:4326). E.g., 'EPSG:28992' for BAG3D
+    bbox_crs: Optional[str] = None
+    # Do not include bbox-crs parameter in requests (some APIs don't support it)
+    omit_bbox_crs_param: bool = False
+    # Send temporal filters as the OGC 'datetime' query parameter
+    supports_datetime_param: bool = True
+    # Server honours the OGC 'properties' parameter to return only selected attributes
+    supports_properties_param: bool = False
 
     # Header Quirks
-    custom_headers: dict[str, str] = Field(
-        default_factory=dict, description="Custom HTTP headers required by API"
-    )
+    # Custom HTTP headers required by API
+    custom_headers: dict[str, str] = field(default_factory=dict)
 
     # Response Quirks
-    empty_collections_return_404: bool = Field(
-        False, description="API returns 404 instead of empty collection"
-    )
+    # API returns 404 instead of empty collection
+    empty_collections_return_404: bool = False
 
     # CityJSON Format Quirks (for 3D data like BAG3D)
-    format_is_cityjson: bool = Field(
-        False, description="Response is CityJSON format instead of GeoJSON"
-    )
-    cityjson_version: Optional[str] = Field(
-        None, description="CityJSON version (e.g., '1.1', '2.0')"
-    )
-    has_per_page_transform: bool = Field(
-        False,
-        description="CRITICAL: Each pagination page has different transform (scale/translate)",
-    )
-    transform_applies_to_vertices: bool = Field(
-        False,
-        description="Vertices are integers that need transform: real = vertex * scale + translate",
-    )
-    vertices_are_integers: bool = Field(
-        False, description="Vertex coordinates stored as integers requiring scaling"
-    )
-    has_lod_hierarchy: bool = Field(
-        False, description="Geometry has LOD (Level of Detail) hierarchy"
-    )
-    geometry_in_city_objects: bool = Field(
-        False, description="Geometry stored in CityObjects structure, not standard GeoJSON"
-    )
+    # Response is CityJSON format instead of GeoJSON
+    format_is_cityjson: bool = False
+    # CityJSON version (e.g., '1.1', '2.0')
+    cityjson_version: Optional[str] = None
+    # CRITICAL: Each pagination page has different transform (scale/translate)
+    has_per_page_transform: bool = False
+    # Vertices are integers that need transform: real = vertex * scale + translate
+    transform_applies_to_vertices: bool = False
+    # Vertex coordinates stored as integers requiring scaling
+    vertices_are_integers: bool = False
+    # Geometry has LOD (Level of Detail) hierarchy
+    has_lod_hierarchy: bool = False
+    # Geometry stored in CityObjects structure, not standard GeoJSON
+    geometry_in_city_objects: bool = False
 
     # Metadata
-    description: Optional[str] = Field(
-        None, description="Human-readable description of why these quirks are needed"
-    )
-    issue_url: Optional[str] = Field(None, description="Link to issue tracker or documentation")
-    workaround_date: Optional[str] = Field(
-        None, description="Date when workaround was added (YYYY-MM-DD)"
-    )
+    # Human-readable description of why these quirks are needed
+    description: Optional[str] = None
+    # Link to issue tracker or documentation
+    issue_url: Optional[str] = None
+    # Date when workaround was added (YYYY-MM-DD)
+    workaround_date: Optional[str] = None
 
     def apply_to_url(self, url: str) -> str:
         """Apply URL quirks to base URL.
@@ -246,6 +232,18 @@ from giskit.config import load_quirks
 KNOWN_QUIRKS = load_quirks(fallback=LEGACY_KNOWN_QUIRKS)
 
 
+def clear_quirks_cache() -> None:
+    """Drop memoised quirk lookups.
+
+    ``get_quirks``, ``get_format_quirks`` and ``get_service_quirks`` cache
+    their results; call this after modifying ``KNOWN_QUIRKS`` at runtime.
+    """
+    get_quirks.cache_clear()
+    get_format_quirks.cache_clear()
+    get_service_quirks.cache_clear()
+
+
+@lru_cache(maxsize=None)
 def get_quirks(provider: str, protocol: str) -> ProtocolQuirks:
     """Get known quirks for a provider/protocol combination.
 
@@ -254,7 +252,8 @@ def get_quirks(provider: str, protocol: str) -> ProtocolQuirks:
         protocol: Protocol name (e.g., "ogc-features", "format")
 
     Returns:
-        ProtocolQuirks instance (default quirks if unknown)
+        ProtocolQuirks instance (default quirks if unknown). Results are
+        cached; call ``clear_quirks_cache()`` after changing ``KNOWN_QUIRKS``.
 
     Examples:
         >>> # Provider quirks
@@ -274,6 +273,7 @@ def get_quirks(provider: str, protocol: str) -> ProtocolQuirks:
     return KNOWN_QUIRKS.get(provider, {}).get(protocol, ProtocolQuirks())
 
 
+@lru_cache(maxsize=None)
 def get_format_quirks(format_name: str) -> ProtocolQuirks:
     """Get quirks for a specific data format.
 
@@ -293,6 +293,7 @@ def get_format_quirks(format_name: str) -> ProtocolQuirks:
     return get_quirks(format_name, "format")
 
 
+@lru_cache(maxsize=None)
 def get_service_quirks(provider: str, protocol: str, service: str) -> ProtocolQuirks:
     """Get quirks for a specific service within a provider.
 
@@ -319,17 +320,29 @@ def get_service_quirks(provider: str, protocol: str, service: str) -> ProtocolQu
     service_key = f"{provider}-{service}"
     if service_key in KNOWN_QUIRKS and protocol in KNOWN_QUIRKS[service_key]:
         # Merge service quirks over base quirks
-        service_quirks_dict = KNOWN_QUIRKS[service_key][protocol]
-        base_dict = base_quirks.model_dump()
-        base_dict.update(service_quirks_dict.model_dump(exclude_unset=True))
-        return ProtocolQuirks(**base_dict)
+        return _merge_quirks(base_quirks, KNOWN_QUIRKS[service_key][protocol])
 
     # Check if service has its own quirks (for external services like bag3d)
     if service in KNOWN_QUIRKS and protocol in KNOWN_QUIRKS[service]:
-        # Use service quirks directly
-        service_quirks_dict = KNOWN_QUIRKS[service][protocol]
-        base_dict = base_quirks.model_dump()
-        base_dict.update(service_quirks_dict.model_dump(exclude_unset=True))
-        return ProtocolQuirks(**base_dict)
+        return _merge_quirks(base_quirks, KNOWN_QUIRKS[service][protocol])
 
     return base_quirks
+
+
+def _merge_quirks(base: ProtocolQuirks, override: ProtocolQuirks) -> ProtocolQuirks:
+    """Overlay service quirks on provider quirks.
+
+    Only fields the service sets (values other than the ProtocolQuirks
+    default) replace the provider's; custom headers are combined so a
+    service only needs to list the headers it adds or changes. A service
+    therefore can't reset a provider quirk back to its default.
+    """
+    defaults = ProtocolQuirks()
+    changes = {
+        f.name: getattr(override, f.name)
+        for f in fields(ProtocolQuirks)
+        if getattr(override, f.name) != getattr(defaults, f.name)
+    }
+    if "custom_headers" in changes:
+        changes["custom_headers"] = {**base.custom_headers, **override.custom_headers}
+    return replace(base, **changes)
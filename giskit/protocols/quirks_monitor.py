@@ -3,36 +3,67 @@
 Track which quirks are being applied and provide debugging information.
 """
 
+import heapq
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 from giskit.protocols.quirks import ProtocolQuirks
 
-# Configure logger
+# Configure logger. Debug records carry their fields as `extra` attributes
+# (provider, protocol, ...) so structured handlers don't need to parse messages
 logger = logging.getLogger("giskit.quirks")
 
 
-@dataclass
+def _from_ns(timestamp_ns: int) -> Optional[datetime]:
+    """Convert a time.time_ns() timestamp to a local datetime (None if unset)."""
+    if not timestamp_ns:
+        return None
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+@dataclass(slots=True)
 class QuirkUsage:
-    """Track usage statistics for a specific quirk."""
+    """Track usage statistics for a specific quirk.
+
+    Timestamps are stored as integer nanoseconds and only turned into
+    datetimes when read through first_applied / last_applied.
+    """
 
     provider: str
     protocol: str
     quirk_type: str
     applied_count: int = 0
-    last_applied: Optional[datetime] = None
-    first_applied: Optional[datetime] = None
+    _first_ns: int = field(default=0, init=False, repr=False)
+    _last_ns: int = field(default=0, init=False, repr=False)
 
-    def record_application(self):
-        """Record that this quirk was applied."""
+    @property
+    def first_applied(self) -> Optional[datetime]:
+        """When the quirk was first applied (None if never)."""
+        return _from_ns(self._first_ns)
+
+    @property
+    def last_applied(self) -> Optional[datetime]:
+        """When the quirk was last applied (None if never)."""
+        return _from_ns(self._last_ns)
+
+    def record_application(self, now_ns: Optional[int] = None):
+        """Record that this quirk was applied.
+
+        Args:
+            now_ns: Timestamp of the application from time.time_ns()
+                (default: current time)
+        """
         self.applied_count += 1
-        now = datetime.now()
-        self.last_applied = now
-        if self.first_applied is None:
-            self.first_applied = now
+        if now_ns is None:
+            now_ns = time.time_ns()
+        self._last_ns = now_ns
+        if not self._first_ns:
+            self._first_ns = now_ns
 
 
 class QuirksMonitor:
@@ -51,9 +82,8 @@ class QuirksMonitor:
 
     def __init__(self):
         """Initialize quirks monitor."""
-        self._usage: dict[str, dict[str, dict[str, QuirkUsage]]] = defaultdict(
-            lambda: defaultdict(dict)
-        )
+        # Keyed by (provider, protocol, quirk_type); nested views are built on demand
+        self._usage: dict[tuple[str, str, str], QuirkUsage] = {}
         self._enabled = True
 
     def record_quirk_applied(self, provider: str, protocol: str, quirk_type: str):
@@ -64,23 +94,45 @@ class QuirksMonitor:
             protocol: Protocol name (e.g., "ogc-features")
             quirk_type: Type of quirk (e.g., "format_param")
         """
-        if not self._enabled:
-            return
+        self.record_quirks_applied(provider, protocol, (quirk_type,))
 
-        # Get or create usage record
-        if quirk_type not in self._usage[provider][protocol]:
-            self._usage[provider][protocol][quirk_type] = QuirkUsage(
-                provider=provider, protocol=protocol, quirk_type=quirk_type
-            )
+    def record_quirks_applied(self, provider: str, protocol: str, quirk_types: Sequence[str]):
+        """Record that several quirks were applied by one operation.
 
-        # Record application
-        usage = self._usage[provider][protocol][quirk_type]
-        usage.record_application()
+        Takes the timestamp once for the whole batch.
 
-        # Log at debug level
-        logger.debug(
-            f"Applied quirk: {provider}/{protocol}/{quirk_type} " f"(count: {usage.applied_count})"
-        )
+        Args:
+            provider: Provider name (e.g., "pdok")
+            protocol: Protocol name (e.g., "ogc-features")
+            quirk_types: Types of quirk (e.g., ["trailing_slash", "format_param"])
+        """
+        if not self._enabled or not quirk_types:
+            return
+
+        now_ns = time.time_ns()
+
+        for quirk_type in quirk_types:
+            # Get or create usage record
+            key = (provider, protocol, quirk_type)
+            usage = self._usage.get(key)
+            if usage is None:
+                usage = self._usage[key] = QuirkUsage(
+                    provider=provider, protocol=protocol, quirk_type=quirk_type
+                )
+
+            # Record application
+            usage.record_application(now_ns)
+
+        # Log at debug level (only format the message when it will be emitted)
+        if logger.isEnabledFor(logging.DEBUG):
+            counts = {q: self._usage[provider, protocol, q].applied_count for q in quirk_types}
+            logger.debug(
+                "Applied quirks: %s/%s: %s",
+                provider,
+                protocol,
+                ", ".join(f"{q} (count: {count})" for q, count in counts.items()),
+                extra={"provider": provider, "protocol": protocol, "quirk_counts": counts},
+            )
 
     def get_statistics(self) -> dict:
         """Get usage statistics for all quirks.
@@ -88,7 +140,10 @@ class QuirksMonitor:
         Returns:
             Nested dict: provider -> protocol -> quirk_type -> QuirkUsage
         """
-        return dict(self._usage)
+        stats: dict[str, dict[str, dict[str, QuirkUsage]]] = {}
+        for (provider, protocol, quirk_type), usage in self._usage.items():
+            stats.setdefault(provider, {}).setdefault(protocol, {})[quirk_type] = usage
+        return stats
 
     def get_provider_stats(self, provider: str) -> dict[str, dict[str, QuirkUsage]]:
         """Get statistics for a specific provider.
@@ -99,7 +154,11 @@ class QuirksMonitor:
         Returns:
             Dict of protocol -> quirk_type -> QuirkUsage
         """
-        return dict(self._usage.get(provider, {}))
+        stats: dict[str, dict[str, QuirkUsage]] = {}
+        for (usage_provider, protocol, quirk_type), usage in self._usage.items():
+            if usage_provider == provider:
+                stats.setdefault(protocol, {})[quirk_type] = usage
+        return stats
 
     def get_most_used_quirks(self, limit: int = 10) -> list[QuirkUsage]:
         """Get the most frequently used quirks.
@@ -110,14 +169,13 @@ class QuirksMonitor:
         Returns:
             List of QuirkUsage sorted by applied_count (descending)
         """
-        all_quirks = []
-        for provider_data in self._usage.values():
-            for protocol_data in provider_data.values():
-                all_quirks.extend(protocol_data.values())
+        # Partial sort: only the top `limit` entries are ordered
+        return heapq.nlargest(limit, self._usage.values(), key=lambda x: x.applied_count)
 
-        # Sort by count
-        all_quirks.sort(key=lambda x: x.applied_count, reverse=True)
-        return all_quirks[:limit]
+    @property
+    def enabled(self) -> bool:
+        """Whether quirk applications are being recorded."""
+        return self._enabled
 
     def reset(self):
         """Reset all statistics."""
@@ -135,38 +193,41 @@ class QuirksMonitor:
         logger.info("Quirks monitoring enabled")
 
     def print_report(self):
-        """Print a human-readable report of quirk usage."""
-        print("\n" + "=" * 70)
-        print("QUIRKS USAGE REPORT")
-        print("=" * 70)
+        """Print a human-readable report of quirk usage.
+
+        The report is assembled first and written to stdout in one call.
+        """
+        parts = ["\n" + "=" * 70 + "\n", "QUIRKS USAGE REPORT\n", "=" * 70 + "\n"]
 
         if not self._usage:
-            print("No quirks have been applied yet.")
+            parts.append("No quirks have been applied yet.\n")
+            sys.stdout.write("".join(parts))
             return
 
-        for provider, protocols in self._usage.items():
-            print(f"\nProvider: {provider}")
-            print("-" * 70)
+        for provider, protocols in self.get_statistics().items():
+            parts.append(f"\nProvider: {provider}\n")
+            parts.append("-" * 70 + "\n")
 
             for protocol, quirks in protocols.items():
-                print(f"  Protocol: {protocol}")
+                parts.append(f"  Protocol: {protocol}\n")
 
                 for quirk_type, usage in quirks.items():
-                    print(f"    {quirk_type}:")
-                    print(f"      Applied: {usage.applied_count} times")
+                    parts.append(f"    {quirk_type}:\n")
+                    parts.append(f"      Applied: {usage.applied_count} times\n")
                     if usage.first_applied:
-                        print(f"      First:   {usage.first_applied.isoformat()}")
+                        parts.append(f"      First:   {usage.first_applied.isoformat()}\n")
                     if usage.last_applied:
-                        print(f"      Last:    {usage.last_applied.isoformat()}")
+                        parts.append(f"      Last:    {usage.last_applied.isoformat()}\n")
 
-        print("\nTop 5 Most Used Quirks:")
-        print("-" * 70)
+        parts.append("\nTop 5 Most Used Quirks:\n")
+        parts.append("-" * 70 + "\n")
         for i, usage in enumerate(self.get_most_used_quirks(5), 1):
-            print(
+            parts.append(
                 f"{i}. {usage.provider}/{usage.protocol}/{usage.quirk_type} "
-                f"({usage.applied_count} times)"
+                f"({usage.applied_count} times)\n"
             )
-        print("=" * 70 + "\n")
+        parts.append("=" * 70 + "\n\n")
+        sys.stdout.write("".join(parts))
 
 
 # Global monitor instance
@@ -192,24 +253,30 @@ def log_quirk_application(quirks: ProtocolQuirks, provider: str, protocol: str,
         operation: Operation being performed (e.g., "get_capabilities")
     """
     monitor = get_monitor()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if not monitor.enabled and not debug:
+        return
 
     # Track which quirks are active
+    applied = []
     if quirks.requires_trailing_slash:
-        monitor.record_quirk_applied(provider, protocol, "trailing_slash")
-
+        applied.append("trailing_slash")
     if quirks.require_format_param:
-        monitor.record_quirk_applied(provider, protocol, "format_param")
-
+        applied.append("format_param")
     if quirks.max_features_limit:
-        monitor.record_quirk_applied(provider, protocol, "max_features_limit")
-
+        applied.append("max_features_limit")
     if quirks.custom_timeout:
-        monitor.record_quirk_applied(provider, protocol, "custom_timeout")
-
+        applied.append("custom_timeout")
     if quirks.custom_headers:
-        monitor.record_quirk_applied(provider, protocol, "custom_headers")
+        applied.append("custom_headers")
+
+    if applied:
+        monitor.record_quirks_applied(provider, protocol, applied)
 
     # Log summary at debug level
+    if not debug:
+        return
+
     active_quirks = []
     if quirks.requires_trailing_slash:
         active_quirks.append("trailing_slash")
@@ -224,9 +291,20 @@ def log_quirk_application(quirks: ProtocolQuirks, provider: str, protocol: str,
     if quirks.custom_headers:
         active_quirks.append(f"headers={len(quirks.custom_headers)}")
 
+    extra = {
+        "provider": provider,
+        "protocol": protocol,
+        "operation": operation,
+        "quirk_types": applied,
+    }
     if active_quirks:
         logger.debug(
-            f"{provider}/{protocol}.{operation} - " f"Active quirks: {', '.join(active_quirks)}"
+            "%s/%s.%s - Active quirks: %s",
+            provider,
+            protocol,
+            operation,
+            ", ".join(active_quirks),
+            extra=extra,
         )
     else:
-        logger.debug(f"{provider}/{protocol}.{operation} - No quirks applied")
+        logger.debug("%s/%s.%s - No quirks applied", provider, protocol, operation, extra=extra)
@@ -4,7 +4,9 @@ Supports downloading raster coverage data from WCS services.
 Specification: https://www.ogc.org/standards/wcs
 """
 
+import io
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlencode
@@ -12,11 +14,60 @@ from urllib.parse import urlencode
 import httpx
 import numpy as np
 import rasterio
-from rasterio.io import MemoryFile
-from rasterio.transform import from_bounds
+from rasterio.io import DatasetReader, MemoryFile
+from rasterio.transform import Affine, from_bounds
+from rasterio.windows import Window
 
 from giskit.protocols.base import Protocol
 
+# Read size when streaming coverage downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# XML namespaces and element paths (Clark notation) used when parsing WCS 1.0 responses
+WCS_NS = "{http://www.opengis.net/wcs}"
+GML_NS = "{http://www.opengis.net/gml}"
+_COVERAGE_OFFERINGS = f".//{WCS_NS}CoverageOfferingBrief"
+_COVERAGE_NAME = f"{WCS_NS}name"
+_LONLAT_POS = f".//{WCS_NS}lonLatEnvelope/{GML_NS}pos"
+
+# GeoTIFF writer options shared by every save: tiled LZW with a horizontal
+# differencing predictor (elevation rasters compress much better with it),
+# compressed on all cores
+_GTIFF_BLOCK_SIZE = 512
+_GTIFF_PROFILE = {
+    "driver": "GTiff",
+    "compress": "lzw",
+    "predictor": 2,
+    "tiled": True,
+    "blockxsize": _GTIFF_BLOCK_SIZE,
+    "blockysize": _GTIFF_BLOCK_SIZE,
+    "num_threads": "ALL_CPUS",
+}
+
+
+def _iter_windows(dataset: DatasetReader, window_size: Optional[int]) -> Iterator[Window]:
+    """Iterate over the windows covering a dataset's first band.
+
+    Args:
+        dataset: Open raster dataset
+        window_size: Square window size in pixels, or None for the dataset's blocks
+
+    Returns:
+        Iterator of windows in row-major order
+    """
+    if window_size is None:
+        return (window for _, window in dataset.block_windows(1))
+    return (
+        Window(
+            col,
+            row,
+            min(window_size, dataset.width - col),
+            min(window_size, dataset.height - row),
+        )
+        for row in range(0, dataset.height, window_size)
+        for col in range(0, dataset.width, window_size)
+    )
+
 
 class WCSError(Exception):
     """Raised when WCS requests fail."""
@@ -65,6 +116,9 @@ class WCSProtocol(Protocol):
         # Coverage metadata (loaded lazily)
         self._metadata: Optional[dict[str, Any]] = None
 
+        # Query string prefix shared by every request
+        self._base_query = urlencode({"service": "WCS", "version": self.version})
+
     def _build_url(self, request: str, params: dict[str, Any]) -> str:
         """Build WCS request URL.
 
@@ -75,19 +129,9 @@ class WCSProtocol(Protocol):
         Returns:
             Complete request URL
         """
-        # Base parameters
-        base_params = {
-            "service": "WCS",
-            "version": self.version,
-            "request": request,
-        }
-
-        # Merge with request-specific params
-        all_params = {**base_params, **params}
-
-        # Build URL
-        query_string = urlencode(all_params)
-        return f"{self.base_url}?{query_string}"
+        # Only the request-specific part needs encoding; service/version are fixed
+        query_string = urlencode({"request": request, **params})
+        return f"{self.base_url}?{self._base_query}&{query_string}"
 
     async def get_capabilities(self) -> dict[str, Any]:
         """Get WCS service capabilities.
@@ -108,8 +152,8 @@ class WCSProtocol(Protocol):
             # Extract coverage offerings
             # Note: Simplified parsing - may need enhancement for different WCS versions
             coverages = []
-            for coverage in root.findall(".//{http://www.opengis.net/wcs}CoverageOfferingBrief"):
-                name_elem = coverage.find("{http://www.opengis.net/wcs}name")
+            for coverage in root.iterfind(_COVERAGE_OFFERINGS):
+                name_elem = coverage.find(_COVERAGE_NAME)
                 if name_elem is not None:
                     coverages.append(name_elem.text)
 
@@ -152,18 +196,16 @@ class WCSProtocol(Protocol):
             }
 
             # Try to extract bbox from lonLatEnvelope
-            envelope = root.find(".//{http://www.opengis.net/wcs}lonLatEnvelope")
-            if envelope is not None:
-                pos_elem = envelope.find("{http://www.opengis.net/gml}pos")
-                if pos_elem is not None and pos_elem.text:
-                    coords = pos_elem.text.split()
-                    if len(coords) >= 4:
-                        metadata["bbox_latlon"] = [
-                            float(coords[0]),
-                            float(coords[1]),
-                            float(coords[2]),
-                            float(coords[3]),
-                        ]
+            pos_elem = root.find(_LONLAT_POS)
+            if pos_elem is not None and pos_elem.text:
+                coords = pos_elem.text.split()
+                if len(coords) >= 4:
+                    metadata["bbox_latlon"] = [
+                        float(coords[0]),
+                        float(coords[1]),
+                        float(coords[2]),
+                        float(coords[3]),
+                    ]
 
             self._metadata = metadata
             return metadata
@@ -188,29 +230,26 @@ class WCSProtocol(Protocol):
             "WCS protocol does not support vector features. " "Use get_coverage() for raster data."
         )
 
-    async def get_coverage(
+    def _coverage_url(
         self,
         bbox: tuple[float, float, float, float],
-        product: str,
         resolution: float,
-        crs: str = "EPSG:28992",
-        output_format: str = "image/tiff",
-        progress_callback: Optional[Any] = None,
-        **kwargs: Any,
-    ) -> np.ndarray:
-        """Download coverage data for bounding box.
+        crs: str,
+        output_format: str,
+    ) -> tuple[str, int, int]:
+        """Build the GetCoverage URL for a bounding box.
 
         Args:
             bbox: Bounding box (minx, miny, maxx, maxy) in request CRS
-            product: Product/coverage name (ignored - uses configured coverage_id)
             resolution: Target resolution in meters
             crs: Coordinate reference system
-            output_format: Output format (default: "image/tiff")
-            progress_callback: Optional callback(message, percent)
-            **kwargs: Additional parameters
+            output_format: Output format (e.g. "image/tiff")
 
         Returns:
-            NumPy array with elevation/coverage data
+            Tuple of (url, width in pixels, height in pixels)
+
+        Raises:
+            ValueError: If the bbox is invalid or the CRS isn't the native CRS
         """
         self.validate_bbox(bbox)
         minx, miny, maxx, maxy = bbox
@@ -222,19 +261,9 @@ class WCSProtocol(Protocol):
                 "Coordinate transformation not yet implemented."
             )
 
-        if progress_callback:
-            progress_callback(f"Requesting coverage: {self.coverage_id}", 0.0)
-
         # Calculate grid size based on resolution
-        width_m = maxx - minx
-        height_m = maxy - miny
-        width_px = int(width_m / resolution)
-        height_px = int(height_m / resolution)
-
-        if progress_callback:
-            progress_callback(
-                f"Grid size: {width_px}x{height_px} pixels at {resolution}m resolution", 0.1
-            )
+        width_px = int((maxx - minx) / resolution)
+        height_px = int((maxy - miny) / resolution)
 
         # Build GetCoverage request
         params = {
@@ -245,55 +274,172 @@ class WCSProtocol(Protocol):
             "height": str(height_px),
             "format": output_format,
         }
+        return self._build_url("GetCoverage", params), width_px, height_px
+
+    @staticmethod
+    async def _raise_for_xml_error(response: httpx.Response) -> None:
+        """Raise WCSError if a GetCoverage response is an XML error document.
+
+        Args:
+            response: Streamed GetCoverage response
+
+        Raises:
+            WCSError: If the response is XML instead of raster data
+        """
+        content_type = response.headers.get("content-type", "")
+        if "xml" in content_type.lower():
+            # The message lives in the first <ServiceException> child, not the root
+            # text; stop parsing as soon as it has been seen
+            error_msg = "Unknown WCS error"
+            try:
+                for _, elem in ET.iterparse(io.BytesIO(await response.aread())):
+                    if elem.tag.endswith("ServiceException"):
+                        error_msg = (elem.text or "").strip() or error_msg
+                        break
+            except ET.ParseError:
+                raise WCSError("WCS service returned XML error (parse failed)")
+            raise WCSError(f"WCS service error: {error_msg}")
+
+    async def get_coverage(
+        self,
+        bbox: tuple[float, float, float, float],
+        product: str,
+        resolution: float,
+        crs: str = "EPSG:28992",
+        output_format: str = "image/tiff",
+        progress_callback: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Download coverage data for bounding box.
 
-        url = self._build_url("GetCoverage", params)
+        Args:
+            bbox: Bounding box (minx, miny, maxx, maxy) in request CRS
+            product: Product/coverage name (ignored - uses configured coverage_id)
+            resolution: Target resolution in meters
+            crs: Coordinate reference system
+            output_format: Output format (default: "image/tiff")
+            progress_callback: Optional callback(message, percent)
+            **kwargs: Additional parameters
+
+        Returns:
+            NumPy array with elevation/coverage data
+        """
+        url, width_px, height_px = self._coverage_url(bbox, resolution, crs, output_format)
+
+        if progress_callback:
+            progress_callback(f"Requesting coverage: {self.coverage_id}", 0.0)
+            progress_callback(
+                f"Grid size: {width_px}x{height_px} pixels at {resolution}m resolution", 0.1
+            )
 
         if progress_callback:
             progress_callback("Downloading coverage data...", 0.2)
 
-        # Download coverage
-        client = await self._get_client()
+        memfile = await self._download_to_memfile(url, progress_callback)
 
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
+        # Parse GeoTIFF using rasterio
+        if progress_callback:
+            progress_callback("Parsing GeoTIFF data...", 0.8)
 
-            if progress_callback:
-                size_mb = len(response.content) / (1024 * 1024)
-                progress_callback(f"Downloaded {size_mb:.2f} MB", 0.7)
+        with memfile:
+            with memfile.open() as dataset:
+                # Read first band (elevation data is typically single-band)
+                data = dataset.read(1)
 
-            # Check if response is an error (XML) instead of raster
-            content_type = response.headers.get("content-type", "")
-            if "xml" in content_type.lower():
-                # Try to parse error message
-                try:
-                    root = ET.fromstring(response.content)
-                    error_msg = root.text or "Unknown WCS error"
-                    raise WCSError(f"WCS service error: {error_msg}")
-                except ET.ParseError:
-                    raise WCSError("WCS service returned XML error (parse failed)")
+                if progress_callback:
+                    progress_callback(
+                        f"Loaded {data.shape[0]}x{data.shape[1]} elevation grid", 0.9
+                    )
 
-            # Parse GeoTIFF using rasterio
-            if progress_callback:
-                progress_callback("Parsing GeoTIFF data...", 0.8)
+        return data
 
-            with MemoryFile(response.content) as memfile:
-                with memfile.open() as dataset:
-                    # Read first band (elevation data is typically single-band)
-                    data = dataset.read(1)
+    async def get_coverage_windowed(
+        self,
+        bbox: tuple[float, float, float, float],
+        resolution: float,
+        window_size: Optional[int] = None,
+        crs: str = "EPSG:28992",
+        output_format: str = "image/tiff",
+        progress_callback: Optional[Any] = None,
+    ) -> AsyncIterator[tuple[Affine, np.ndarray]]:
+        """Download coverage data and yield it window by window.
 
-                    # Get metadata
+        Only one window of the first band is held as a NumPy array at a time,
+        so large coverages can be processed without materializing the full grid.
 
-                    if progress_callback:
-                        progress_callback(
-                            f"Loaded {data.shape[0]}x{data.shape[1]} elevation grid", 0.9
-                        )
+        Args:
+            bbox: Bounding box (minx, miny, maxx, maxy) in request CRS
+            resolution: Target resolution in meters
+            window_size: Square window size in pixels (default: the GeoTIFF's
+                internal block layout)
+            crs: Coordinate reference system
+            output_format: Output format (default: "image/tiff")
+            progress_callback: Optional callback(message, percent)
 
-            return data
+        Yields:
+            Tuples of (window transform, window data)
+        """
+        url, width_px, height_px = self._coverage_url(bbox, resolution, crs, output_format)
+
+        if progress_callback:
+            progress_callback(f"Requesting coverage: {self.coverage_id}", 0.0)
+            progress_callback(
+                f"Grid size: {width_px}x{height_px} pixels at {resolution}m resolution", 0.1
+            )
+            progress_callback("Downloading coverage data...", 0.2)
+
+        memfile = await self._download_to_memfile(url, progress_callback)
+
+        with memfile:
+            with memfile.open() as dataset:
+                for window in _iter_windows(dataset, window_size):
+                    yield dataset.window_transform(window), dataset.read(1, window=window)
+
+    async def _download_to_memfile(
+        self, url: str, progress_callback: Optional[Any] = None
+    ) -> MemoryFile:
+        """Stream a GetCoverage response into a MemoryFile.
+
+        Args:
+            url: GetCoverage request URL
+            progress_callback: Optional callback(message, percent)
+
+        Returns:
+            MemoryFile holding the downloaded raster (caller must close it)
+
+        Raises:
+            WCSError: If the request fails or the service returns an XML error
+        """
+        client = await self._get_client()
+
+        try:
+            # Stream the body straight into GDAL's in-memory filesystem instead of
+            # holding it as a Python bytes object and copying it into a MemoryFile
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                # Check if response is an error (XML) instead of raster
+                await self._raise_for_xml_error(response)
+
+                memfile = MemoryFile()
+                size = 0
+                try:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        memfile.write(chunk)
+                        size += len(chunk)
+                except BaseException:
+                    memfile.close()
+                    raise
 
         except httpx.HTTPError as e:
             raise WCSError(f"Failed to download coverage: {e}")
 
+        if progress_callback:
+            size_mb = size / (1024 * 1024)
+            progress_callback(f"Downloaded {size_mb:.2f} MB", 0.7)
+
+        return memfile
+
     async def save_coverage_as_geotiff(
         self,
         bbox: tuple[float, float, float, float],
@@ -301,6 +447,7 @@ class WCSProtocol(Protocol):
         resolution: float,
         crs: str = "EPSG:28992",
         progress_callback: Optional[Any] = None,
+        raw_passthrough: bool = False,
         **kwargs: Any,
     ) -> Path:
         """Download coverage and save as GeoTIFF file.
@@ -311,20 +458,32 @@ class WCSProtocol(Protocol):
             resolution: Target resolution in meters
             crs: Coordinate reference system
             progress_callback: Optional callback(message, percent)
+            raw_passthrough: Stream the server's GeoTIFF to disk as-is instead of
+                decoding it and re-encoding it (default: False). Faster and uses
+                no memory for the grid, but the file keeps whatever CRS,
+                georeferencing and compression the server wrote; the default
+                path sets crs and a transform from bbox explicitly and writes
+                tiled, compressed output (_GTIFF_PROFILE).
             **kwargs: Additional parameters
 
         Returns:
             Path to saved GeoTIFF
         """
-        # Download coverage data
-        data = await self.get_coverage(
-            bbox=bbox,
-            product=self.coverage_id,
-            resolution=resolution,
-            crs=crs,
-            progress_callback=progress_callback,
-            **kwargs,
-        )
+        if raw_passthrough:
+            return await self._download_geotiff(
+                bbox, output_path, resolution, crs, progress_callback
+            )
+
+        url, width_px, height_px = self._coverage_url(bbox, resolution, crs, "image/tiff")
+
+        if progress_callback:
+            progress_callback(f"Requesting coverage: {self.coverage_id}", 0.0)
+            progress_callback(
+                f"Grid size: {width_px}x{height_px} pixels at {resolution}m resolution", 0.1
+            )
+            progress_callback("Downloading coverage data...", 0.2)
+
+        memfile = await self._download_to_memfile(url, progress_callback)
 
         if progress_callback:
             progress_callback("Saving GeoTIFF...", 0.95)
@@ -332,26 +491,99 @@ class WCSProtocol(Protocol):
         # Create output directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Calculate transform
-        minx, miny, maxx, maxy = bbox
-        transform = from_bounds(minx, miny, maxx, maxy, data.shape[1], data.shape[0])
-
-        # Save as GeoTIFF
-        with rasterio.open(
-            output_path,
-            "w",
-            driver="GTiff",
-            height=data.shape[0],
-            width=data.shape[1],
-            count=1,
-            dtype=data.dtype,
-            crs=crs,
-            transform=transform,
-            compress="lzw",
-        ) as dst:
-            dst.write(data, 1)
+        with memfile:
+            with memfile.open() as src:
+                dtype = src.dtypes[0]
+
+                # Calculate transform
+                minx, miny, maxx, maxy = bbox
+                transform = from_bounds(minx, miny, maxx, maxy, src.width, src.height)
+
+                # Floating point rasters need the floating point predictor
+                profile = _GTIFF_PROFILE
+                if np.issubdtype(np.dtype(dtype), np.floating):
+                    profile = {**_GTIFF_PROFILE, "predictor": 3}
+
+                # Copy window by window so the full grid is never held in memory;
+                # windows match the output's block size so each write fills whole tiles
+                with rasterio.Env(GDAL_NUM_THREADS="ALL_CPUS"):
+                    with rasterio.open(
+                        output_path,
+                        "w",
+                        height=src.height,
+                        width=src.width,
+                        count=1,
+                        dtype=dtype,
+                        crs=crs,
+                        transform=transform,
+                        **profile,
+                    ) as dst:
+                        for window in _iter_windows(src, _GTIFF_BLOCK_SIZE):
+                            dst.write(src.read(1, window=window), 1, window=window)
+
+        if progress_callback:
+            progress_callback(f"Saved to {output_path.name}", 1.0)
+
+        return output_path
+
+    async def _download_geotiff(
+        self,
+        bbox: tuple[float, float, float, float],
+        output_path: Path,
+        resolution: float,
+        crs: str,
+        progress_callback: Optional[Any] = None,
+    ) -> Path:
+        """Stream a GetCoverage GeoTIFF straight to disk.
+
+        Args:
+            bbox: Bounding box (minx, miny, maxx, maxy)
+            output_path: Path to save GeoTIFF
+            resolution: Target resolution in meters
+            crs: Coordinate reference system
+            progress_callback: Optional callback(message, percent)
+
+        Returns:
+            Path to saved GeoTIFF
+        """
+        url, width_px, height_px = self._coverage_url(bbox, resolution, crs, "image/tiff")
+
+        if progress_callback:
+            progress_callback(f"Requesting coverage: {self.coverage_id}", 0.0)
+            progress_callback(
+                f"Grid size: {width_px}x{height_px} pixels at {resolution}m resolution", 0.1
+            )
+            progress_callback("Downloading coverage data...", 0.2)
+
+        # Create output directory if needed
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        client = await self._get_client()
+
+        try:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                # Check if response is an error (XML) instead of raster
+                await self._raise_for_xml_error(response)
+
+                size = 0
+                try:
+                    with open(output_path, "wb") as f:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            size += len(chunk)
+                except BaseException:
+                    # Don't leave a truncated GeoTIFF behind
+                    output_path.unlink(missing_ok=True)
+                    raise
+
+        except httpx.HTTPError as e:
+            raise WCSError(f"Failed to download coverage: {e}")
 
         if progress_callback:
+            size_mb = size / (1024 * 1024)
+            progress_callback(f"Downloaded {size_mb:.2f} MB", 0.9)
             progress_callback(f"Saved to {output_path.name}", 1.0)
 
         return output_path
@@ -4,12 +4,76 @@ Supports WFS 2.0 for downloading vector features.
 Used by PDOK services like BAG and BRK that don't support OGC API Features yet.
 """
 
+import asyncio
+import xml.etree.ElementTree as ET
+from io import BytesIO
 from typing import Any, Optional
 
 import geopandas as gpd
 import httpx
 
-from giskit.protocols.base import Protocol
+from giskit.protocols.base import Protocol, loads_json
+
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None  # type: ignore[assignment]
+
+# GetFeature parameters that are the same for every request
+GETFEATURE_PARAMS = {
+    "service": "WFS",
+    "version": "2.0.0",
+    "request": "GetFeature",
+    "outputFormat": "json",
+}
+
+OWS_NS = "{http://www.opengis.net/ows/1.1}"
+_OUTPUT_FORMAT_VALUES = f".//{OWS_NS}Parameter[@name='outputFormat']//{OWS_NS}Value"
+
+# Binary output formats to request instead of GeoJSON when the server offers
+# them, in order of preference. Reading them needs pyogrio.
+BINARY_OUTPUT_FORMATS = ("application/flatgeobuf",)
+
+
+def _read_geojson(content: bytes) -> gpd.GeoDataFrame:
+    """Parse a GeoJSON FeatureCollection into a GeoDataFrame.
+
+    With pyogrio installed, GDAL parses the bytes straight into columns,
+    skipping the intermediate Python dicts. Otherwise (or if GDAL rejects
+    the document) the features are decoded and built with from_features.
+
+    Args:
+        content: Raw GeoJSON response body
+
+    Returns:
+        GeoDataFrame with the features (empty if there are none). The CRS
+        is left to the caller: GDAL assumes WGS84 for GeoJSON.
+    """
+    if pyogrio is not None:
+        try:
+            gdf = pyogrio.read_dataframe(BytesIO(content))
+            return gdf if not gdf.empty else gpd.GeoDataFrame()
+        except Exception:
+            pass  # Fall back to the pure-Python path
+
+    # Parse GeoJSON response (orjson when installed)
+    geojson = loads_json(content)
+    if "features" in geojson and geojson["features"]:
+        return gpd.GeoDataFrame.from_features(geojson["features"])
+    return gpd.GeoDataFrame()
+
+
+def _read_binary(content: bytes) -> gpd.GeoDataFrame:
+    """Parse a binary GetFeature response (e.g. FlatGeobuf) with pyogrio.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        GeoDataFrame with the features (empty if there are none)
+    """
+    gdf = pyogrio.read_dataframe(BytesIO(content))
+    return gdf if not gdf.empty else gpd.GeoDataFrame()
 
 
 class WFSError(Exception):
@@ -26,6 +90,7 @@ class WFSProtocol(Protocol):
         base_url: str,
         timeout: float = 120.0,
         max_features: int = 10000,
+        max_concurrent_layers: int = 4,
         **kwargs: Any,
     ):
         """Initialize WFS protocol.
@@ -34,10 +99,14 @@ class WFSProtocol(Protocol):
             base_url: Base URL for WFS endpoint
             timeout: Request timeout in seconds
             max_features: Maximum features per request
+            max_concurrent_layers: Maximum layers downloaded at the same time
             **kwargs: Additional configuration
         """
         super().__init__(base_url, timeout=timeout, **kwargs)
         self.max_features = max_features
+        self.max_concurrent_layers = max_concurrent_layers
+        # GetFeature outputFormat, chosen from the capabilities on first download
+        self._preferred_format: Optional[str] = None
 
     async def get_capabilities(self) -> dict[str, Any]:
         """Get WFS capabilities.
@@ -52,6 +121,43 @@ class WFSProtocol(Protocol):
             "url": self.base_url,
         }
 
+    async def _select_output_format(self) -> str:
+        """Choose the GetFeature outputFormat (probed once per instance).
+
+        Picks a binary format from BINARY_OUTPUT_FORMATS if the server's
+        GetCapabilities lists one and pyogrio is installed to read it,
+        otherwise GeoJSON. If the capabilities can't be fetched or parsed,
+        GeoJSON is used.
+
+        Returns:
+            outputFormat value for GetFeature requests
+        """
+        if self._preferred_format is not None:
+            return self._preferred_format
+
+        self._preferred_format = GETFEATURE_PARAMS["outputFormat"]
+        if pyogrio is None:
+            # Binary formats can't be read - no need to ask the server
+            return self._preferred_format
+
+        client = await self._get_client()
+        try:
+            response = await client.get(
+                self.base_url,
+                params={"service": "WFS", "version": "2.0.0", "request": "GetCapabilities"},
+            )
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except (httpx.HTTPError, ET.ParseError):
+            return self._preferred_format
+
+        output_formats = {value.text for value in root.iterfind(_OUTPUT_FORMAT_VALUES)}
+        for output_format in BINARY_OUTPUT_FORMATS:
+            if output_format in output_formats:
+                self._preferred_format = output_format
+                break
+        return self._preferred_format
+
     async def get_features(
         self,
         bbox: tuple[float, float, float, float],
@@ -84,27 +190,39 @@ class WFSProtocol(Protocol):
         else:
             bbox_transformed = bbox
 
+        # Probe the supported output formats once per protocol instance
+        await self._select_output_format()
+
         client = await self._get_client()
-        all_gdfs = []
+        semaphore = asyncio.Semaphore(self.max_concurrent_layers)
 
-        for layer_name in layers:
-            try:
-                gdf = await self._download_layer(
+        async def download(layer_name: str) -> gpd.GeoDataFrame:
+            async with semaphore:
+                return await self._download_layer(
                     client, layer_name, bbox_transformed, crs, limit or self.max_features
                 )
-                if not gdf.empty:
-                    # Add layer name for identification
-                    gdf["_collection"] = layer_name.split(":")[-1]  # Remove namespace
-                    all_gdfs.append(gdf)
-            except Exception as e:
-                print(f"Warning: Failed to download {layer_name}: {e}")
+
+        # Layers are independent requests - download them concurrently
+        results = await asyncio.gather(
+            *(download(layer_name) for layer_name in layers), return_exceptions=True
+        )
+
+        all_gdfs = []
+        for layer_name, result in zip(layers, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"Warning: Failed to download {layer_name}: {result}")
+            elif not result.empty:
+                # Add layer name for identification
+                result["_collection"] = layer_name.split(":")[-1]  # Remove namespace
+                all_gdfs.append(result)
 
         if not all_gdfs:
             return gpd.GeoDataFrame()
 
-        # Combine all layers
-        combined = gpd.GeoDataFrame(gpd.pd.concat(all_gdfs, ignore_index=True))
-        combined.set_crs(crs, inplace=True)
+        # Combine all layers (concat of GeoDataFrames keeps the type and CRS)
+        combined = gpd.pd.concat(all_gdfs, ignore_index=True, copy=False)
+        if combined.crs is None:
+            combined.set_crs(crs, inplace=True)
         return combined
 
     async def _download_layer(
@@ -130,30 +248,26 @@ class WFSProtocol(Protocol):
         # Build WFS GetFeature request
         bbox_str = f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}"
         params = {
-            "service": "WFS",
-            "version": "2.0.0",
-            "request": "GetFeature",
+            **GETFEATURE_PARAMS,
             "typeName": layer_name,
-            "outputFormat": "json",
             "srsName": crs,
             "bbox": bbox_str,
             "count": limit,
+            "outputFormat": self._preferred_format or GETFEATURE_PARAMS["outputFormat"],
         }
 
         try:
             response = await client.get(self.base_url, params=params)
             response.raise_for_status()
 
-            # Parse GeoJSON response
-            geojson = response.json()
-
-            # Convert to GeoDataFrame
-            if "features" in geojson and geojson["features"]:
-                gdf = gpd.GeoDataFrame.from_features(geojson["features"])
-                gdf.set_crs(crs, inplace=True)
-                return gdf
+            # Convert to GeoDataFrame (parsing is CPU-bound, keep it off the event loop)
+            if params["outputFormat"] in BINARY_OUTPUT_FORMATS:
+                gdf = await asyncio.to_thread(_read_binary, response.content)
             else:
-                return gpd.GeoDataFrame()
+                gdf = await asyncio.to_thread(_read_geojson, response.content)
+            if not gdf.empty:
+                gdf.set_crs(crs, inplace=True, allow_override=True)
+            return gdf
 
         except httpx.HTTPError as e:
             raise WFSError(f"Failed to download {layer_name}: {e}") from e
@@ -4,13 +4,119 @@ Supports downloading tiled imagery from WMTS services.
 Specification: https://www.ogc.org/standards/wmts
 """
 
+import asyncio
 import io
-from typing import Any, Optional, Tuple
+import math
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
 
 import httpx
+import numpy as np
 from PIL import Image
 
-from giskit.protocols.base import Protocol
+from giskit.protocols.base import HTTP_LIMITS, Protocol
+
+# HTTP statuses worth retrying: rate limited or tile server temporarily unavailable
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Tile retry backoff: 0.1s, 0.2s, 0.4s, ... capped at 5s, plus up to 0.1s jitter
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 5.0
+
+# JPEG/PNG tiles are already compressed; gzip on top only costs CPU on both
+# ends (and httpx's decompression step) without shrinking them
+_TILE_HEADERS = {"Accept-Encoding": "identity"}
+
+
+def _retry_delay(error: httpx.HTTPError, attempt: int) -> Optional[float]:
+    """Decide whether a failed tile request should be retried, and after how long.
+
+    Args:
+        error: Raised httpx exception
+        attempt: Zero-based attempt number
+
+    Returns:
+        Seconds to wait before retrying, or None if the error is not transient
+    """
+    backoff = min(RETRY_BASE_DELAY * (2**attempt), RETRY_MAX_DELAY) + random.random() * 0.1
+
+    if isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return backoff
+
+    if isinstance(error, httpx.HTTPStatusError):
+        if error.response.status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        # Honour the server's Retry-After (seconds form) when it asks for longer
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return max(backoff, float(retry_after))
+        return backoff
+
+    return None
+
+
+def _decode_tile(content: bytes, draft_size: Optional[int] = None) -> Image.Image:
+    """Decode tile image bytes.
+
+    Image.open() is lazy, so the pixel data is loaded here to keep the
+    JPEG/PNG decode inside the calling worker thread.
+
+    Args:
+        content: Encoded tile image
+        draft_size: Decode JPEGs straight to this (smaller) size using
+            libjpeg's DCT scaling (ignored for other formats)
+
+    Returns:
+        Decoded PIL Image
+    """
+    img = Image.open(io.BytesIO(content))
+    if draft_size is not None:
+        img.draft("RGB", (draft_size, draft_size))
+    img.load()
+    return img
+
+
+def _read_cached_tile(
+    path: Path, max_age_days: Optional[float], draft_size: Optional[int] = None
+) -> Optional[Image.Image]:
+    """Decode a tile from the disk cache.
+
+    Args:
+        path: Cached tile file
+        max_age_days: Maximum age of the cached file (None = never expires)
+        draft_size: Reduced JPEG decode size (see _decode_tile)
+
+    Returns:
+        Decoded PIL Image, or None if the tile isn't cached or has expired
+    """
+    try:
+        if max_age_days is not None:
+            age_days = (time.time() - path.stat().st_mtime) / (24 * 3600)
+            if age_days >= max_age_days:
+                return None
+        return _decode_tile(path.read_bytes(), draft_size)
+    except (OSError, Image.UnidentifiedImageError):
+        # Missing, unreadable or corrupt cache entry - download it again
+        return None
+
+
+def _write_cached_tile(path: Path, content: bytes) -> None:
+    """Store tile bytes in the disk cache.
+
+    Writes to a temporary file first so concurrent readers never see a
+    partially written tile.
+
+    Args:
+        path: Cached tile file
+        content: Encoded tile image
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.replace(path)
 
 
 class WMTSError(Exception):
@@ -38,6 +144,11 @@ class WMTSProtocol(Protocol):
         timeout: float = 30.0,
         tile_size: int = 256,
         tile_format: str = "jpeg",
+        max_concurrent_tiles: int = 8,
+        cache_dir: Optional[Path] = None,
+        cache_days: Optional[float] = 30,
+        no_cache: bool = False,
+        max_retries: int = 3,
         **kwargs: Any,
     ):
         """Initialize WMTS protocol.
@@ -49,6 +160,13 @@ class WMTSProtocol(Protocol):
             timeout: Request timeout in seconds
             tile_size: Tile size in pixels (default: 256)
             tile_format: Tile format (jpeg, png)
+            max_concurrent_tiles: Maximum tiles downloaded at the same time
+            cache_dir: Directory to cache downloaded tiles
+                (default: ~/.cache/giskit/wmts)
+            cache_days: Number of days to cache tiles (None = never expire)
+            no_cache: Always download tiles, bypassing the disk cache
+            max_retries: Attempts per tile for transient failures (timeouts,
+                connection errors, 429/5xx)
             **kwargs: Additional configuration
         """
         super().__init__(base_url, timeout=timeout, **kwargs)
@@ -56,6 +174,11 @@ class WMTSProtocol(Protocol):
         self.tile_matrix_set = tile_matrix_set
         self.tile_size = tile_size
         self.tile_format = tile_format
+        self.max_concurrent_tiles = max_concurrent_tiles
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "giskit" / "wmts"
+        self.cache_days = cache_days
+        self.no_cache = no_cache
+        self.max_retries = max_retries
 
         # Parse EPSG code from tile_matrix_set
         self.crs_code = (
@@ -106,6 +229,41 @@ class WMTSProtocol(Protocol):
                 "Currently only EPSG:28992 is implemented."
             )
 
+        # Ground size of one tile per zoom level (tile_size * res)
+        self._tile_span = {
+            zoom: self.tile_size * info["res"] for zoom, info in self.tile_matrix.items()
+        }
+
+        # Zoom levels 0..N that halve the resolution at every step allow the
+        # closest zoom level to be computed instead of searched for
+        self._res0 = self.tile_matrix[0]["res"]
+        self._max_zoom = max(self.tile_matrix)
+        self._geometric_zoom = list(self.tile_matrix) == list(range(self._max_zoom + 1)) and all(
+            math.isclose(self.tile_matrix[z]["res"], self._res0 / 2**z)
+            for z in self.tile_matrix
+        )
+
+    def _client_limits(self) -> httpx.Limits:
+        """Size the connection pool for concurrent tile downloads.
+
+        Tiles all come from one host, so 2x max_concurrent_tiles connections
+        are kept alive for the whole grid instead of being re-established
+        (TCP + TLS) per batch. When the default pool is that large already
+        it is used as-is, so the client is shared with other protocols
+        talking to the same host.
+
+        Returns:
+            Connection pool limits
+        """
+        connections = self.max_concurrent_tiles * 2
+        if connections <= HTTP_LIMITS.max_keepalive_connections:
+            return HTTP_LIMITS
+        return httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+            keepalive_expiry=HTTP_LIMITS.keepalive_expiry,
+        )
+
     async def get_capabilities(self) -> dict[str, Any]:
         """Get WMTS service capabilities.
 
@@ -146,6 +304,16 @@ class WMTSProtocol(Protocol):
             max_dim = max(width, height)
             target_resolution = max_dim / 2000
 
+        if self._geometric_zoom and target_resolution > 0:
+            # res(z) = res0 / 2**z: the closest level is one of the two around log2(res0 / target)
+            z = math.log2(self._res0 / target_resolution)
+            lower = min(self._max_zoom, max(0, math.floor(z)))
+            upper = min(self._max_zoom, lower + 1)
+            lower_diff = abs(self.tile_matrix[lower]["res"] - target_resolution)
+            upper_diff = abs(self.tile_matrix[upper]["res"] - target_resolution)
+            # Ties go to the lower zoom level, like the linear scan below
+            return upper if upper_diff < lower_diff else lower
+
         # Find zoom level closest to target resolution
         best_zoom = 13  # Default
         min_diff = float("inf")
@@ -169,17 +337,30 @@ class WMTSProtocol(Protocol):
         Returns:
             (tile_col, tile_row) indices
         """
-        res = self.tile_matrix[zoom]["res"]
+        span = self._tile_span[zoom]
+
+        # Offset from origin in tiles (Y increases downward in tile space)
+        return int((x - self.tile_origin_x) / span), int((self.tile_origin_y - y) / span)
+
+    def make_coord_converter(self, zoom: int) -> Callable[[float, float], Tuple[int, int]]:
+        """Build a coords_to_tile function specialized for one zoom level.
 
-        # Calculate offset from origin
-        dx = x - self.tile_origin_x
-        dy = self.tile_origin_y - y  # Y increases downward in tile space
+        The tile span and origin are bound once, so repeated conversions at
+        the same zoom level are plain arithmetic.
 
-        # Convert to tile indices
-        tile_col = int(dx / (self.tile_size * res))
-        tile_row = int(dy / (self.tile_size * res))
+        Args:
+            zoom: Zoom level
+
+        Returns:
+            Function mapping (x, y) to (tile_col, tile_row)
+        """
+        span = self._tile_span[zoom]
+        origin_x, origin_y = self.tile_origin_x, self.tile_origin_y
 
-        return tile_col, tile_row
+        def convert(x: float, y: float) -> Tuple[int, int]:
+            return int((x - origin_x) / span), int((origin_y - y) / span)
+
+        return convert
 
     def tile_to_coords(self, tile_col: int, tile_row: int, zoom: int) -> Tuple[float, float]:
         """Convert tile indices to coordinates (top-left corner).
@@ -192,12 +373,8 @@ class WMTSProtocol(Protocol):
         Returns:
             (x, y) coordinates of tile's top-left corner
         """
-        res = self.tile_matrix[zoom]["res"]
-
-        x = self.tile_origin_x + tile_col * self.tile_size * res
-        y = self.tile_origin_y - tile_row * self.tile_size * res
-
-        return x, y
+        span = self._tile_span[zoom]
+        return self.tile_origin_x + tile_col * span, self.tile_origin_y - tile_row * span
 
     def get_tile_url(self, zoom: int, tile_col: int, tile_row: int) -> str:
         """Construct WMTS tile URL.
@@ -217,31 +394,93 @@ class WMTSProtocol(Protocol):
             f"{zoom:02d}/{tile_col}/{tile_row}.{self.tile_format}"
         )
 
-    async def download_tile(self, zoom: int, tile_col: int, tile_row: int) -> Optional[Image.Image]:
+    def get_tile_cache_path(self, zoom: int, tile_col: int, tile_row: int) -> Path:
+        """Path of a tile in the disk cache.
+
+        Args:
+            zoom: Zoom level
+            tile_col: Tile column index
+            tile_row: Tile row index
+
+        Returns:
+            Cache file path, laid out like the RESTful tile URL
+        """
+        return (
+            self.cache_dir
+            / self.layer
+            / self.tile_matrix_set.replace(":", "_")
+            / f"{zoom:02d}"
+            / str(tile_col)
+            / f"{tile_row}.{self.tile_format}"
+        )
+
+    async def download_tile(
+        self, zoom: int, tile_col: int, tile_row: int, draft_size: Optional[int] = None
+    ) -> Optional[Image.Image]:
         """Download a single tile.
 
+        Tiles are served from the disk cache when available (unless no_cache
+        is set) and stored there after a successful download.
+
         Args:
             zoom: Zoom level
             tile_col: Tile column
             tile_row: Tile row
+            draft_size: Decode JPEG tiles straight to this (smaller) size
 
         Returns:
-            PIL Image or None if download failed
+            PIL Image or None if the tile doesn't exist or keeps failing
         """
+        return await self._download_tile(
+            zoom, tile_col, tile_row, draft_size, self.no_cache, self.cache_days
+        )
+
+    async def _download_tile(
+        self,
+        zoom: int,
+        tile_col: int,
+        tile_row: int,
+        draft_size: Optional[int],
+        no_cache: bool,
+        cache_days: Optional[float],
+    ) -> Optional[Image.Image]:
+        """Download a single tile with explicit cache settings (see download_tile)."""
+        cache_path = None
+        if not no_cache:
+            cache_path = self.get_tile_cache_path(zoom, tile_col, tile_row)
+            img = await asyncio.to_thread(_read_cached_tile, cache_path, cache_days, draft_size)
+            if img is not None:
+                return img
+
         client = await self._get_client()
         url = self.get_tile_url(zoom, tile_col, tile_row)
 
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
+        for attempt in range(self.max_retries):
+            try:
+                response = await client.get(url, headers=_TILE_HEADERS)
+                response.raise_for_status()
+                break
+            except httpx.HTTPError as e:
+                # A 404 means the tile is outside the coverage area; only
+                # transient failures are retried
+                delay = _retry_delay(e, attempt)
+                if attempt == self.max_retries - 1 or delay is None:
+                    return None
+                await asyncio.sleep(delay)
+        else:
+            return None
 
-            # Load image from bytes
-            img = Image.open(io.BytesIO(response.content))
-            return img
+        # Decode in a worker thread so other tile downloads keep going
+        img = await asyncio.to_thread(_decode_tile, response.content, draft_size)
 
-        except httpx.HTTPError:
-            # Tile might not exist (outside coverage area)
-            return None
+        if cache_path is not None:
+            try:
+                await asyncio.to_thread(_write_cached_tile, cache_path, response.content)
+            except OSError:
+                # Caching is best-effort
+                pass
+
+        return img
 
     async def get_features(
         self,
@@ -269,6 +508,7 @@ class WMTSProtocol(Protocol):
         crs: str = "EPSG:28992",
         zoom: Optional[int] = None,
         progress_callback: Optional[Any] = None,
+        draft: bool = False,
         **kwargs: Any,
     ) -> Image.Image:
         """Download raster imagery for bounding box.
@@ -280,7 +520,14 @@ class WMTSProtocol(Protocol):
             crs: Coordinate reference system (must match TileMatrixSet)
             zoom: Explicit zoom level (overrides resolution-based calculation)
             progress_callback: Optional callback(message, percent)
-            **kwargs: Additional parameters
+            draft: When the zoom level is finer than `resolution`, decode JPEG
+                tiles downscaled by 2, 4 or 8 (libjpeg DCT scaling) so the
+                image comes out closer to the target resolution, faster and
+                with less memory
+            **kwargs: Additional parameters:
+                - cache_days: Override the tile cache expiry for this download
+                  (None = never expire)
+                - no_cache: Override bypassing the disk tile cache
 
         Returns:
             PIL Image with aerial imagery
@@ -304,8 +551,9 @@ class WMTSProtocol(Protocol):
             progress_callback(f"Using zoom level {zoom} (resolution: {res:.3f}m/px)", 0.0)
 
         # Calculate tile range
-        min_col, max_row = self.coords_to_tile(minx, miny, zoom)  # bottom-left
-        max_col, min_row = self.coords_to_tile(maxx, maxy, zoom)  # top-right
+        to_tile = self.make_coord_converter(zoom)
+        min_col, max_row = to_tile(minx, miny)  # bottom-left
+        max_col, min_row = to_tile(maxx, maxy)  # top-right
 
         cols = range(min_col, max_col + 1)
         rows = range(min_row, max_row + 1)
@@ -314,42 +562,60 @@ class WMTSProtocol(Protocol):
         if progress_callback:
             progress_callback(f"Downloading {len(cols)}x{len(rows)} = {total_tiles} tiles", 0.1)
 
+        # Reduced-size JPEG decoding: largest power of two scale that doesn't
+        # go coarser than the target resolution
+        scale = 1
+        if draft and self.tile_format.lower() in ("jpeg", "jpg") and resolution:
+            ratio = resolution / self.tile_matrix[zoom]["res"]
+            while scale < 8 and scale * 2 <= ratio:
+                scale *= 2
+        ts = self.tile_size // scale
+        draft_size = ts if scale > 1 else None
+
+        # Tiles are blitted into a single RGB buffer as they arrive, so each
+        # decoded tile can be released right away (missing tiles stay black)
+        width = len(cols) * ts
+        height = len(rows) * ts
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+        # Per-download cache settings, falling back to the protocol's own
+        no_cache = kwargs.get("no_cache", self.no_cache)
+        cache_days = kwargs.get("cache_days", self.cache_days)
+
         # Download tiles in parallel
-        tiles = {}
         downloaded = 0
-
-        # Download tiles sequentially for now
-        # TODO: Add parallel downloading with asyncio.gather
-        for row in rows:
-            for col in cols:
-                tile_img = await self.download_tile(zoom, col, row)
-
-                if tile_img:
-                    tiles[(col, row)] = tile_img
-                    downloaded += 1
-
-                if progress_callback:
-                    percent = 0.1 + 0.7 * (downloaded / total_tiles)
-                    progress_callback(f"Downloaded {downloaded}/{total_tiles} tiles", percent)
-
-        if not tiles:
+        semaphore = asyncio.Semaphore(self.max_concurrent_tiles)
+
+        async def download(col: int, row: int) -> None:
+            nonlocal downloaded
+            async with semaphore:
+                tile_img = await self._download_tile(
+                    zoom, col, row, draft_size, no_cache, cache_days
+                )
+
+            if tile_img:
+                if tile_img.mode != "RGB":
+                    tile_img = tile_img.convert("RGB")
+                if tile_img.size != (ts, ts):
+                    # Server sent something draft() couldn't scale (e.g. PNG)
+                    tile_img = tile_img.resize((ts, ts))
+                x = (col - min_col) * ts
+                y = (row - min_row) * ts
+                canvas[y : y + ts, x : x + ts] = np.asarray(tile_img)
+                downloaded += 1
+
+            if progress_callback:
+                percent = 0.1 + 0.7 * (downloaded / total_tiles)
+                progress_callback(f"Downloaded {downloaded}/{total_tiles} tiles", percent)
+
+        # Tiles are independent requests - only latency bound, so overlap them
+        await asyncio.gather(*(download(col, row) for row in rows for col in cols))
+
+        if not downloaded:
             raise WMTSError("No tiles downloaded - area might be outside coverage")
 
-        if progress_callback:
-            progress_callback("Stitching tiles together...", 0.8)
-
-        # Stitch tiles into single image
-        width = len(cols) * self.tile_size
-        height = len(rows) * self.tile_size
-        result = Image.new("RGB", (width, height))
-
-        for (col, row), tile_img in tiles.items():
-            x = (col - min_col) * self.tile_size
-            y = (row - min_row) * self.tile_size
-            result.paste(tile_img, (x, y))
-
-        # Crop to exact bbox
-        res = self.tile_matrix[zoom]["res"]
+        # Crop to exact bbox (at the decoded resolution)
+        res = self.tile_matrix[zoom]["res"] * scale
 
         # Calculate pixel offsets for exact bbox
         tile_min_x, tile_max_y = self.tile_to_coords(min_col, min_row, zoom)
@@ -365,7 +631,7 @@ class WMTSProtocol(Protocol):
         right_px = min(width, right_px)
         bottom_px = min(height, bottom_px)
 
-        result = result.crop((left_px, top_px, right_px, bottom_px))
+        result = Image.fromarray(canvas[top_px:bottom_px, left_px:right_px])
 
         if progress_callback:
             progress_callback(f"Final image: {result.width}x{result.height} pixels", 0.9)
@@ -17,11 +17,18 @@ from typing import Any, Optional
 import geopandas as gpd
 
 from giskit.core.recipe import Dataset, Location
-from giskit.protocols.base import Protocol
+from giskit.protocols.base import ClientPool, Protocol
 
 
 class Provider(ABC):
-    """Abstract base class for all data providers."""
+    """Abstract base class for all data providers.
+
+    Protocol handlers keep their HTTP connections open between downloads;
+    use the provider as an async context manager (``async with provider:``)
+    to close them when done.
+    """
+
+    __slots__ = ("name", "config", "_protocols", "_client_pool")
 
     def __init__(self, name: str, **kwargs: Any):
         """Initialize provider.
@@ -33,6 +40,8 @@ class Provider(ABC):
         self.name = name
         self.config = kwargs
         self._protocols: dict[str, Protocol] = {}
+        # HTTP clients shared by this provider's protocols
+        self._client_pool = ClientPool()
 
     @abstractmethod
     async def get_metadata(self) -> dict[str, Any]:
@@ -62,6 +71,10 @@ class Provider(ABC):
     ) -> gpd.GeoDataFrame:
         """Download a dataset for a specific location.
 
+        HTTP connections opened for the download stay open for later calls;
+        use the provider as an async context manager (``async with provider:``)
+        so they are closed when done.
+
         Args:
             dataset: Dataset specification from recipe
             location: Location specification from recipe
@@ -170,6 +183,8 @@ class Provider(ABC):
             protocol: Protocol instance
         """
         self._protocols[name] = protocol
+        if isinstance(protocol, Protocol):
+            protocol.use_client_pool(self._client_pool)
 
     def get_protocol(self, name: str) -> Optional[Protocol]:
         """Get a registered protocol instance.
@@ -196,9 +211,13 @@ class Provider(ABC):
 class ProviderRegistry:
     """Registry for all available providers."""
 
+    __slots__ = ("_providers", "_resolution_cache")
+
     def __init__(self) -> None:
         """Initialize empty provider registry."""
         self._providers: dict[str, type[Provider]] = {}
+        # Config-driven resolutions by name: (provider class, constructor kwargs)
+        self._resolution_cache: dict[str, tuple[type[Provider], dict[str, Any]]] = {}
 
     def register(self, name: str, provider_class: type[Provider]) -> None:
         """Register a provider class.
@@ -208,6 +227,20 @@ class ProviderRegistry:
             provider_class: Provider class (not instance)
         """
         self._providers[name] = provider_class
+        self._resolution_cache.pop(name, None)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget cached config-driven provider resolutions.
+
+        Call after provider config files change at runtime.
+
+        Args:
+            name: Provider identifier (None = all providers)
+        """
+        if name is None:
+            self._resolution_cache.clear()
+        else:
+            self._resolution_cache.pop(name, None)
 
     def get(self, name: str) -> Optional[type[Provider]]:
         """Get a provider class by name.
@@ -258,7 +291,26 @@ class ProviderRegistry:
         if provider_class is not None:
             return provider_class(name=name, **kwargs)
 
-        # Try auto-discovery from config
+        # Config-driven providers are resolved once per name
+        resolved = self._resolution_cache.get(name)
+        if resolved is None:
+            resolved = self._resolution_cache[name] = self._resolve(name)
+
+        provider_class, provider_kwargs = resolved
+        return provider_class(**provider_kwargs, **kwargs)
+
+    def _resolve(self, name: str) -> tuple[type[Provider], dict[str, Any]]:
+        """Resolve a provider name to a class via config auto-discovery.
+
+        Args:
+            name: Provider identifier
+
+        Returns:
+            Tuple of (provider class, constructor kwargs derived from the config)
+
+        Raises:
+            ValueError: If provider not found
+        """
         from giskit.config.discovery import get_provider_config
 
         config = get_provider_config(name)
@@ -274,9 +326,10 @@ class ProviderRegistry:
             # Unified multi-protocol provider
             from giskit.providers.multi_protocol import MultiProtocolProvider
 
-            return MultiProtocolProvider(
-                name=config["base_name"], config_file=config.get("config_file"), **kwargs
-            )
+            return MultiProtocolProvider, {
+                "name": config["base_name"],
+                "config_file": config.get("config_file"),
+            }
 
         # Legacy split format - instantiate based on single protocol
         protocol = config.get("protocol")
@@ -286,15 +339,15 @@ class ProviderRegistry:
         if protocol == "ogc-features":
             from giskit.providers.ogc_features import OGCFeaturesProvider
 
-            return OGCFeaturesProvider(name=config["base_name"], **kwargs)
+            return OGCFeaturesProvider, {"name": config["base_name"]}
         elif protocol == "wcs":
             from giskit.providers.wcs import WCSProvider
 
-            return WCSProvider(name=f"{config['base_name']}-wcs", **kwargs)
+            return WCSProvider, {"name": f"{config['base_name']}-wcs"}
         elif protocol == "wmts":
             from giskit.providers.wmts import WMTSProvider
 
-            return WMTSProvider(name=f"{config['base_name']}-wmts", **kwargs)
+            return WMTSProvider, {"name": f"{config['base_name']}-wmts"}
         else:
             raise ValueError(f"Unknown protocol '{protocol}' for provider '{name}'")
 
@@ -4,7 +4,7 @@ Provides access to public transport stops/stations via GTFS feeds.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import geopandas as gpd
 
@@ -26,6 +26,8 @@ class GTFSProvider(Provider):
         >>> stops = await provider.download_dataset(dataset)
     """
 
+    __slots__ = ("gtfs_url", "cache_days", "protocol", "metadata")
+
     def __init__(
         self,
         name: str,
@@ -38,15 +40,14 @@ class GTFSProvider(Provider):
         Args:
             name: Provider name (e.g., "ndov")
             gtfs_url: URL to GTFS zip file (loaded from config if not provided)
-            cache_days: Days to cache GTFS data (default: 1)
+            cache_days: Days before the cached GTFS feed is revalidated (default: 1)
             **kwargs: Additional configuration
         """
         super().__init__(name, **kwargs)
 
         # Load config if gtfs_url not provided
         if gtfs_url is None:
-            import yaml
-
+            from giskit.config import load_yaml
             from giskit.config.discovery import get_provider_config
 
             provider_meta = get_provider_config(name)
@@ -58,8 +59,7 @@ class GTFSProvider(Provider):
             if not config_file:
                 raise ValueError(f"No config_file found for provider '{name}'")
 
-            with open(config_file) as f:
-                full_config = yaml.safe_load(f)
+            full_config = load_yaml(config_file)
 
             gtfs_url = full_config.get("gtfs_url")
             if not gtfs_url:
@@ -154,16 +154,19 @@ class GTFSProvider(Provider):
         Returns:
             GeoDataFrame with stops in specified CRS
         """
-        from giskit.core.spatial import buffer_point_to_bbox, transform_bbox
+        from giskit.core.spatial import transform_bbox
 
         # Convert location to bbox
         if location.type == "bbox":
             bbox_rd = tuple(location.value)
         elif location.type == "point":
-            # Get radius from location or kwargs
+            # Stops within a true radius (meters in RD) of the point
             radius = location.radius or kwargs.get("radius", 1000)
-            lon, lat = location.value[:2]
-            bbox_rd = buffer_point_to_bbox(lon, lat, radius, crs="EPSG:28992")
+            coords = cast(list[float], location.value)
+            x, y = float(coords[0]), float(coords[1])
+            return await self.protocol.get_features_near(
+                x, y, radius, point_crs="EPSG:28992", crs=output_crs
+            )
         else:
             raise ValueError(f"Unsupported location type: {location.type}")
 
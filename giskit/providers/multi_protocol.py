@@ -11,16 +11,85 @@ based on the service configuration.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 import geopandas as gpd
-import yaml
 
-from giskit.core.recipe import Dataset, Location
+from giskit.config import load_yaml
+from giskit.core.recipe import Dataset, Location, LocationType
 from giskit.protocols.base import Protocol
 from giskit.providers.base import Provider
 
 
+def _ogc_features_handler(
+    provider: str, service_config: dict[str, Any], service_id: str | None
+) -> Protocol:
+    from giskit.protocols.ogc_features import OGCFeaturesProtocol
+    from giskit.protocols.quirks import get_service_quirks
+
+    # Get proper quirks object for this service
+    if not service_id:
+        # Fallback: try to extract from config
+        service_id = service_config.get("title", "").split(" - ")[0].lower()
+        if not service_id:
+            service_id = service_config.get("url", "").split("/")[-2]
+    quirks = get_service_quirks(provider, "ogc-features", service_id)
+
+    return OGCFeaturesProtocol(service_config["url"], quirks=quirks)
+
+
+def _wcs_handler(
+    provider: str, service_config: dict[str, Any], service_id: str | None
+) -> Protocol:
+    from giskit.protocols.wcs import WCSProtocol
+
+    return WCSProtocol(service_config["url"])
+
+
+def _wmts_handler(
+    provider: str, service_config: dict[str, Any], service_id: str | None
+) -> Protocol:
+    from giskit.protocols.wmts import WMTSProtocol
+
+    return WMTSProtocol(service_config["url"])
+
+
+def _gtfs_handler(
+    provider: str, service_config: dict[str, Any], service_id: str | None
+) -> Protocol:
+    from giskit.protocols.gtfs import GTFSProtocol
+
+    return GTFSProtocol(service_config["url"])
+
+
+def _csv_handler(
+    provider: str, service_config: dict[str, Any], service_id: str | None
+) -> Protocol:
+    from giskit.protocols.csv import CSVProtocol
+
+    return CSVProtocol()  # type: ignore[return-value]
+
+
+def _wfs_handler(
+    provider: str, service_config: dict[str, Any], service_id: str | None
+) -> Protocol:
+    from giskit.protocols.wfs import WFSProtocol
+
+    return WFSProtocol(service_config["url"])
+
+
+# Protocol handler factories by protocol name: (provider name, service config,
+# service id) -> handler. Protocol modules are imported on first use.
+_PROTOCOL_FACTORIES: dict[str, Callable[[str, dict[str, Any], str | None], Protocol]] = {
+    "ogc-features": _ogc_features_handler,
+    "wcs": _wcs_handler,
+    "wmts": _wmts_handler,
+    "gtfs": _gtfs_handler,
+    "csv": _csv_handler,
+    "wfs": _wfs_handler,
+}
+
+
 class MultiProtocolProvider(Provider):
     """Provider supporting multiple protocols from unified config.
 
@@ -48,6 +117,14 @@ class MultiProtocolProvider(Provider):
             ...
     """
 
+    __slots__ = (
+        "config_file",
+        "metadata",
+        "services",
+        "services_by_protocol",
+        "services_by_category",
+    )
+
     def __init__(self, name: str, config_file: Path | None = None, **kwargs: Any):
         """Initialize multi-protocol provider.
 
@@ -61,6 +138,8 @@ class MultiProtocolProvider(Provider):
         self.config_file = config_file
         self.services: dict[str, dict[str, Any]] = {}
         self.services_by_protocol: dict[str, dict[str, dict[str, Any]]] = {}
+        # Service ids by category (None = no category set)
+        self.services_by_category: dict[Optional[str], list[str]] = {}
 
         # Load config
         if config_file and config_file.exists():
@@ -68,8 +147,7 @@ class MultiProtocolProvider(Provider):
 
     def _load_config(self, config_file: Path) -> None:
         """Load unified provider config and organize services by protocol."""
-        with open(config_file) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(config_file)
 
         if not data or "services" not in data:
             return
@@ -90,6 +168,11 @@ class MultiProtocolProvider(Provider):
 
             self.services_by_protocol[protocol][service_id] = service_config
 
+            # Group by category for category listings
+            self.services_by_category.setdefault(service_config.get("category"), []).append(
+                service_id
+            )
+
     async def get_metadata(self) -> dict[str, Any]:
         """Get provider metadata.
 
@@ -129,6 +212,9 @@ class MultiProtocolProvider(Provider):
     ) -> gpd.GeoDataFrame:
         """Download a dataset using the appropriate protocol.
 
+        HTTP connections stay open for later downloads; use the provider as an
+        async context manager (``async with provider:``) to close them.
+
         Args:
             dataset: Dataset specification from recipe
             location: Location specification
@@ -154,55 +240,61 @@ class MultiProtocolProvider(Provider):
         service_config = self.services[dataset.service]
         protocol_name = service_config.get("protocol", "ogc-features")
 
-        # Get or create protocol handler
-        protocol = self.get_protocol(protocol_name)
+        # Get or create protocol handler (one per protocol and endpoint, so
+        # datasets from the same service reuse it)
+        handler_key = f"{protocol_name}:{service_config.get('url', dataset.service)}"
+        protocol = self.get_protocol(handler_key)
         if protocol is None:
             protocol = self._create_protocol_handler(
                 protocol_name, service_config, service_id=dataset.service
             )
-            self.register_protocol(protocol_name, protocol)
+            self.register_protocol(handler_key, protocol)
 
-        # Convert location to bbox using spatial helper
-        from giskit.core.spatial import location_to_bbox
+        # Convert location to bbox using spatial helper (only addresses need
+        # the async geocoding path)
+        from giskit.core.spatial import location_to_bbox, location_to_bbox_sync
 
-        bbox = await location_to_bbox(location, "EPSG:4326")
+        if location.type == LocationType.ADDRESS:
+            bbox = await location_to_bbox(location, "EPSG:4326")
+        else:
+            bbox = location_to_bbox_sync(location, "EPSG:4326")
 
         # Get temporal filter from dataset (default to 'latest')
         temporal = dataset.temporal if dataset.temporal else "latest"
 
-        # Delegate to protocol handler based on protocol type
-        async with protocol:
-            if protocol_name in ("ogc-features", "wfs"):
-                # Vector data protocols - use get_features
-                gdf = await protocol.get_features(
-                    bbox=bbox,  # type: ignore
-                    layers=dataset.layers,
-                    crs=output_crs,
-                    temporal=temporal,
-                    **kwargs,
-                )
-            elif protocol_name in ("gtfs", "csv"):
-                # Data feed protocols - use fetch method
-                point = (
-                    tuple(location.value)
-                    if location.type == "point" and isinstance(location.value, list)
-                    else None
-                )  # type: ignore
-                gdf = await protocol.fetch(  # type: ignore
-                    service_config=service_config,
-                    bbox=tuple(bbox) if bbox else None,
-                    point=point,
-                    radius=location.radius if hasattr(location, "radius") else None,
-                    crs=output_crs,
-                    **kwargs,
-                )
-            else:
-                # For other protocols (WCS, WMTS), delegate to specialized providers
-                # These protocols need more complex handling (raster data, tiling, etc.)
-                raise NotImplementedError(
-                    f"Download for {protocol_name} protocol should use specialized provider classes "
-                    f"(WCSProvider, WMTSProvider) rather than MultiProtocolProvider"
-                )
+        # Delegate to protocol handler based on protocol type. The handler's
+        # HTTP client stays open for later datasets and is closed on provider exit.
+        if protocol_name in ("ogc-features", "wfs"):
+            # Vector data protocols - use get_features
+            gdf = await protocol.get_features(
+                bbox=bbox,  # type: ignore
+                layers=dataset.layers,
+                crs=output_crs,
+                temporal=temporal,
+                **kwargs,
+            )
+        elif protocol_name in ("gtfs", "csv"):
+            # Data feed protocols - use fetch method
+            point = (
+                tuple(location.value)
+                if location.type == "point" and isinstance(location.value, list)
+                else None
+            )  # type: ignore
+            gdf = await protocol.fetch(  # type: ignore
+                service_config=service_config,
+                bbox=tuple(bbox) if bbox else None,
+                point=point,
+                radius=location.radius if hasattr(location, "radius") else None,
+                crs=output_crs,
+                **kwargs,
+            )
+        else:
+            # For other protocols (WCS, WMTS), delegate to specialized providers
+            # These protocols need more complex handling (raster data, tiling, etc.)
+            raise NotImplementedError(
+                f"Download for {protocol_name} protocol should use specialized provider classes "
+                f"(WCSProvider, WMTSProvider) rather than MultiProtocolProvider"
+            )
 
         return gdf
 
@@ -222,49 +314,10 @@ class MultiProtocolProvider(Provider):
         Raises:
             ValueError: If protocol not supported
         """
-        if protocol_name == "ogc-features":
-            from giskit.protocols.ogc_features import OGCFeaturesProtocol
-            from giskit.protocols.quirks import get_service_quirks
-
-            # Get proper quirks object for this service
-            if service_id:
-                quirks = get_service_quirks(self.name, protocol_name, service_id)
-            else:
-                # Fallback: try to extract from config
-                fallback_id = service_config.get("title", "").split(" - ")[0].lower()
-                if not fallback_id:
-                    fallback_id = service_config.get("url", "").split("/")[-2]
-                quirks = get_service_quirks(self.name, protocol_name, fallback_id)
-
-            return OGCFeaturesProtocol(service_config["url"], quirks=quirks)
-
-        elif protocol_name == "wcs":
-            from giskit.protocols.wcs import WCSProtocol
-
-            return WCSProtocol(service_config["url"])
-
-        elif protocol_name == "wmts":
-            from giskit.protocols.wmts import WMTSProtocol
-
-            return WMTSProtocol(service_config["url"])
-
-        elif protocol_name == "gtfs":
-            from giskit.protocols.gtfs import GTFSProtocol
-
-            return GTFSProtocol()
-
-        elif protocol_name == "csv":
-            from giskit.protocols.csv import CSVProtocol
-
-            return CSVProtocol()
-
-        elif protocol_name == "wfs":
-            from giskit.protocols.wfs import WFSProtocol
-
-            return WFSProtocol(service_config["url"])
-
-        else:
+        factory = _PROTOCOL_FACTORIES.get(protocol_name)
+        if factory is None:
             raise ValueError(f"Unsupported protocol: {protocol_name}")
+        return factory(self.name, service_config, service_id)
 
     def get_supported_services(self) -> list[str]:
         """Get list of all supported services across all protocols.
@@ -302,11 +355,7 @@ class MultiProtocolProvider(Provider):
         Returns:
             List of service identifiers
         """
-        return [
-            service_id
-            for service_id, config in self.services.items()
-            if config.get("category") == category
-        ]
+        return list(self.services_by_category.get(category, ()))
 
     def get_service_info(self, service_id: str) -> dict[str, Any]:
         """Get detailed information about a service.
@@ -334,5 +383,4 @@ class MultiProtocolProvider(Provider):
         Returns:
             Sorted list of unique category names
         """
-        categories = {config.get("category", "other") for config in self.services.values()}
-        return sorted(categories)
+        return sorted({"other" if c is None else c for c in self.services_by_category})
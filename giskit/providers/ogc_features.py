@@ -22,12 +22,12 @@ This replaces hardcoded provider classes like PDOKProvider.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import geopandas as gpd
 
 from giskit.config import load_services
-from giskit.core.recipe import Dataset, Location
+from giskit.core.recipe import Dataset, Location, LocationType
 from giskit.protocols.ogc_features import OGCFeaturesProtocol
 from giskit.providers.base import Provider, register_provider
 
@@ -49,6 +49,8 @@ class OGCFeaturesProvider(Provider):
     - Coverage data (use WCSProvider instead)
     """
 
+    __slots__ = ("services", "services_by_category")
+
     def __init__(self, name: str, **kwargs: Any):
         """Initialize OGC API Features provider.
 
@@ -75,6 +77,10 @@ class OGCFeaturesProvider(Provider):
                 f"Check config/services/{name}.yml exists and is valid."
             )
 
+        # Service ids by category (None = no category set; old string-format
+        # services have no metadata and aren't listed)
+        self.services_by_category: dict[Optional[str], list[str]] = {}
+
         # Register OGC Features protocols for each service
         for service_name, service_config in self.services.items():
             # Handle both old string format and new dict format
@@ -82,6 +88,9 @@ class OGCFeaturesProvider(Provider):
                 service_url = service_config
             else:
                 service_url = service_config["url"]
+                self.services_by_category.setdefault(service_config.get("category"), []).append(
+                    service_name
+                )
 
             # Get service-specific quirks (handles fallback to provider/format quirks)
             from giskit.protocols.quirks import get_service_quirks
@@ -123,6 +132,9 @@ class OGCFeaturesProvider(Provider):
     ) -> gpd.GeoDataFrame:
         """Download a dataset for a specific location.
 
+        HTTP connections stay open for later downloads; use the provider as an
+        async context manager (``async with provider:``) to close them.
+
         Args:
             dataset: Dataset specification from recipe
             location: Location specification from recipe
@@ -151,25 +163,28 @@ class OGCFeaturesProvider(Provider):
         if protocol is None:
             raise ValueError(f"Protocol not registered: {protocol_name}")
 
-        # Convert location to bbox using spatial helper
-        from giskit.core.spatial import location_to_bbox
+        # Convert location to bbox using spatial helper (only addresses need
+        # the async geocoding path)
+        from giskit.core.spatial import location_to_bbox, location_to_bbox_sync
 
-        bbox = await location_to_bbox(location, "EPSG:4326")
+        if location.type == LocationType.ADDRESS:
+            bbox = await location_to_bbox(location, "EPSG:4326")
+        else:
+            bbox = location_to_bbox_sync(location, "EPSG:4326")
 
         # Get temporal filter from dataset (default to 'latest')
         temporal = (
             dataset.temporal if hasattr(dataset, "temporal") and dataset.temporal else "latest"
         )
 
-        # Download features using OGC API
-        async with protocol:
-            gdf = await protocol.get_features(
-                bbox=bbox,  # type: ignore
-                layers=dataset.layers,
-                crs=output_crs,
-                temporal=temporal,
-                **kwargs,
-            )
+        # Download features using OGC API (the client stays open until provider exit)
+        gdf = await protocol.get_features(
+            bbox=bbox,  # type: ignore
+            layers=dataset.layers,
+            crs=output_crs,
+            temporal=temporal,
+            **kwargs,
+        )
 
         return gdf
 
@@ -198,12 +213,7 @@ class OGCFeaturesProvider(Provider):
         Returns:
             List of service names in this category
         """
-        services = []
-        for service_name, service_config in self.services.items():
-            if isinstance(service_config, dict):
-                if service_config.get("category") == category:
-                    services.append(service_name)
-        return services
+        return list(self.services_by_category.get(category, ()))
 
     def get_service_info(self, service_id: str) -> dict[str, Any]:
         """Get detailed information about a specific service.
@@ -244,12 +254,7 @@ class OGCFeaturesProvider(Provider):
         Returns:
             List of category names
         """
-        categories = set()
-        for service_config in self.services.values():
-            if isinstance(service_config, dict):
-                category = service_config.get("category", "other")
-                categories.add(category)
-        return sorted(categories)
+        return sorted({"other" if c is None else c for c in self.services_by_category})
 
 
 # Register OGC API Features provider globally
@@ -52,6 +52,8 @@ class WCSProvider(Provider):
     - Pre-rendered tiles (use WMTSProvider instead)
     """
 
+    __slots__ = ("services", "protocols")
+
     def __init__(self, name: str, **kwargs: Any):
         """Initialize WCS provider.
 
@@ -91,12 +93,15 @@ class WCSProvider(Provider):
                     # Create protocol key: service.coverage (e.g., "ahn.dsm", "ahn.dtm")
                     protocol_key = f"{service_name}.{coverage_key}"
 
-                    self.protocols[protocol_key] = WCSProtocol(
+                    protocol = WCSProtocol(
                         base_url=url,
                         coverage_id=coverage_id,
                         native_crs=native_crs,
                         native_resolution=native_resolution,
                     )
+                    self.protocols[protocol_key] = protocol
+                    # Also register so provider exit closes its HTTP client
+                    self.register_protocol(protocol_key, protocol)
 
         print("✅ WCSProvider initialized")
         print(f"   Loaded {len(self.services)} services from config")
@@ -135,6 +140,9 @@ class WCSProvider(Provider):
     ) -> gpd.GeoDataFrame:
         """Download a dataset for a specific location.
 
+        HTTP connections stay open for later downloads; use the provider as an
+        async context manager (``async with provider:``) to close them.
+
         Args:
             dataset: Dataset specification from recipe
             location: Location specification from recipe
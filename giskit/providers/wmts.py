@@ -53,6 +53,8 @@ class WMTSProvider(Provider):
     - Dynamic WMS rendering (use WMSProvider if needed)
     """
 
+    __slots__ = ("services", "protocols")
+
     def __init__(self, name: str, **kwargs: Any):
         """Initialize WMTS provider.
 
@@ -88,12 +90,15 @@ class WMTSProvider(Provider):
                 # Register protocol for each layer
                 for layer_key, layer_name in layers.items():
                     protocol_key = f"{service_name}.{layer_key}"
-                    self.protocols[protocol_key] = WMTSProtocol(
+                    protocol = WMTSProtocol(
                         base_url=url,
                         layer=layer_name,
                         tile_matrix_set=service_config.get("tile_matrix_set", "EPSG:28992"),
                         tile_format=service_config.get("tile_format", "jpeg"),
                     )
+                    self.protocols[protocol_key] = protocol
+                    # Also register so provider exit closes its HTTP client
+                    self.register_protocol(protocol_key, protocol)
 
     async def get_metadata(self) -> dict[str, Any]:
         """Get provider metadata.
@@ -127,6 +132,9 @@ class WMTSProvider(Provider):
     ) -> gpd.GeoDataFrame:
         """Download a dataset (imagery) for a specific location.
 
+        HTTP connections stay open for later downloads; use the provider as an
+        async context manager (``async with provider:``) to close them.
+
         Args:
             dataset: Dataset specification from recipe
             location: Location specification from recipe
@@ -137,6 +145,11 @@ class WMTSProvider(Provider):
                 - resolution: Target resolution in meters/pixel (optional)
                 - layer: Specific layer name like "actueel_25cm" (optional)
                 - progress_callback: Callback function for progress updates
+                - draft: Decode JPEG tiles downscaled towards the target
+                  resolution when the zoom level is finer (optional)
+                - cache_days: Days before cached tiles are downloaded again,
+                  None = never expire (optional, default: 30)
+                - no_cache: Bypass the disk tile cache (optional)
 
         Returns:
             Empty GeoDataFrame (WMTS returns images, not vector data)
@@ -185,16 +198,18 @@ class WMTSProvider(Provider):
         resolution = kwargs.get("resolution", dataset.resolution if dataset.resolution else None)
         progress_callback = kwargs.get("progress_callback")
 
-        # Download imagery using WMTS protocol
-        async with protocol:
-            image = await protocol.get_coverage(
-                bbox=bbox,  # type: ignore
-                product=layer_key,
-                resolution=resolution or 0.25,  # Default to 25cm
-                crs=output_crs,
-                zoom=zoom,
-                progress_callback=progress_callback,
-            )
+        # Download imagery using WMTS protocol (the client stays open until provider exit)
+        image = await protocol.get_coverage(
+            bbox=bbox,  # type: ignore
+            product=layer_key,
+            resolution=resolution or 0.25,  # Default to 25cm
+            crs=output_crs,
+            zoom=zoom,
+            progress_callback=progress_callback,
+            draft=kwargs.get("draft", False),
+            # Only pass cache settings that were given, so protocol defaults apply
+            **{key: kwargs[key] for key in ("cache_days", "no_cache") if key in kwargs},
+        )
 
         # Save if output path provided
         if output_path:
@@ -0,0 +1,117 @@
+"""Tests for converting 3DBAG CityJSON pages to GeoDataFrames."""
+
+import pytest
+
+from giskit.protocols.cityjson import cityjson_to_geodataframe
+
+# Unit cube of 10 x 10 x 5 m in quantized (integer) vertices
+CUBE_VERTICES = [
+    [0, 0, 0],
+    [10000, 0, 0],
+    [10000, 10000, 0],
+    [0, 10000, 0],
+    [0, 0, 5000],
+    [10000, 0, 5000],
+    [10000, 10000, 5000],
+    [0, 10000, 5000],
+]
+
+CUBE_SURFACES = [
+    [[0, 3, 2, 1]],
+    [[4, 5, 6, 7]],
+    [[0, 1, 5, 4]],
+    [[1, 2, 6, 5]],
+    [[2, 3, 7, 6]],
+    [[3, 0, 4, 7]],
+]
+
+
+def building(identificatie: str, vertices: list, parts: list | None = None) -> dict:
+    """CityJSON feature with a Building (LOD 0 footprint) and optional parts."""
+    city_objects = {
+        identificatie: {
+            "type": "Building",
+            "attributes": {
+                "identificatie": identificatie,
+                "oorspronkelijkbouwjaar": 1930,
+                "b3_volume_lod22": 500.0,
+            },
+            "geometry": [{"lod": "0", "type": "MultiSurface", "boundaries": [[[0, 1, 2, 3]]]}],
+        }
+    }
+    for i, geometry in enumerate(parts or []):
+        city_objects[f"{identificatie}-{i}"] = {"type": "BuildingPart", "geometry": geometry}
+    return {"type": "CityJSONFeature", "CityObjects": city_objects, "vertices": vertices}
+
+
+def page(translate: tuple[float, float, float] = (80000.0, 429000.0, 0.0)) -> dict:
+    """Transformed page: a cube with 3D parts, a footprint-only building, a non-building."""
+    cube = building(
+        "NL.IMBAG.Pand.1",
+        CUBE_VERTICES,
+        parts=[
+            [
+                {"lod": "1.2", "type": "Solid", "boundaries": [CUBE_SURFACES[:1]]},
+                {"lod": "2.2", "type": "Solid", "boundaries": [CUBE_SURFACES]},
+            ]
+        ],
+    )
+    flat = building(
+        "NL.IMBAG.Pand.2",
+        [[20000, 0, 0], [25000, 0, 0], [25000, 5000, 0], [20000, 5000, 0]],
+    )
+    other = {"CityObjects": {"x": {"type": "Road", "geometry": []}}, "vertices": []}
+    return {
+        "type": "FeatureCollection",
+        "metadata": {"transform": {"scale": [0.001, 0.001, 0.001], "translate": list(translate)}},
+        "features": [cube, flat, other],
+    }
+
+
+class TestCityJSONToGeoDataFrame:
+    """Test building footprints and 3D models from a CityJSON page."""
+
+    def test_lod0_footprints(self):
+        """Test that LOD 0 gives a dequantized 2D footprint per building."""
+        gdf = cityjson_to_geodataframe(page(), lod="0")
+
+        assert list(gdf["identificatie"]) == ["NL.IMBAG.Pand.1", "NL.IMBAG.Pand.2"]
+        assert gdf.columns[0] == "geometry"
+        assert gdf.crs == "EPSG:28992"
+        assert not gdf.geometry.has_z.any()
+        assert tuple(gdf.geometry.iloc[0].bounds) == pytest.approx((80000, 429000, 80010, 429010))
+        assert list(gdf.geometry.area) == pytest.approx([100.0, 25.0])
+        assert list(gdf["bouwjaar"]) == [1930, 1930]
+        assert "volume_lod22" not in gdf.columns
+
+    def test_lod22_solids(self):
+        """Test that LOD 2.2 gives a 3D MultiPolygon of all surfaces."""
+        gdf = cityjson_to_geodataframe(page(), lod="2.2")
+
+        # The footprint-only building has no LOD 2.2 model
+        assert list(gdf["identificatie"]) == ["NL.IMBAG.Pand.1"]
+        geometry = gdf.geometry.iloc[0]
+        assert geometry.geom_type == "MultiPolygon"
+        assert len(geometry.geoms) == 6
+        assert geometry.has_z
+        assert tuple(geometry.bounds) == pytest.approx((80000, 429000, 80010, 429010))
+        zs = [z for polygon in geometry.geoms for _, _, z in polygon.exterior.coords]
+        assert (min(zs), max(zs)) == pytest.approx((0.0, 5.0))
+        assert list(gdf["volume_lod22"]) == [500.0]
+
+    def test_selects_requested_lod(self):
+        """Test that LOD 1.2 picks its own solid, not the LOD 2.2 one."""
+        gdf = cityjson_to_geodataframe(page(), lod="1.2")
+
+        assert len(gdf.geometry.iloc[0].geoms) == 1
+
+    def test_uses_page_transform(self):
+        """Test that each page's own translate is applied to its vertices."""
+        gdf = cityjson_to_geodataframe(page(translate=(90000.0, 430000.0, 2.0)), lod="2.2")
+
+        minx, miny, maxx, maxy = gdf.geometry.iloc[0].bounds
+        assert (minx, miny, maxx, maxy) == pytest.approx((90000, 430000, 90010, 430010))
+
+    def test_empty_page(self):
+        """Test that a page without features gives an empty result."""
+        assert cityjson_to_geodataframe({"features": []}).empty
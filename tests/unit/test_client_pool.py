@@ -0,0 +1,311 @@
+"""Tests for HTTP client sharing between protocol instances."""
+
+import asyncio
+import io
+from typing import Any
+
+import httpx
+from PIL import Image
+
+from giskit.core.recipe import Dataset, Location
+from giskit.protocols.base import ClientPool, Protocol
+from giskit.protocols.ogc_features import OGCFeaturesProtocol
+from giskit.protocols.quirks import ProtocolQuirks
+from giskit.protocols.wmts import WMTSProtocol
+from giskit.providers.base import Provider
+from giskit.providers.wmts import WMTSProvider
+
+
+class DummyProtocol(Protocol):
+    """Minimal protocol for exercising client management."""
+
+    async def get_capabilities(self) -> dict[str, Any]:
+        return {}
+
+    async def get_features(self, bbox, layers=None, crs="EPSG:4326", **kwargs):  # type: ignore
+        raise NotImplementedError
+
+    async def get_coverage(self, bbox, product, resolution, crs="EPSG:4326", **kwargs):  # type: ignore
+        raise NotImplementedError
+
+
+class LimitedProtocol(DummyProtocol):
+    """Protocol with its own connection pool limits."""
+
+    def _client_limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=64, max_keepalive_connections=64)
+
+
+class DummyProvider(Provider):
+    """Minimal provider for exercising protocol registration."""
+
+    async def get_metadata(self) -> dict[str, Any]:
+        return {}
+
+    async def download_dataset(
+        self, dataset, location, output_path, output_crs="EPSG:4326", **kwargs
+    ):  # type: ignore
+        raise NotImplementedError
+
+    def get_supported_services(self) -> list[str]:
+        return []
+
+    def get_supported_protocols(self) -> list[str]:
+        return []
+
+    def get_service_info(self, service_id: str) -> dict[str, Any]:
+        return {}
+
+    def get_services_by_category(self, category: str) -> list[str]:
+        return []
+
+    def list_categories(self) -> list[str]:
+        return []
+
+
+class TestClientPool:
+    """Test client sharing through a ClientPool."""
+
+    async def test_same_host_shares_client(self):
+        """Test that protocols for one host on a pool get the same client."""
+        pool = ClientPool()
+        a = DummyProtocol("https://api.example.com/a/")
+        b = DummyProtocol("https://api.example.com/b/")
+        a.use_client_pool(pool)
+        b.use_client_pool(pool)
+
+        client_a = await a._get_client()
+        client_b = await b._get_client()
+
+        assert client_a is client_b
+        assert len(pool) == 1
+
+        await a.__aexit__(None, None, None)
+        await b.__aexit__(None, None, None)
+
+    async def test_closed_on_last_release(self):
+        """Test that the shared client is closed only when its last holder exits."""
+        pool = ClientPool()
+        a = DummyProtocol("https://api.example.com/a/")
+        b = DummyProtocol("https://api.example.com/b/")
+        a.use_client_pool(pool)
+        b.use_client_pool(pool)
+        client = await a._get_client()
+        await b._get_client()
+
+        await a.__aexit__(None, None, None)
+        assert not client.is_closed
+        assert len(pool) == 1
+
+        await b.__aexit__(None, None, None)
+        assert client.is_closed
+        assert len(pool) == 0
+
+    async def test_reacquire_after_close(self):
+        """Test that a new client is created after the shared one was closed."""
+        pool = ClientPool()
+        protocol = DummyProtocol("https://api.example.com/")
+        protocol.use_client_pool(pool)
+        first = await protocol._get_client()
+        await protocol.__aexit__(None, None, None)
+
+        second = await protocol._get_client()
+
+        assert second is not first
+        assert not second.is_closed
+        await protocol.__aexit__(None, None, None)
+
+    async def test_separate_by_host(self):
+        """Test that different hosts get different clients."""
+        pool = ClientPool()
+        a = DummyProtocol("https://api.example.com/")
+        b = DummyProtocol("https://tiles.example.com/")
+        a.use_client_pool(pool)
+        b.use_client_pool(pool)
+
+        assert await a._get_client() is not await b._get_client()
+        assert len(pool) == 2
+
+        await a.__aexit__(None, None, None)
+        await b.__aexit__(None, None, None)
+
+    async def test_protocol_types_share(self):
+        """Test that WMTS and OGC Features protocols on one host share a client."""
+        pool = ClientPool()
+        ogc = OGCFeaturesProtocol(
+            "https://service.example.com/ogc/",
+            quirks=ProtocolQuirks(custom_headers={"X-Api-Key": "secret"}),
+        )
+        wmts = WMTSProtocol("https://service.example.com/wmts", layer="ortho")
+        ogc.use_client_pool(pool)
+        wmts.use_client_pool(pool)
+
+        assert await ogc._get_client() is await wmts._get_client()
+        assert len(pool) == 1
+
+        await ogc.__aexit__(None, None, None)
+        await wmts.__aexit__(None, None, None)
+
+    async def test_headers_are_sent_per_request(self, monkeypatch):
+        """Test that protocol headers reach the server without a client of their own."""
+        seen: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            if "/ogc/" in request.url.path:
+                return httpx.Response(200, json={"collections": []})
+            return httpx.Response(404)
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+        async with DummyProvider("dummy") as provider:
+            ogc = OGCFeaturesProtocol(
+                "https://service.example.com/ogc/",
+                quirks=ProtocolQuirks(custom_headers={"X-Api-Key": "secret"}),
+            )
+            wmts = WMTSProtocol("https://service.example.com/wmts", layer="ortho", no_cache=True)
+            provider.register_protocol("ogc", ogc)
+            provider.register_protocol("wmts", wmts)
+
+            await ogc.get_capabilities()
+            await wmts.download_tile(12, 10, 20)
+
+        assert seen[0]["X-Api-Key"] == "secret"
+        assert seen[1]["Accept-Encoding"] == "identity"
+        assert "X-Api-Key" not in seen[1]
+
+    async def test_separate_by_limits(self):
+        """Test that different pool limits get different clients."""
+        pool = ClientPool()
+        a = DummyProtocol("https://api.example.com/")
+        b = LimitedProtocol("https://api.example.com/")
+        a.use_client_pool(pool)
+        b.use_client_pool(pool)
+
+        assert await a._get_client() is not await b._get_client()
+
+        await a.__aexit__(None, None, None)
+        await b.__aexit__(None, None, None)
+
+    async def test_standalone_protocols_do_not_share(self):
+        """Test that protocols without a common pool keep their own clients."""
+        a = DummyProtocol("https://api.example.com/")
+        b = DummyProtocol("https://api.example.com/")
+
+        client_a = await a._get_client()
+        client_b = await b._get_client()
+
+        assert client_a is not client_b
+
+        await a.__aexit__(None, None, None)
+        assert client_a.is_closed
+        assert not client_b.is_closed
+        await b.__aexit__(None, None, None)
+
+    def test_forgets_clients_of_closed_loops(self):
+        """Test that clients left open on a finished event loop are dropped."""
+        pool = ClientPool()
+        protocol = DummyProtocol("https://api.example.com/")
+        protocol.use_client_pool(pool)
+
+        # Never released: the loop ends with the client still held
+        asyncio.run(protocol._get_client())
+        assert len(pool) == 1
+
+        other = DummyProtocol("https://tiles.example.com/")
+        other.use_client_pool(pool)
+
+        async def acquire_and_count() -> int:
+            await other._get_client()
+            count = len(pool)
+            await other.__aexit__(None, None, None)
+            return count
+
+        assert asyncio.run(acquire_and_count()) == 1
+
+
+class TestProviderClientPool:
+    """Test client sharing scoped to a provider."""
+
+    async def test_provider_protocols_share_and_close(self):
+        """Test that registered protocols share clients until provider exit."""
+        a = DummyProtocol("https://api.example.com/a/")
+        b = DummyProtocol("https://api.example.com/b/")
+
+        async with DummyProvider("dummy") as provider:
+            provider.register_protocol("a", a)
+            provider.register_protocol("b", b)
+            client = await a._get_client()
+            assert await b._get_client() is client
+
+        assert client.is_closed
+
+    async def test_providers_do_not_share(self):
+        """Test that separate providers keep separate clients."""
+        a = DummyProtocol("https://api.example.com/")
+        b = DummyProtocol("https://api.example.com/")
+
+        async with DummyProvider("one") as one, DummyProvider("two") as two:
+            one.register_protocol("a", a)
+            two.register_protocol("b", b)
+            assert await a._get_client() is not await b._get_client()
+
+
+class TestEventLoops:
+    """Test protocols and providers reused across asyncio.run() calls."""
+
+    def test_protocol_reacquires_on_new_loop(self):
+        """Test that a client from a finished event loop is replaced."""
+        pool = ClientPool()
+        protocol = DummyProtocol("https://api.example.com/")
+        protocol.use_client_pool(pool)
+
+        first = asyncio.run(protocol._get_client())
+
+        async def reacquire() -> httpx.AsyncClient:
+            client = await protocol._get_client()
+            assert len(pool) == 1
+            await protocol.__aexit__(None, None, None)
+            return client
+
+        second = asyncio.run(reacquire())
+
+        assert second is not first
+        assert second.is_closed
+        assert len(pool) == 0
+
+    def test_download_dataset_in_separate_runs(self, tmp_path, monkeypatch):
+        """Test that a provider keeps working across asyncio.run() calls."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (256, 256), (255, 0, 0)).save(buffer, format="JPEG")
+        tile = buffer.getvalue()
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=tile)),
+                **kwargs,
+            ),
+        )
+
+        provider = WMTSProvider("pdok-wmts")
+        protocol = provider.protocols["luchtfoto.actueel_25cm"]
+        protocol.no_cache = True
+        dataset = Dataset(provider="pdok-wmts", service="luchtfoto.actueel_25cm")
+        location = Location(type="bbox", value=[121000.0, 487000.0, 121100.0, 487100.0])
+
+        clients = []
+        for run in range(2):
+            output = tmp_path / f"run{run}.png"
+            asyncio.run(provider.download_dataset(dataset, location, output, zoom=12))
+            assert output.exists()
+            clients.append(protocol._client)
+
+        # Each run gets a client bound to its own event loop
+        assert clients[0] is not clients[1]
@@ -0,0 +1,292 @@
+"""Tests for the GTFS protocol (offline: prepared feed cache, mocked HTTP)."""
+
+import hashlib
+import io
+import json
+import os
+import time
+import zipfile
+from pathlib import Path
+
+import httpx
+import pytest
+from pyproj import Transformer
+
+from giskit.protocols.gtfs import GTFSProtocol
+
+FEED_URL = "https://example.com/gtfs/feed.zip"
+
+# Feed order: A (inside), C (outside), B (on the bbox corner), D (inside)
+STOPS_TXT = (
+    "stop_id,stop_name,stop_lat,stop_lon\n"
+    "0001,A,52.37,4.90\n"
+    "0002,C,53.00,5.50\n"
+    "0003,B,52.40,4.95\n"
+    "0004,D,52.36,4.91\n"
+)
+
+QUERY_BBOX = (4.85, 52.30, 4.95, 52.40)
+
+
+def make_feed(stops_txt: str = STOPS_TXT) -> bytes:
+    """Build a GTFS zip with the given stops.txt (plus an unused member)."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("stops.txt", stops_txt)
+        zf.writestr("stop_times.txt", "trip_id,stop_id\n1,0001\n")
+    return buffer.getvalue()
+
+
+def cache_paths(cache_dir: Path, url: str = FEED_URL) -> tuple[Path, Path]:
+    """Cached zip and validator paths for a feed URL."""
+    url_key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return cache_dir / f"{url_key}.zip", cache_dir / f"{url_key}.meta.json"
+
+
+@pytest.fixture
+def protocol(tmp_path: Path) -> GTFSProtocol:
+    """GTFS protocol whose feed is already cached (no network access)."""
+    cache_file, _ = cache_paths(tmp_path)
+    cache_file.write_bytes(make_feed())
+    return GTFSProtocol(FEED_URL, cache_dir=tmp_path)
+
+
+class TestGetFeatures:
+    """Test bbox queries through the stop R-tree."""
+
+    async def test_keeps_feed_order_and_boundary(self, protocol):
+        """Test that stops come back in feed order, including boundary points."""
+        gdf = await protocol.get_features(bbox=QUERY_BBOX)
+
+        assert list(gdf["stop_name"]) == ["A", "B", "D"]
+
+    async def test_limit_keeps_first_in_feed_order(self, protocol):
+        """Test that limit keeps the first matching stops of the feed."""
+        gdf = await protocol.get_features(bbox=QUERY_BBOX, limit=2)
+
+        assert list(gdf["stop_name"]) == ["A", "B"]
+
+    async def test_covering_bbox_returns_all(self, protocol):
+        """Test that a bbox covering the feed returns every stop."""
+        gdf = await protocol.get_features(bbox=(0.0, 50.0, 10.0, 55.0))
+
+        assert list(gdf["stop_name"]) == ["A", "C", "B", "D"]
+
+    async def test_no_match(self, protocol):
+        """Test that a bbox without stops returns an empty result."""
+        gdf = await protocol.get_features(bbox=(6.0, 51.0, 6.1, 51.1))
+
+        assert gdf.empty
+
+    async def test_skips_stops_without_coordinates(self, tmp_path):
+        """Test that stops without coordinates never match, even a covering bbox."""
+        cache_file, _ = cache_paths(tmp_path)
+        cache_file.write_bytes(make_feed(STOPS_TXT + "0005,Node,,\n"))
+        protocol = GTFSProtocol(FEED_URL, cache_dir=tmp_path)
+
+        gdf = await protocol.get_features(bbox=(0.0, 50.0, 10.0, 55.0))
+
+        assert list(gdf["stop_name"]) == ["A", "C", "B", "D"]
+        assert not gdf.geometry.is_empty.any()
+
+    async def test_stop_ids_are_strings(self, protocol):
+        """Test that stop IDs keep their leading zeros."""
+        gdf = await protocol.get_features(bbox=QUERY_BBOX)
+
+        assert list(gdf["stop_id"]) == ["0001", "0003", "0004"]
+
+    async def test_output_crs(self, protocol):
+        """Test that stops are reprojected to the requested CRS."""
+        wgs84 = await protocol.get_features(bbox=QUERY_BBOX)
+        rd = await protocol.get_features(bbox=QUERY_BBOX, crs="EPSG:28992")
+
+        expected = wgs84.to_crs("EPSG:28992")
+        assert rd.crs == expected.crs
+        assert rd.geometry.geom_equals_exact(expected.geometry, tolerance=1e-6).all()
+
+
+NEW_STOPS_TXT = "stop_id,stop_name,stop_lat,stop_lon\n0005,E,52.38,4.92\n"
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the protocol's HTTP requests to a handler; returns the request log."""
+    requests: list[httpx.Request] = []
+
+    def install(handler):
+        def logged(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(logged), **kwargs),
+        )
+        return requests
+
+    return install
+
+
+def make_stale(cache_file: Path, days: float = 2) -> None:
+    """Age a cached file past the revalidation interval."""
+    old = time.time() - days * 24 * 3600
+    os.utime(cache_file, (old, old))
+
+
+class TestConditionalGet:
+    """Test revalidating the cached feed with the server."""
+
+    async def test_fresh_cache_skips_request(self, tmp_path, serve):
+        """Test that a recently validated feed is used without a request."""
+        cache_file, _ = cache_paths(tmp_path)
+        cache_file.write_bytes(make_feed())
+        requests = serve(lambda request: httpx.Response(500))
+
+        data = await GTFSProtocol(FEED_URL, cache_dir=tmp_path)._load_gtfs_data()
+
+        assert requests == []
+        assert len(data["stops"]) == 4
+
+    async def test_not_modified_touches_cache(self, tmp_path, serve):
+        """Test that a 304 keeps the cached zip and restarts its interval."""
+        cache_file, meta_file = cache_paths(tmp_path)
+        feed = make_feed()
+        cache_file.write_bytes(feed)
+        meta_file.write_text(json.dumps({"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024"}))
+        make_stale(cache_file)
+        requests = serve(lambda request: httpx.Response(304))
+
+        data = await GTFSProtocol(FEED_URL, cache_dir=tmp_path)._load_gtfs_data()
+
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert requests[0].headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+        assert time.time() - cache_file.stat().st_mtime < 60
+        assert cache_file.read_bytes() == feed
+        assert json.loads(meta_file.read_text())["etag"] == '"v1"'
+        assert len(data["stops"]) == 4
+
+    async def test_modified_rewrites_cache(self, tmp_path, serve):
+        """Test that a 200 replaces the cached zip and its validators."""
+        cache_file, meta_file = cache_paths(tmp_path)
+        cache_file.write_bytes(make_feed())
+        meta_file.write_text(json.dumps({"etag": '"v1"'}))
+        make_stale(cache_file)
+        new_feed = make_feed(NEW_STOPS_TXT)
+        serve(
+            lambda request: httpx.Response(
+                200,
+                content=new_feed,
+                headers={"ETag": '"v2"', "Last-Modified": "Tue, 02 Jan 2024"},
+            )
+        )
+
+        data = await GTFSProtocol(FEED_URL, cache_dir=tmp_path)._load_gtfs_data()
+
+        assert cache_file.read_bytes() == new_feed
+        assert json.loads(meta_file.read_text()) == {
+            "etag": '"v2"',
+            "last_modified": "Tue, 02 Jan 2024",
+        }
+        assert list(data["stops"]["stop_name"]) == ["E"]
+
+    async def test_corrupt_meta_downloads_unconditionally(self, tmp_path, serve):
+        """Test that unreadable validators fall back to a plain GET."""
+        cache_file, meta_file = cache_paths(tmp_path)
+        cache_file.write_bytes(make_feed())
+        meta_file.write_text("{not json")
+        make_stale(cache_file)
+        new_feed = make_feed(NEW_STOPS_TXT)
+        requests = serve(
+            lambda request: httpx.Response(200, content=new_feed, headers={"ETag": '"v2"'})
+        )
+
+        data = await GTFSProtocol(FEED_URL, cache_dir=tmp_path)._load_gtfs_data()
+
+        assert "If-None-Match" not in requests[0].headers
+        assert "If-Modified-Since" not in requests[0].headers
+        assert json.loads(meta_file.read_text()) == {"etag": '"v2"'}
+        assert list(data["stops"]["stop_name"]) == ["E"]
+
+    async def test_missing_etag_drops_meta(self, tmp_path, serve):
+        """Test that a response without validators removes stale validators."""
+        cache_file, meta_file = cache_paths(tmp_path)
+        cache_file.write_bytes(make_feed())
+        meta_file.write_text(json.dumps({"etag": '"v1"'}))
+        make_stale(cache_file)
+        new_feed = make_feed(NEW_STOPS_TXT)
+        serve(lambda request: httpx.Response(200, content=new_feed))
+
+        await GTFSProtocol(FEED_URL, cache_dir=tmp_path)._load_gtfs_data()
+
+        assert cache_file.read_bytes() == new_feed
+        assert not meta_file.exists()
+
+    async def test_first_download_without_etag(self, tmp_path, serve):
+        """Test that an initial download without validators writes no meta file."""
+        cache_dir = tmp_path / "gtfs"
+        cache_file, meta_file = cache_paths(cache_dir)
+        requests = serve(lambda request: httpx.Response(200, content=make_feed()))
+
+        data = await GTFSProtocol(FEED_URL, cache_dir=cache_dir)._load_gtfs_data()
+
+        assert "If-None-Match" not in requests[0].headers
+        assert cache_file.exists()
+        assert not meta_file.exists()
+        assert len(data["stops"]) == 4
+
+
+def rd(lon: float, lat: float) -> tuple[float, float]:
+    """WGS84 point in RD New (EPSG:28992)."""
+    return Transformer.from_crs("EPSG:4326", "EPSG:28992", always_xy=True).transform(lon, lat)
+
+
+class TestGetFeaturesNear:
+    """Test radius queries around a point."""
+
+    # Around stop A: D is ~1.3 km away, B ~4.8 km but inside the radius' bbox
+    RADIUS = 4000.0
+
+    async def test_excludes_bbox_corner_outside_radius(self, protocol):
+        """Test that stops in the bbox corner but beyond the radius are dropped."""
+        x, y = rd(4.90, 52.37)
+        bx, by = rd(4.95, 52.40)
+        assert abs(bx - x) <= self.RADIUS and abs(by - y) <= self.RADIUS
+
+        gdf = await protocol.get_features_near(x, y, self.RADIUS)
+
+        assert list(gdf["stop_name"]) == ["A", "D"]
+
+    async def test_radius_includes_corner_when_large_enough(self, protocol):
+        """Test that growing the radius picks up the corner stop."""
+        x, y = rd(4.90, 52.37)
+
+        gdf = await protocol.get_features_near(x, y, 5000.0)
+
+        assert list(gdf["stop_name"]) == ["A", "B", "D"]
+
+    async def test_limit(self, protocol):
+        """Test that limit keeps the first stops in feed order."""
+        x, y = rd(4.90, 52.37)
+
+        gdf = await protocol.get_features_near(x, y, self.RADIUS, limit=1)
+
+        assert list(gdf["stop_name"]) == ["A"]
+
+    async def test_point_crs(self, protocol):
+        """Test that the point and radius may be given in another CRS."""
+        gdf = await protocol.get_features_near(4.90, 52.37, 0.005, point_crs="EPSG:4326")
+
+        assert list(gdf["stop_name"]) == ["A"]
+
+    async def test_output_crs(self, protocol):
+        """Test that stops are reprojected to the requested CRS."""
+        x, y = rd(4.90, 52.37)
+        wgs84 = await protocol.get_features_near(x, y, self.RADIUS)
+        rd_stops = await protocol.get_features_near(x, y, self.RADIUS, crs="EPSG:28992")
+
+        expected = wgs84.to_crs("EPSG:28992")
+        assert wgs84.crs == "EPSG:4326"
+        assert rd_stops.crs == expected.crs
+        assert rd_stops.geometry.geom_equals_exact(expected.geometry, tolerance=1e-6).all()
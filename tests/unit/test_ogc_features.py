@@ -0,0 +1,92 @@
+"""Tests for OGC API Features capabilities (mocked HTTP transport)."""
+
+import httpx
+import pytest
+
+from giskit.protocols.ogc_features import OGCFeaturesProtocol
+
+COLLECTIONS = {
+    "title": "Example service",
+    "collections": [
+        {
+            "id": "pand",
+            "title": "Panden",
+            "description": "Buildings",
+            "extent": {"spatial": {"bbox": [[3.2, 50.7, 7.3, 53.6]]}},
+        },
+        {
+            "id": "hoogte",
+            "title": "Hoogte",
+            "extent": {"spatial": {"bbox": [[3.2, 50.7, -5.0, 7.3, 53.6, 300.0]]}},
+        },
+        {
+            "id": "rd",
+            "extent": {
+                "spatial": {
+                    "bbox": [[10000.0, 300000.0, 280000.0, 620000.0]],
+                    "crs": "http://www.opengis.net/def/crs/EPSG/0/28992",
+                }
+            },
+        },
+    ],
+}
+
+
+@pytest.fixture
+def requests(monkeypatch) -> list[httpx.Request]:
+    """Serve COLLECTIONS for every request; returns the request log."""
+    log: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        log.append(request)
+        return httpx.Response(200, json=COLLECTIONS)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return log
+
+
+@pytest.fixture
+def protocol() -> OGCFeaturesProtocol:
+    return OGCFeaturesProtocol("https://example.com/ogc/")
+
+
+class TestCapabilities:
+    """Test collection metadata from the collections endpoint."""
+
+    async def test_capabilities(self, protocol, requests):
+        """Test the capabilities return shape."""
+        capabilities = await protocol.get_capabilities()
+
+        assert capabilities["title"] == "Example service"
+        assert capabilities["layers"] == ["pand", "hoogte", "rd"]
+        assert [layer["id"] for layer in capabilities["layer_details"]] == capabilities["layers"]
+        assert requests[0].url.path == "/ogc/collections"
+
+    async def test_layer_details(self, protocol, requests):
+        """Test per-collection details, including the CRS84 extent bbox."""
+        details = await protocol.get_layer_details()
+
+        assert details[0] == {
+            "id": "pand",
+            "title": "Panden",
+            "description": "Buildings",
+            "extent": COLLECTIONS["collections"][0]["extent"],
+            "bbox": (3.2, 50.7, 7.3, 53.6),
+        }
+        # 3D extents drop the heights; non-CRS84 extents have no bbox
+        assert details[1]["bbox"] == (3.2, 50.7, 7.3, 53.6)
+        assert details[1]["description"] is None
+        assert details[2]["bbox"] is None
+
+    async def test_layer_details_match_capabilities(self, protocol, requests):
+        """Test that layer details reuse the cached capabilities."""
+        capabilities = await protocol.get_capabilities()
+        details = await protocol.get_layer_details()
+
+        assert details is capabilities["layer_details"]
+        assert len(requests) == 1
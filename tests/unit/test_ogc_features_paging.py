@@ -0,0 +1,156 @@
+"""Tests for OGC API Features pagination (mocked HTTP transport)."""
+
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from giskit.protocols.ogc_features import OGCFeaturesProtocol
+
+BASE_URL = "https://example.com/ogc/"
+ITEMS_URL = f"{BASE_URL}collections/things/items"
+
+TOTAL = 25  # Features on the server
+PAGE_SIZE = 10  # Server page size, regardless of the requested limit
+
+
+def feature(n: int) -> dict:
+    """Point feature number n."""
+    return {
+        "type": "Feature",
+        "id": n,
+        "geometry": {"type": "Point", "coordinates": [4.9 + n * 0.001, 52.37]},
+        "properties": {"n": n},
+    }
+
+
+class FakeServer:
+    """Items endpoint paging TOTAL features by offset or by cursor."""
+
+    def __init__(self, cursor: bool = False):
+        self.cursor = cursor
+        self.requests: list[httpx.URL] = []
+
+    def next_link(self, start: int) -> str:
+        if self.cursor:
+            return f"{ITEMS_URL}?f=json&cursor=c{start}"
+        return f"{ITEMS_URL}?f=json&limit={PAGE_SIZE}&offset={start}"
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url)
+        query = parse_qs(urlsplit(str(request.url)).query)
+        if "cursor" in query:
+            start = int(query["cursor"][0][1:])
+        else:
+            start = int(query.get("offset", ["0"])[0])
+
+        end = min(start + PAGE_SIZE, TOTAL)
+        links = [{"rel": "next", "href": self.next_link(end)}] if end < TOTAL else []
+        return httpx.Response(
+            200,
+            json={
+                "type": "FeatureCollection",
+                "numberMatched": TOTAL,
+                "numberReturned": end - start,
+                "features": [feature(n) for n in range(start, end)],
+                "links": links,
+            },
+        )
+
+    def offsets(self) -> list[int]:
+        """Offsets requested after the first page, sorted."""
+        return sorted(
+            int(parse_qs(url.query.decode())["offset"][0])
+            for url in self.requests
+            if "offset" in parse_qs(url.query.decode())
+        )
+
+
+@pytest.fixture
+def protocol() -> OGCFeaturesProtocol:
+    return OGCFeaturesProtocol(BASE_URL)
+
+
+async def download(protocol, server: FakeServer, limit=None):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server.handler)) as client:
+        return await protocol._download_collection(
+            client, "things", (4.8, 52.3, 5.0, 52.4), limit, temporal="all"
+        )
+
+
+class TestOffsetPageUrls:
+    """Test building page URLs from the first `next` link."""
+
+    def test_infers_page_size_from_next_link(self, protocol):
+        """Test that the page size is taken from the next link's offset."""
+        urls = protocol._offset_page_urls(f"{ITEMS_URL}?f=json&offset=10", TOTAL, None)
+
+        offsets = [parse_qs(urlsplit(url).query)["offset"] for url in urls]
+        assert offsets == [["10"], ["20"]]
+
+    def test_keeps_other_parameters(self, protocol):
+        """Test that only the offset parameter changes between pages."""
+        urls = protocol._offset_page_urls(f"{ITEMS_URL}?f=json&limit=10&startindex=10", TOTAL, None)
+
+        assert [parse_qs(urlsplit(url).query) for url in urls] == [
+            {"f": ["json"], "limit": ["10"], "startindex": ["10"]},
+            {"f": ["json"], "limit": ["10"], "startindex": ["20"]},
+        ]
+
+    def test_limit_truncates_pages(self, protocol):
+        """Test that no pages past the limit are planned."""
+        urls = protocol._offset_page_urls(f"{ITEMS_URL}?offset=10", TOTAL, 15)
+
+        assert [parse_qs(urlsplit(url).query)["offset"] for url in urls] == [["10"]]
+
+    def test_cursor_link_is_not_offset_based(self, protocol):
+        """Test that cursor-based next links are left to link following."""
+        assert protocol._offset_page_urls(f"{ITEMS_URL}?cursor=abc", TOTAL, None) is None
+
+    def test_invalid_offset(self, protocol):
+        """Test that a non-numeric or zero offset disables offset paging."""
+        assert protocol._offset_page_urls(f"{ITEMS_URL}?offset=x", TOTAL, None) is None
+        assert protocol._offset_page_urls(f"{ITEMS_URL}?offset=0", TOTAL, None) is None
+
+
+class TestDownloadCollectionPaging:
+    """Test downloading all pages of a collection."""
+
+    async def test_offset_pages_with_final_short_page(self, protocol):
+        """Test that all pages, including a short last one, are fetched once."""
+        server = FakeServer()
+
+        gdf = await download(protocol, server)
+
+        assert list(gdf["n"]) == list(range(TOTAL))
+        # First page plus the two remaining pages, no trailing empty page
+        assert len(server.requests) == 3
+        assert server.offsets() == [10, 20]
+
+    async def test_limit_truncates(self, protocol):
+        """Test that the limit stops paging and trims the result."""
+        server = FakeServer()
+
+        gdf = await download(protocol, server, limit=15)
+
+        assert list(gdf["n"]) == list(range(15))
+        assert server.offsets() == [10]
+
+    async def test_limit_within_first_page(self, protocol):
+        """Test that no further pages are requested when the first page suffices."""
+        server = FakeServer()
+
+        gdf = await download(protocol, server, limit=5)
+
+        assert list(gdf["n"]) == list(range(5))
+        assert len(server.requests) == 1
+
+    async def test_cursor_pagination_follows_links(self, protocol):
+        """Test that non-offset next links are followed page by page."""
+        server = FakeServer(cursor=True)
+
+        gdf = await download(protocol, server)
+
+        assert list(gdf["n"]) == list(range(TOTAL))
+        assert len(server.requests) == 3
+        assert server.offsets() == []
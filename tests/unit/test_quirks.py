@@ -1,7 +1,16 @@
 """Unit tests for Protocol Quirks system."""
 
 
-from giskit.protocols.quirks import KNOWN_QUIRKS, ProtocolQuirks, get_format_quirks, get_quirks
+from giskit.protocols import quirks as quirks_module
+from giskit.protocols.quirks import (
+    KNOWN_QUIRKS,
+    LEGACY_KNOWN_QUIRKS,
+    ProtocolQuirks,
+    clear_quirks_cache,
+    get_format_quirks,
+    get_quirks,
+    get_service_quirks,
+)
 
 
 class TestProtocolQuirks:
@@ -132,6 +141,25 @@ class TestKnownQuirks:
         assert "PDOK" in quirks.description
         assert quirks.workaround_date is not None
 
+    def test_lookups_are_memoised(self):
+        """Test repeated lookups return the same cached instance."""
+        assert get_quirks("pdok", "ogc-features") is get_quirks("pdok", "ogc-features")
+        assert get_service_quirks("pdok", "ogc-features", "bag3d") is get_service_quirks(
+            "pdok", "ogc-features", "bag3d"
+        )
+
+    def test_clear_quirks_cache_picks_up_registry_changes(self):
+        """Test clearing the cache makes runtime KNOWN_QUIRKS edits visible."""
+        assert get_quirks("example", "ogc-features") == ProtocolQuirks()
+
+        KNOWN_QUIRKS["example"] = {"ogc-features": ProtocolQuirks(custom_timeout=10.0)}
+        try:
+            clear_quirks_cache()
+            assert get_quirks("example", "ogc-features").custom_timeout == 10.0
+        finally:
+            del KNOWN_QUIRKS["example"]
+            clear_quirks_cache()
+
     def test_get_quirks_pdok(self):
         """Test get_quirks() function for PDOK."""
         quirks = get_quirks("pdok", "ogc-features")
@@ -157,6 +185,52 @@ class TestKnownQuirks:
         assert quirks.require_format_param is False
 
 
+class TestServiceQuirksMerge:
+    """Test overlaying service quirks on provider quirks."""
+
+    def test_legacy_pdok_bag3d_merge(self, monkeypatch):
+        """Test that bag3d quirks keep the PDOK provider quirks they don't set."""
+        monkeypatch.setattr(quirks_module, "KNOWN_QUIRKS", dict(LEGACY_KNOWN_QUIRKS))
+        clear_quirks_cache()
+        try:
+            quirks = get_service_quirks("pdok", "ogc-features", "bag3d")
+        finally:
+            monkeypatch.undo()
+            clear_quirks_cache()
+
+        # From the PDOK provider quirks
+        assert quirks.require_format_param is True
+        assert quirks.requires_trailing_slash is True
+        # From the bag3d service quirks
+        assert quirks.format_is_cityjson is True
+        assert quirks.custom_timeout == 60.0
+        assert quirks.description == LEGACY_KNOWN_QUIRKS["bag3d"]["ogc-features"].description
+
+    def test_custom_headers_are_combined(self, monkeypatch):
+        """Test that service headers are added to the provider's."""
+        monkeypatch.setattr(
+            quirks_module,
+            "KNOWN_QUIRKS",
+            {
+                "example": {
+                    "ogc-features": ProtocolQuirks(
+                        custom_timeout=10.0, custom_headers={"A": "1", "B": "1"}
+                    )
+                },
+                "example-svc": {"ogc-features": ProtocolQuirks(custom_headers={"B": "2"})},
+            },
+        )
+        clear_quirks_cache()
+        try:
+            quirks = get_service_quirks("example", "ogc-features", "svc")
+        finally:
+            monkeypatch.undo()
+            clear_quirks_cache()
+
+        assert quirks.custom_headers == {"A": "1", "B": "2"}
+        assert quirks.custom_timeout == 10.0
+
+
 class TestQuirksDocumentation:
     """Test quirks documentation features."""
 
@@ -224,6 +298,41 @@ class TestQuirksInProtocol:
         assert isinstance(protocol.quirks, ProtocolQuirks)
         assert protocol.quirks.require_format_param is False
 
+    def test_protocol_pushes_temporal_filter_as_datetime(self):
+        """Test ISO date temporal filter is sent as OGC datetime parameter."""
+        from giskit.protocols.ogc_features import OGCFeaturesProtocol
+
+        protocol = OGCFeaturesProtocol(base_url="https://example.com/api")
+
+        params = protocol._build_base_params(None, "2024-01-01")
+        assert params["datetime"] == "2024-01-01T00:00:00Z"
+
+        # 'latest' and 'all' have no single instant
+        assert "datetime" not in protocol._build_base_params(None, "latest")
+        assert "datetime" not in protocol._build_base_params(None, "all")
+
+    def test_datetime_param_quirk_disables_pushdown(self):
+        """Test supports_datetime_param=False keeps temporal filtering client-side."""
+        from giskit.protocols.ogc_features import OGCFeaturesProtocol
+
+        quirks = ProtocolQuirks(supports_datetime_param=False)
+        protocol = OGCFeaturesProtocol(base_url="https://example.com/api", quirks=quirks)
+
+        assert "datetime" not in protocol._build_base_params(None, "2024-01-01")
+
+    def test_properties_param_quirk(self):
+        """Test attribute selection is only sent to servers that support it."""
+        from giskit.protocols.ogc_features import OGCFeaturesProtocol
+
+        protocol = OGCFeaturesProtocol(base_url="https://example.com/api")
+        assert "properties" not in protocol._build_base_params(None, properties=["naam"])
+
+        quirks = ProtocolQuirks(supports_properties_param=True)
+        protocol = OGCFeaturesProtocol(base_url="https://example.com/api", quirks=quirks)
+        params = protocol._build_base_params(None, properties="naam,status")
+        # Attributes needed for temporal filtering are always requested
+        assert params["properties"].startswith("naam,status,identificatie")
+
 
 class TestQuirksRealWorld:
     """Test quirks with real-world scenarios."""
@@ -122,6 +122,19 @@ class TestQuirksMonitor:
         assert stats["pdok"]["ogc-features"]["trailing_slash"].applied_count == 1
         assert stats["pdok"]["ogc-features"]["max_features_limit"].applied_count == 1
 
+    def test_record_quirks_applied_batch(self, monitor):
+        """Test recording several quirks in one call shares a timestamp."""
+        monitor.record_quirks_applied("pdok", "ogc-features", ["format_param", "trailing_slash"])
+        monitor.record_quirks_applied("pdok", "ogc-features", ["format_param"])
+        monitor.record_quirks_applied("osm", "overpass", [])
+
+        stats = monitor.get_statistics()
+        assert "osm" not in stats
+        quirks = stats["pdok"]["ogc-features"]
+        assert quirks["format_param"].applied_count == 2
+        assert quirks["trailing_slash"].applied_count == 1
+        assert quirks["trailing_slash"].first_applied == quirks["format_param"].first_applied
+
     def test_record_different_providers(self, monitor):
         """Test recording quirks for different providers."""
         monitor.record_quirk_applied("pdok", "ogc-features", "format_param")
@@ -295,6 +308,18 @@ class TestLogQuirkApplication:
         assert "trailing_slash" in stats["pdok"]["ogc-features"]
         assert stats["pdok"]["ogc-features"]["trailing_slash"].applied_count == 1
 
+    def test_log_with_monitor_disabled(self):
+        """Test nothing is recorded while the global monitor is disabled."""
+        monitor = get_monitor()
+        monitor.disable()
+        try:
+            assert monitor.enabled is False
+            quirks = ProtocolQuirks(requires_trailing_slash=True)
+            log_quirk_application(quirks, "pdok", "ogc-features", "get_capabilities")
+            assert monitor.get_statistics() == {}
+        finally:
+            monitor.enable()
+
     def test_log_format_param(self):
         """Test logging format_param quirk."""
         quirks = ProtocolQuirks(
@@ -0,0 +1,231 @@
+"""Tests for the WCS protocol (mocked HTTP transport, in-memory GeoTIFFs)."""
+
+import httpx
+import numpy as np
+import pytest
+import rasterio
+from rasterio.io import MemoryFile
+from rasterio.transform import from_bounds
+
+from giskit.protocols.wcs import WCSError, WCSProtocol
+
+BBOX = (120000.0, 487000.0, 120100.0, 487050.0)  # 100 x 50 m in RD New
+WIDTH, HEIGHT = 100, 50  # Pixels at 1 m resolution
+GRID_TRANSFORM = from_bounds(*BBOX, WIDTH, HEIGHT)
+
+
+def grid(dtype: str = "float32") -> np.ndarray:
+    """Distinct value per pixel, so misplaced windows show up."""
+    return np.arange(WIDTH * HEIGHT).reshape(HEIGHT, WIDTH).astype(dtype)
+
+
+def make_geotiff(data: np.ndarray, crs: str = "EPSG:28992") -> bytes:
+    """Encode a single-band GeoTIFF covering BBOX."""
+    with MemoryFile() as memfile:
+        with memfile.open(
+            driver="GTiff",
+            width=data.shape[1],
+            height=data.shape[0],
+            count=1,
+            dtype=data.dtype,
+            crs=crs,
+            transform=GRID_TRANSFORM,
+        ) as dataset:
+            dataset.write(data, 1)
+        return bytes(memfile.read())
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Answer every request with a fixed response; returns the request log."""
+    requests: list[httpx.Request] = []
+
+    def install(content: bytes, status_code: int = 200, content_type: str = "image/tiff"):
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                status_code, content=content, headers={"content-type": content_type}
+            )
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        return requests
+
+    return install
+
+
+@pytest.fixture
+def protocol() -> WCSProtocol:
+    return WCSProtocol("https://example.com/wcs", coverage_id="dtm_05m")
+
+
+class TestGetCoverageWindowed:
+    """Test reading a coverage window by window."""
+
+    async def test_windows_cover_the_grid(self, protocol, serve):
+        """Test that fixed-size windows reassemble into the full grid."""
+        serve(make_geotiff(grid()))
+        result = np.full((HEIGHT, WIDTH), -1, dtype="float32")
+
+        windows = 0
+        async for transform, data in protocol.get_coverage_windowed(
+            BBOX, resolution=1, window_size=32
+        ):
+            # Window offset in the full grid (1 m pixels), from the window's origin
+            col, row = round(transform.c - BBOX[0]), round(BBOX[3] - transform.f)
+            result[row : row + data.shape[0], col : col + data.shape[1]] = data
+            assert data.shape[0] <= 32 and data.shape[1] <= 32
+            windows += 1
+
+        assert windows == 4 * 2
+        np.testing.assert_array_equal(result, grid())
+
+    async def test_window_transforms(self, protocol, serve):
+        """Test that each window's transform locates it within the bbox."""
+        serve(make_geotiff(grid()))
+
+        transforms = [
+            transform
+            async for transform, _ in protocol.get_coverage_windowed(
+                BBOX, resolution=1, window_size=64
+            )
+        ]
+
+        assert [(t.c, t.f) for t in transforms] == [
+            (BBOX[0], BBOX[3]),
+            (BBOX[0] + 64, BBOX[3]),
+        ]
+
+    async def test_default_windows_follow_blocks(self, protocol, serve):
+        """Test that without a window size the GeoTIFF's blocks are used."""
+        serve(make_geotiff(grid()))
+
+        total = 0
+        async for _, data in protocol.get_coverage_windowed(BBOX, resolution=1):
+            total += data.size
+
+        assert total == WIDTH * HEIGHT
+
+    async def test_requests_bbox_grid(self, protocol, serve):
+        """Test that the GetCoverage request asks for the bbox at the resolution."""
+        requests = serve(make_geotiff(grid()))
+
+        async for _ in protocol.get_coverage_windowed(BBOX, resolution=1):
+            pass
+
+        params = requests[0].url.params
+        assert params["request"] == "GetCoverage"
+        assert params["coverage"] == "dtm_05m"
+        assert (params["width"], params["height"]) == (str(WIDTH), str(HEIGHT))
+
+
+SERVICE_EXCEPTION = b"""<?xml version="1.0" encoding="UTF-8"?>
+<ServiceExceptionReport version="1.2.0" xmlns="http://www.opengis.net/ogc">
+  <ServiceException code="InvalidParameterValue">
+    Coverage dtm_05m has no data in the requested area
+  </ServiceException>
+</ServiceExceptionReport>
+"""
+
+
+class TestGetCoverage:
+    """Test downloading a coverage into memory."""
+
+    async def test_returns_first_band(self, protocol, serve):
+        """Test that the streamed GeoTIFF is decoded into an array."""
+        serve(make_geotiff(grid()))
+        messages = []
+
+        data = await protocol.get_coverage(
+            BBOX, "dtm", resolution=1, progress_callback=lambda msg, pct: messages.append(msg)
+        )
+
+        np.testing.assert_array_equal(data, grid())
+        assert any(msg.startswith("Downloaded") and msg.endswith("MB") for msg in messages)
+
+    async def test_service_exception(self, protocol, serve):
+        """Test that the ServiceException text of an XML error is reported."""
+        serve(SERVICE_EXCEPTION, content_type="application/vnd.ogc.se_xml")
+
+        with pytest.raises(WCSError, match="has no data in the requested area"):
+            await protocol.get_coverage(BBOX, "dtm", resolution=1)
+
+    async def test_unparsable_xml_error(self, protocol, serve):
+        """Test that a malformed XML error still raises WCSError."""
+        serve(b"<ServiceExceptionReport>", content_type="text/xml")
+
+        with pytest.raises(WCSError, match="parse failed"):
+            await protocol.get_coverage(BBOX, "dtm", resolution=1)
+
+    async def test_http_error(self, protocol, serve):
+        """Test that HTTP errors are raised as WCSError."""
+        serve(b"", status_code=500)
+
+        with pytest.raises(WCSError, match="Failed to download coverage"):
+            await protocol.get_coverage(BBOX, "dtm", resolution=1)
+
+    async def test_rejects_other_crs(self, protocol, serve):
+        """Test that only the native CRS is accepted."""
+        requests = serve(make_geotiff(grid()))
+
+        with pytest.raises(ValueError, match="does not match native CRS"):
+            await protocol.get_coverage(BBOX, "dtm", resolution=1, crs="EPSG:4326")
+        assert requests == []
+
+
+class TestSaveCoverageAsGeoTIFF:
+    """Test writing a coverage to a GeoTIFF file."""
+
+    async def test_tiled_compressed_output(self, protocol, serve, tmp_path):
+        """Test that the saved file is tiled LZW with CRS and bbox transform."""
+        serve(make_geotiff(grid("int16"), crs="EPSG:4326"))
+        output = tmp_path / "out" / "dtm.tif"
+
+        result = await protocol.save_coverage_as_geotiff(BBOX, output, resolution=1)
+
+        assert result == output
+        with rasterio.open(output) as dataset:
+            np.testing.assert_array_equal(dataset.read(1), grid("int16"))
+            assert dataset.crs == "EPSG:28992"
+            assert dataset.transform == GRID_TRANSFORM
+            assert dataset.profile["tiled"]
+            assert dataset.block_shapes == [(512, 512)]
+            structure = dataset.tags(ns="IMAGE_STRUCTURE")
+            assert structure["COMPRESSION"] == "LZW"
+            assert structure["PREDICTOR"] == "2"
+
+    async def test_float_predictor(self, protocol, serve, tmp_path):
+        """Test that floating point rasters use the floating point predictor."""
+        serve(make_geotiff(grid("float32")))
+        output = tmp_path / "dtm.tif"
+
+        await protocol.save_coverage_as_geotiff(BBOX, output, resolution=1)
+
+        with rasterio.open(output) as dataset:
+            np.testing.assert_array_equal(dataset.read(1), grid("float32"))
+            assert dataset.tags(ns="IMAGE_STRUCTURE")["PREDICTOR"] == "3"
+
+    async def test_raw_passthrough(self, protocol, serve, tmp_path):
+        """Test that raw passthrough writes the server's bytes unchanged."""
+        content = make_geotiff(grid(), crs="EPSG:4326")
+        serve(content)
+        output = tmp_path / "dtm.tif"
+
+        await protocol.save_coverage_as_geotiff(BBOX, output, resolution=1, raw_passthrough=True)
+
+        assert output.read_bytes() == content
+
+    async def test_raw_passthrough_error_leaves_no_file(self, protocol, serve, tmp_path):
+        """Test that a service error during passthrough writes nothing."""
+        serve(SERVICE_EXCEPTION, content_type="application/vnd.ogc.se_xml")
+        output = tmp_path / "dtm.tif"
+
+        with pytest.raises(WCSError, match="has no data"):
+            await protocol.save_coverage_as_geotiff(
+                BBOX, output, resolution=1, raw_passthrough=True
+            )
+        assert not output.exists()
@@ -0,0 +1,212 @@
+"""Tests for the WMTS disk tile cache (mocked HTTP transport)."""
+
+import io
+import os
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from PIL import Image
+
+from giskit.core.recipe import Dataset, Location
+from giskit.protocols.wmts import WMTSProtocol, _read_cached_tile, _write_cached_tile
+from giskit.providers.wmts import WMTSProvider
+
+# Small area in RD New, a few tiles at zoom 12
+BBOX = (121000.0, 487000.0, 121300.0, 487300.0)
+ZOOM = 12
+
+
+def tile_bytes(color: tuple[int, int, int], fmt: str = "PNG") -> bytes:
+    """Encoded single-color 256x256 tile."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (256, 256), color).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def make_stale(path: Path, days: float) -> None:
+    """Set a file's modification time days into the past."""
+    old = time.time() - days * 24 * 3600
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Answer every tile request with content; returns the request log."""
+    requests: list[httpx.Request] = []
+
+    def install(content: bytes):
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=content)
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        return requests
+
+    return install
+
+
+@pytest.fixture
+def protocol(tmp_path: Path) -> WMTSProtocol:
+    return WMTSProtocol(
+        "https://example.com/wmts", layer="ortho", tile_format="png", cache_dir=tmp_path
+    )
+
+
+class TestTileCache:
+    """Test serving tiles from the disk cache."""
+
+    async def test_download_is_cached(self, protocol, serve):
+        """Test that a downloaded tile is stored and served from disk next time."""
+        requests = serve(tile_bytes((255, 0, 0)))
+
+        first = await protocol.download_tile(ZOOM, 10, 20)
+        second = await protocol.download_tile(ZOOM, 10, 20)
+
+        assert len(requests) == 1
+        assert protocol.get_tile_cache_path(ZOOM, 10, 20).exists()
+        assert first.getpixel((0, 0)) == second.getpixel((0, 0)) == (255, 0, 0)
+
+    async def test_cache_hit_skips_request(self, protocol, serve):
+        """Test that a cached tile is used instead of the server's copy."""
+        path = protocol.get_tile_cache_path(ZOOM, 10, 20)
+        _write_cached_tile(path, tile_bytes((0, 0, 255)))
+        requests = serve(tile_bytes((255, 0, 0)))
+
+        img = await protocol.download_tile(ZOOM, 10, 20)
+
+        assert requests == []
+        assert img.getpixel((0, 0)) == (0, 0, 255)
+
+    async def test_expired_tile_is_downloaded_again(self, protocol, serve):
+        """Test that tiles older than cache_days are refreshed."""
+        protocol.cache_days = 1
+        path = protocol.get_tile_cache_path(ZOOM, 10, 20)
+        _write_cached_tile(path, tile_bytes((0, 0, 255)))
+        make_stale(path, 2)
+        requests = serve(tile_bytes((255, 0, 0)))
+
+        img = await protocol.download_tile(ZOOM, 10, 20)
+
+        assert len(requests) == 1
+        assert img.getpixel((0, 0)) == (255, 0, 0)
+        assert time.time() - path.stat().st_mtime < 60
+
+    async def test_cache_days_none_never_expires(self, protocol, serve):
+        """Test that cache_days=None keeps tiles forever."""
+        protocol.cache_days = None
+        path = protocol.get_tile_cache_path(ZOOM, 10, 20)
+        _write_cached_tile(path, tile_bytes((0, 0, 255)))
+        make_stale(path, 10000)
+        requests = serve(tile_bytes((255, 0, 0)))
+
+        await protocol.download_tile(ZOOM, 10, 20)
+
+        assert requests == []
+
+    async def test_corrupt_tile_is_replaced(self, protocol, serve):
+        """Test that an unreadable cached tile is downloaded again."""
+        path = protocol.get_tile_cache_path(ZOOM, 10, 20)
+        _write_cached_tile(path, b"not an image")
+        content = tile_bytes((255, 0, 0))
+        requests = serve(content)
+
+        img = await protocol.download_tile(ZOOM, 10, 20)
+
+        assert len(requests) == 1
+        assert img.getpixel((0, 0)) == (255, 0, 0)
+        assert path.read_bytes() == content
+
+    async def test_no_cache_bypasses_disk(self, protocol, serve):
+        """Test that no_cache neither reads nor writes the disk cache."""
+        protocol.no_cache = True
+        requests = serve(tile_bytes((255, 0, 0)))
+
+        await protocol.download_tile(ZOOM, 10, 20)
+        await protocol.download_tile(ZOOM, 10, 20)
+
+        assert len(requests) == 2
+        assert not protocol.get_tile_cache_path(ZOOM, 10, 20).exists()
+
+
+class TestCachedTileFiles:
+    """Test reading and writing cache entries."""
+
+    def test_write_leaves_no_temporary_files(self, tmp_path):
+        """Test that the temporary file is renamed into place."""
+        path = tmp_path / "12" / "10" / "20.png"
+
+        _write_cached_tile(path, b"tile")
+
+        assert path.read_bytes() == b"tile"
+        assert [p.name for p in path.parent.iterdir()] == ["20.png"]
+
+    def test_failed_write_keeps_previous_tile(self, tmp_path, monkeypatch):
+        """Test that an interrupted write never exposes a partial tile."""
+        path = tmp_path / "20.png"
+        _write_cached_tile(path, b"old tile")
+
+        def fail(self, target):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "replace", fail)
+        with pytest.raises(OSError):
+            _write_cached_tile(path, b"new tile")
+
+        assert path.read_bytes() == b"old tile"
+
+    def test_read_missing(self, tmp_path):
+        """Test that a missing tile reads as a cache miss."""
+        assert _read_cached_tile(tmp_path / "missing.png", 30) is None
+
+
+class TestCacheOptions:
+    """Test per-download cache settings."""
+
+    async def test_get_coverage_overrides(self, protocol, serve):
+        """Test that get_coverage cache options override the protocol's."""
+        requests = serve(tile_bytes((255, 0, 0)))
+
+        await protocol.get_coverage(BBOX, "ortho", 1, crs="EPSG:28992", zoom=ZOOM)
+        tiles = len(requests)
+        await protocol.get_coverage(BBOX, "ortho", 1, crs="EPSG:28992", zoom=ZOOM)
+        assert len(requests) == tiles
+
+        await protocol.get_coverage(BBOX, "ortho", 1, crs="EPSG:28992", zoom=ZOOM, no_cache=True)
+        assert len(requests) == 2 * tiles
+
+        await protocol.get_coverage(BBOX, "ortho", 1, crs="EPSG:28992", zoom=ZOOM, cache_days=0)
+        assert len(requests) == 3 * tiles
+        assert protocol.no_cache is False
+        assert protocol.cache_days == 30
+
+    async def test_provider_download_dataset(self, tmp_path, serve):
+        """Test that download_dataset passes cache options to the protocol."""
+        requests = serve(tile_bytes((255, 0, 0), "JPEG"))
+        dataset = Dataset(provider="pdok-wmts", service="luchtfoto.actueel_25cm")
+        location = Location(type="bbox", value=list(BBOX))
+
+        async with WMTSProvider("pdok-wmts") as provider:
+            provider.protocols["luchtfoto.actueel_25cm"].cache_dir = tmp_path / "tiles"
+
+            async def download(**kwargs):
+                await provider.download_dataset(
+                    dataset, location, tmp_path / "out.png", zoom=ZOOM, **kwargs
+                )
+
+            await download()
+            tiles = len(requests)
+            await download()
+            assert len(requests) == tiles
+
+            await download(no_cache=True)
+            assert len(requests) == 2 * tiles
+
+            await download(cache_days=0)
+            assert len(requests) == 3 * tiles